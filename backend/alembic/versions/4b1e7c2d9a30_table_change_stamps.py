@@ -0,0 +1,37 @@
+"""table change stamps for HTTP validators
+
+Revision ID: 4b1e7c2d9a30
+Revises: de619f1ee059
+Create Date: 2026-10-18 11:00:00
+
+create_all로 이미 만들어진 테이블은 건너뛴다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b1e7c2d9a30'
+down_revision = 'de619f1ee059'
+branch_labels = None
+depends_on = None
+
+# app.db.stamps.STAMPED_TABLES
+STAMPED_TABLES = ('certification', 'careerpath', 'requirement')
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table('change_stamp'):
+        return
+
+    change_stamp = op.create_table(
+        'change_stamp',
+        sa.Column('table_name', sa.String(), primary_key=True),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.bulk_insert(change_stamp, [{'table_name': name, 'version': 1} for name in STAMPED_TABLES])
+
+
+def downgrade() -> None:
+    op.drop_table('change_stamp')
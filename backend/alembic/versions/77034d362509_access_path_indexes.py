@@ -0,0 +1,97 @@
+"""indexes matching the real access paths
+
+Revision ID: 77034d362509
+Revises: b15f23fa2d9d
+Create Date: 2026-10-18 09:20:00
+
+운영 중인 테이블을 잠그지 않도록 인덱스는 CREATE INDEX CONCURRENTLY로 만든다.
+이전 시도가 중간에 실패해 INVALID 상태로 남은 인덱스는 지우고 다시 만든다.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '77034d362509'
+down_revision = 'b15f23fa2d9d'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    # 카테고리 필터 + 목록 정렬, CertificationSimple 컬럼 포함 (활성 자격증만)
+    (
+        'ix_certification_category_listing',
+        'ON certification (category_main, coalesce(level_order, 0) DESC, name, id) '
+        'INCLUDE (code, category_sub, level, level_order) WHERE is_active = true',
+    ),
+    # 활성 커리어 검색/자동완성
+    (
+        'ix_careerpath_active_name',
+        'ON careerpath (name, id) WHERE is_active',
+    ),
+    # 외래 키 조인 (커리어 상세, 로드맵, 시험 일정)
+    ('ix_requirement_career_path_id', 'ON requirement (career_path_id)'),
+    ('ix_requirement_certification_id', 'ON requirement (certification_id)'),
+    ('ix_examschedule_certification_id', 'ON examschedule (certification_id)'),
+]
+
+# (테이블, 유니크 제약 이름) - 중복 행을 정리한 뒤 (user_id, certification_id) 유니크 인덱스를 제약으로 승격
+UNIQUE_PAIRS = [
+    ('user_certifications', 'uq_user_certifications_user_certification'),
+    ('user_goals', 'uq_user_goals_user_certification'),
+]
+
+
+def _drop_if_invalid(name: str) -> None:
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE c.relname = '{name}' AND NOT i.indisvalid
+            ) THEN
+                EXECUTE 'DROP INDEX {name}';
+            END IF;
+        END $$
+    """)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES:
+            _drop_if_invalid(name)
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+
+        for table, constraint in UNIQUE_PAIRS:
+            # 같은 사용자/자격증 쌍은 가장 먼저 등록된 행만 남김
+            op.execute(f"""
+                DELETE FROM {table} t
+                USING {table} d
+                WHERE t.user_id = d.user_id
+                  AND t.certification_id = d.certification_id
+                  AND t.id > d.id
+            """)
+            _drop_if_invalid(constraint)
+            op.execute(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {constraint} "
+                f"ON {table} (user_id, certification_id)"
+            )
+            op.execute(f"""
+                DO $$
+                BEGIN
+                    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{constraint}') THEN
+                        ALTER TABLE {table} ADD CONSTRAINT {constraint} UNIQUE USING INDEX {constraint};
+                    END IF;
+                END $$
+            """)
+
+        for table in ('certification', 'careerpath', 'user_certifications', 'user_goals',
+                      'requirement', 'examschedule'):
+            op.execute(f"ANALYZE {table}")
+
+
+def downgrade() -> None:
+    for table, constraint in UNIQUE_PAIRS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}")
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,137 @@
+"""initial schema
+
+Revision ID: b06612893d60
+Revises:
+Create Date: 2026-10-18 09:00:00
+
+create_all(start.sh 이전 방식)로 이미 테이블이 만들어진 DB에서는 아무것도 하지 않는다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b06612893d60'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table('certification'):
+        return
+
+    op.create_table(
+        'user',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('full_name', sa.String()),
+        sa.Column('is_active', sa.Boolean()),
+        sa.Column('is_superuser', sa.Boolean()),
+    )
+    op.create_index('ix_user_id', 'user', ['id'])
+    op.create_index('ix_user_email', 'user', ['email'], unique=True)
+    op.create_index('ix_user_full_name', 'user', ['full_name'])
+
+    op.create_table(
+        'certification',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('code', sa.String()),
+        sa.Column('issuer', sa.String()),
+        sa.Column('category_main', sa.String()),
+        sa.Column('category_sub', sa.String()),
+        sa.Column('level', sa.String()),
+        sa.Column('level_order', sa.Integer()),
+        sa.Column('fee_written', sa.Integer()),
+        sa.Column('fee_practical', sa.Integer()),
+        sa.Column('pass_rate', sa.String()),
+        sa.Column('description', sa.Text()),
+        sa.Column('eligibility', sa.Text()),
+        sa.Column('subjects', sa.Text()),
+        sa.Column('is_active', sa.Boolean()),
+    )
+    op.create_index('ix_certification_id', 'certification', ['id'])
+    op.create_index('ix_certification_name', 'certification', ['name'])
+    op.create_index('ix_certification_code', 'certification', ['code'], unique=True)
+    op.create_index('ix_certification_issuer', 'certification', ['issuer'])
+    op.create_index('ix_certification_category_main', 'certification', ['category_main'])
+    op.create_index('ix_certification_category_sub', 'certification', ['category_sub'])
+    op.create_index('ix_certification_level', 'certification', ['level'])
+
+    op.create_table(
+        'certification_prerequisites',
+        sa.Column('certification_id', sa.Integer(), sa.ForeignKey('certification.id'), primary_key=True),
+        sa.Column('prerequisite_id', sa.Integer(), sa.ForeignKey('certification.id'), primary_key=True),
+    )
+
+    op.create_table(
+        'examschedule',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('certification_id', sa.Integer(), sa.ForeignKey('certification.id')),
+        sa.Column('round_name', sa.String()),
+        sa.Column('application_start_date', sa.Date()),
+        sa.Column('application_end_date', sa.Date()),
+        sa.Column('exam_date', sa.Date()),
+        sa.Column('result_announcement_date', sa.Date()),
+    )
+    op.create_index('ix_examschedule_id', 'examschedule', ['id'])
+
+    op.create_table(
+        'careerpath',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('type', sa.String()),
+        sa.Column('category', sa.String()),
+        sa.Column('description', sa.Text()),
+        sa.Column('salary_range', sa.String()),
+        sa.Column('growth_potential', sa.String()),
+        sa.Column('is_active', sa.Boolean()),
+    )
+    op.create_index('ix_careerpath_id', 'careerpath', ['id'])
+    op.create_index('ix_careerpath_name', 'careerpath', ['name'])
+    op.create_index('ix_careerpath_type', 'careerpath', ['type'])
+    op.create_index('ix_careerpath_category', 'careerpath', ['category'])
+
+    op.create_table(
+        'requirement',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('career_path_id', sa.Integer(), sa.ForeignKey('careerpath.id')),
+        sa.Column('certification_id', sa.Integer(), sa.ForeignKey('certification.id'), nullable=True),
+        sa.Column('description', sa.Text()),
+        sa.Column('is_mandatory', sa.Boolean()),
+    )
+    op.create_index('ix_requirement_id', 'requirement', ['id'])
+
+    op.create_table(
+        'user_certifications',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('user.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('certification_id', sa.Integer(), sa.ForeignKey('certification.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('acquired_date', sa.Date()),
+        sa.Column('score', sa.Integer()),
+        sa.Column('certificate_number', sa.String()),
+    )
+    op.create_index('ix_user_certifications_id', 'user_certifications', ['id'])
+
+    op.create_table(
+        'user_goals',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('user.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('certification_id', sa.Integer(), sa.ForeignKey('certification.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('target_date', sa.Date()),
+        sa.Column('status', sa.String()),
+    )
+    op.create_index('ix_user_goals_id', 'user_goals', ['id'])
+
+
+def downgrade() -> None:
+    op.drop_table('user_goals')
+    op.drop_table('user_certifications')
+    op.drop_table('requirement')
+    op.drop_table('careerpath')
+    op.drop_table('examschedule')
+    op.drop_table('certification_prerequisites')
+    op.drop_table('certification')
+    op.drop_table('user')
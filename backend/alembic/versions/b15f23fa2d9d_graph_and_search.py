@@ -0,0 +1,149 @@
+"""tech-tree closure/layout tables and search columns
+
+Revision ID: b15f23fa2d9d
+Revises: b06612893d60
+Create Date: 2026-10-18 09:10:00
+
+create_all로 이미 만들어진 객체는 건너뛴다 (IF NOT EXISTS).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b15f23fa2d9d'
+down_revision = 'b06612893d60'
+branch_labels = None
+depends_on = None
+
+# 마이그레이션 작성 시점의 생성 컬럼 식 (SEARCH_TOKENIZER=ngram, SEARCH_TS_CONFIG=simple)
+# 앱 코드(app.db.search)가 바뀌어도 이 리비전의 결과는 바뀌지 않도록 그대로 적어 둔다.
+CERTIFICATION_DOCUMENT = (
+    "setweight(to_tsvector('simple'::regconfig, korean_ngrams(coalesce(name, ''))), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, korean_ngrams(coalesce(description, ''))), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, korean_ngrams(coalesce(eligibility, ''))), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, korean_ngrams(coalesce(subjects, ''))), 'C')"
+)
+CAREER_DOCUMENT = (
+    "setweight(to_tsvector('simple'::regconfig, korean_ngrams(coalesce(name, ''))), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, korean_ngrams(coalesce(category, ''))), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, korean_ngrams(coalesce(description, ''))), 'C')"
+)
+
+KOREAN_NGRAMS_DDL = """
+CREATE OR REPLACE FUNCTION korean_ngrams(input text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT coalesce(string_agg(substr(word, i, 2), ' '), '')
+    FROM regexp_split_to_table(lower(coalesce(input, '')), '[^[:alnum:]가-힣]+') AS word,
+         generate_series(1, greatest(length(word) - 1, 1)) AS i
+    WHERE word <> ''
+$$
+"""
+
+# 활성 자격증 사이의 전이 폐쇄 초기 데이터 (app.services.tree.MAX_TREE_DEPTH와 같은 깊이 제한)
+FILL_CLOSURE = """
+INSERT INTO certification_closure (ancestor_id, descendant_id, depth)
+WITH RECURSIVE walk(ancestor_id, descendant_id, depth) AS (
+    SELECT id, id, 0 FROM certification WHERE is_active
+    UNION
+    SELECT p.prerequisite_id, w.descendant_id, w.depth + 1
+    FROM walk w
+    JOIN certification_prerequisites p ON p.certification_id = w.ancestor_id
+    JOIN certification c ON c.id = p.prerequisite_id AND c.is_active
+    WHERE w.depth < 20
+)
+SELECT ancestor_id, descendant_id, min(depth) FROM walk GROUP BY ancestor_id, descendant_id
+ON CONFLICT DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(KOREAN_NGRAMS_DDL)
+
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('certification_closure'):
+        op.create_table(
+            'certification_closure',
+            sa.Column('ancestor_id', sa.Integer(), sa.ForeignKey('certification.id', ondelete='CASCADE'), primary_key=True),
+            sa.Column('descendant_id', sa.Integer(), sa.ForeignKey('certification.id', ondelete='CASCADE'), primary_key=True),
+            sa.Column('depth', sa.Integer(), nullable=False),
+        )
+        op.create_index(
+            'ix_certification_closure_descendant', 'certification_closure',
+            ['descendant_id', 'ancestor_id'],
+        )
+        op.execute(FILL_CLOSURE)
+
+    if not inspector.has_table('graph_layout'):
+        op.create_table(
+            'graph_layout',
+            sa.Column('certification_id', sa.Integer(), sa.ForeignKey('certification.id', ondelete='CASCADE'), primary_key=True),
+            sa.Column('category', sa.String(), primary_key=True),
+            sa.Column('x', sa.Integer(), nullable=False),
+            sa.Column('y', sa.Integer(), nullable=False),
+            sa.Column('layout_version', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('is_pinned', sa.Boolean(), server_default=sa.false()),
+        )
+
+    # 전문 검색
+    op.execute(
+        "ALTER TABLE certification ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({CERTIFICATION_DOCUMENT}) STORED"
+    )
+    op.execute(
+        "ALTER TABLE careerpath ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({CAREER_DOCUMENT}) STORED"
+    )
+    op.create_index(
+        'ix_certification_search_vector', 'certification', ['search_vector'],
+        postgresql_using='gin', if_not_exists=True,
+    )
+    op.create_index(
+        'ix_careerpath_search_vector', 'careerpath', ['search_vector'],
+        postgresql_using='gin', if_not_exists=True,
+    )
+
+    # 관리자 목록 부분 일치 검색 (trigram)
+    for name, table, column in (
+        ('ix_user_email_trgm', 'user', 'email'),
+        ('ix_user_full_name_trgm', 'user', 'full_name'),
+        ('ix_certification_name_trgm', 'certification', 'name'),
+        ('ix_certification_code_trgm', 'certification', 'code'),
+        ('ix_careerpath_name_trgm', 'careerpath', 'name'),
+    ):
+        op.create_index(
+            name, table, [column],
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+            if_not_exists=True,
+        )
+
+    # 커서 페이지네이션 정렬 순서
+    op.create_index(
+        'ix_certification_listing', 'certification',
+        [sa.text('coalesce(level_order, 0) DESC'), 'name', 'id'],
+        postgresql_where=sa.text('is_active = true'), if_not_exists=True,
+    )
+    op.create_index('ix_careerpath_listing', 'careerpath', ['name', 'id'], if_not_exists=True)
+    op.create_index(
+        'ix_careerpath_type_listing', 'careerpath', ['type', 'name', 'id'], if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_careerpath_type_listing', table_name='careerpath', if_exists=True)
+    op.drop_index('ix_careerpath_listing', table_name='careerpath', if_exists=True)
+    op.drop_index('ix_certification_listing', table_name='certification', if_exists=True)
+    for name, table in (
+        ('ix_careerpath_name_trgm', 'careerpath'),
+        ('ix_certification_code_trgm', 'certification'),
+        ('ix_certification_name_trgm', 'certification'),
+        ('ix_user_full_name_trgm', 'user'),
+        ('ix_user_email_trgm', 'user'),
+    ):
+        op.drop_index(name, table_name=table, if_exists=True)
+    op.execute("ALTER TABLE careerpath DROP COLUMN IF EXISTS search_vector")
+    op.execute("ALTER TABLE certification DROP COLUMN IF EXISTS search_vector")
+    op.execute("DROP TABLE IF EXISTS graph_layout")
+    op.execute("DROP TABLE IF EXISTS certification_closure")
+    op.execute("DROP FUNCTION IF EXISTS korean_ngrams(text)")
@@ -0,0 +1,65 @@
+"""certification facet counter table
+
+Revision ID: de619f1ee059
+Revises: 77034d362509
+Create Date: 2026-10-18 09:30:00
+
+create_all로 이미 만들어진 테이블은 건너뛴다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'de619f1ee059'
+down_revision = '77034d362509'
+branch_labels = None
+depends_on = None
+
+# 활성 자격증의 패싯 값별 개수 초기 데이터 (app.services.facets.FEE_BANDS와 같은 응시료 구간)
+FILL_FACETS = """
+INSERT INTO certification_facet (facet, value, parent, count)
+WITH source AS (
+    SELECT
+        coalesce(category_main, '') AS category_main,
+        coalesce(category_sub, '') AS category_sub,
+        coalesce(level, '') AS level,
+        coalesce(issuer, '') AS issuer,
+        CASE
+            WHEN fee_written IS NULL AND fee_practical IS NULL THEN ''
+            WHEN coalesce(fee_written, 0) + coalesce(fee_practical, 0) < 20000 THEN '0-20000'
+            WHEN coalesce(fee_written, 0) + coalesce(fee_practical, 0) < 50000 THEN '20000-50000'
+            WHEN coalesce(fee_written, 0) + coalesce(fee_practical, 0) < 100000 THEN '50000-100000'
+            ELSE '100000-'
+        END AS fee_band
+    FROM certification
+    WHERE is_active = true
+)
+SELECT 'category_main', category_main, '', count(*) FROM source GROUP BY category_main
+UNION ALL
+SELECT 'category_sub', category_sub, category_main, count(*) FROM source GROUP BY category_main, category_sub
+UNION ALL
+SELECT 'level', level, '', count(*) FROM source GROUP BY level
+UNION ALL
+SELECT 'issuer', issuer, '', count(*) FROM source GROUP BY issuer
+UNION ALL
+SELECT 'fee_band', fee_band, '', count(*) FROM source GROUP BY fee_band
+"""
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table('certification_facet'):
+        return
+
+    op.create_table(
+        'certification_facet',
+        sa.Column('facet', sa.String(), primary_key=True),
+        sa.Column('value', sa.String(), primary_key=True),
+        sa.Column('parent', sa.String(), primary_key=True),
+        sa.Column('count', sa.Integer(), nullable=False),
+    )
+    op.execute(FILL_FACETS)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS certification_facet")
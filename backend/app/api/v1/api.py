@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import certifications, careers, auth, admin, users
+from app.api.v1.endpoints import certifications, careers, auth, admin, users, roadmap, search
 
 api_router = APIRouter()
 
@@ -8,3 +8,5 @@ api_router.include_router(certifications.router, prefix="/certifications", tags=
 api_router.include_router(careers.router, prefix="/careers", tags=["커리어"])
 api_router.include_router(admin.router, prefix="/admin", tags=["관리자"])
 api_router.include_router(users.router, prefix="/users", tags=["사용자"])
+api_router.include_router(roadmap.router, prefix="/roadmap", tags=["로드맵"])
+api_router.include_router(search.router, prefix="/search", tags=["검색"])
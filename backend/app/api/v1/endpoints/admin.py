@@ -4,11 +4,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import func
 
+from app.db.counts import list_total
+from app.db.search import SearchMode, search_condition
 from app.db.session import get_db
 from app.models.user import User
 from app.models.certification import Certification
 from app.models.career import CareerPath
 from app.core.deps import get_current_superuser
+from app.core.pagination import Keyset
+from app.core.response_cache import response_cache
+from app.services import catalog, closure, facets
+from app.services.graph_layout import pin_position, unpin_position, recompute_layouts
 from app.schemas.user import (
     User as UserSchema,
     UserList,
@@ -19,6 +25,7 @@ from app.schemas.certification import (
     CertificationCreate,
     CertificationUpdate,
     CertificationSimple,
+    GraphLayoutPin,
 )
 from app.schemas.career import (
     Career as CareerSchema,
@@ -26,9 +33,19 @@ from app.schemas.career import (
     CareerUpdate,
     CareerSimple,
 )
+from app.schemas.cache import CacheStats
 
 router = APIRouter()
 
+# 관리자 목록은 최신순 (기본 키 인덱스 사용)
+USER_ORDER = Keyset((User.id, True))
+CERTIFICATION_ORDER = Keyset((Certification.id, True))
+CAREER_ORDER = Keyset((CareerPath.id, True))
+
+
+def _id_key(item) -> tuple:
+    return (item.id,)
+
 
 # ==================== 사용자 관리 ====================
 
@@ -36,12 +53,14 @@ router = APIRouter()
 async def list_users(
     page: int = Query(1, ge=1),
     limit: int = Query(15, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 값 (지정하면 page 무시)"),
     search: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_superuser)
 ) -> Any:
     """
     사용자 목록 조회 (관리자 전용)
+    검색어가 없으면 total은 통계 기반 추정치일 수 있다 (total_is_estimate).
     """
     query = select(User)
 
@@ -52,18 +71,22 @@ async def list_users(
         )
 
     # 전체 개수
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    total, total_is_estimate = await list_total(db, query, User.__table__.name, (search,))
 
-    # 페이지네이션
-    offset = (page - 1) * limit
-    query = query.order_by(User.id.desc()).offset(offset).limit(limit)
+    # 페이지네이션 (커서가 있으면 커서 기준, 없으면 page 번호 기준)
+    query = USER_ORDER.apply(query, cursor, limit)
+    if not cursor:
+        query = query.offset((page - 1) * limit)
 
     result = await db.execute(query)
-    users = result.scalars().all()
+    users, next_cursor = USER_ORDER.page(result.scalars().all(), limit, _id_key)
 
-    return UserList(items=users, total=total)
+    return UserList(
+        items=users,
+        total=total,
+        total_is_estimate=total_is_estimate,
+        next_cursor=next_cursor,
+    )
 
 
 @router.get("/users/{user_id}", response_model=UserSchema)
@@ -119,34 +142,47 @@ async def update_user(
 async def list_certifications_admin(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 값 (지정하면 page 무시)"),
     search: Optional[str] = None,
+    mode: SearchMode = SearchMode.contains,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_superuser)
 ) -> Any:
     """
     자격증 목록 조회 (관리자 전용 - 비활성 포함)
+    검색은 기본적으로 이름/코드 부분 일치이며, mode=fulltext면 전문 검색을 쓴다.
     """
     query = select(Certification)
 
     if search:
-        query = query.where(
-            (Certification.name.ilike(f"%{search}%")) |
-            (Certification.code.ilike(f"%{search}%"))
+        condition, _ = search_condition(
+            search, Certification.search_vector,
+            [Certification.name, Certification.code], mode
         )
+        if mode == SearchMode.fulltext:
+            # 전문 검색에서도 코드는 부분 일치로 찾음 (trigram 인덱스)
+            condition = condition | Certification.code.ilike(f"%{search.strip()}%")
+        query = query.where(condition)
 
     # 전체 개수
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    total, total_is_estimate = await list_total(
+        db, query, Certification.__table__.name, (search, search and mode.value)
+    )
 
-    # 페이지네이션
-    offset = (page - 1) * limit
-    query = query.order_by(Certification.id.desc()).offset(offset).limit(limit)
+    # 페이지네이션 (커서가 있으면 커서 기준, 없으면 page 번호 기준)
+    query = CERTIFICATION_ORDER.apply(query, cursor, limit)
+    if not cursor:
+        query = query.offset((page - 1) * limit)
 
     result = await db.execute(query)
-    items = result.scalars().all()
+    items, next_cursor = CERTIFICATION_ORDER.page(result.scalars().all(), limit, _id_key)
 
-    return {"items": items, "total": total}
+    return {
+        "items": items,
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+        "next_cursor": next_cursor,
+    }
 
 
 @router.post("/certifications/", response_model=CertificationSchema)
@@ -160,7 +196,11 @@ async def create_certification_admin(
     """
     certification = Certification(**certification_in.model_dump())
     db.add(certification)
+    await db.flush()
+    await closure.refresh_subtree(db, certification.id)
+    await facets.apply_change(db, [], facets.facet_keys(certification))
     await db.commit()
+    catalog.certification_changed(certification.id, [certification.category_main])
     await db.refresh(certification)
     return certification
 
@@ -175,8 +215,9 @@ async def update_certification_admin(
     """
     자격증 수정 (관리자 전용)
     """
+    # 변경 전 패싯 값을 읽는 동안 다른 수정이 끼어들지 않도록 행 잠금
     result = await db.execute(
-        select(Certification).where(Certification.id == certification_id)
+        select(Certification).where(Certification.id == certification_id).with_for_update()
     )
     cert = result.scalar_one_or_none()
 
@@ -184,10 +225,28 @@ async def update_certification_admin(
         raise HTTPException(status_code=404, detail="자격증을 찾을 수 없습니다")
 
     update_data = certification_in.model_dump(exclude_unset=True)
+    activation_changed = (
+        "is_active" in update_data and update_data["is_active"] != cert.is_active
+    )
+    facets_before = facets.facet_keys(cert)
+    category_before = cert.category_main
     for field, value in update_data.items():
         setattr(cert, field, value)
 
+    if activation_changed:
+        if cert.is_active:
+            # 비활성인 동안 추가된 선수 관계로 순환이 생겼으면 다시 활성화하지 않음
+            await closure.lock(db)
+            if await closure.on_cycle(db, cert.id):
+                raise HTTPException(
+                    status_code=409,
+                    detail="선수 관계가 순환되므로 다시 활성화할 수 없습니다"
+                )
+        await db.flush()
+        await closure.refresh_subtree(db, cert.id)
+    await facets.apply_change(db, facets_before, facets.facet_keys(cert))
     await db.commit()
+    catalog.certification_changed(cert.id, [category_before, cert.category_main])
     await db.refresh(cert)
     return cert
 
@@ -201,51 +260,128 @@ async def delete_certification_admin(
     """
     자격증 삭제 (관리자 전용)
     """
+    # 변경 전 패싯 값을 읽는 동안 다른 수정이 끼어들지 않도록 행 잠금
     result = await db.execute(
-        select(Certification).where(Certification.id == certification_id)
+        select(Certification).where(Certification.id == certification_id).with_for_update()
     )
     cert = result.scalar_one_or_none()
 
     if not cert:
         raise HTTPException(status_code=404, detail="자격증을 찾을 수 없습니다")
 
+    facets_before = facets.facet_keys(cert)
     cert.is_active = False
+    await db.flush()
+    await closure.refresh_subtree(db, cert.id)
+    await facets.apply_change(db, facets_before, [])
     await db.commit()
+    catalog.certification_changed(cert.id, [cert.category_main])
 
     return {"message": "자격증이 삭제되었습니다"}
 
 
+# ==================== 테크트리 레이아웃 ====================
+
+@router.put("/graph-layout/{certification_id}")
+async def pin_graph_layout(
+    certification_id: int,
+    pin_in: GraphLayoutPin,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_superuser)
+) -> Any:
+    """
+    노드 좌표 고정 (관리자 전용)
+    나머지 노드는 백그라운드에서 고정 좌표에 맞춰 다시 배치된다.
+    """
+    result = await db.execute(
+        select(Certification).where(
+            Certification.id == certification_id,
+            Certification.is_active == True
+        )
+    )
+    if not result.scalar_one_or_none():
+        raise HTTPException(status_code=404, detail="자격증을 찾을 수 없습니다")
+
+    await pin_position(db, certification_id, pin_in.category, pin_in.x, pin_in.y)
+    await db.commit()
+    catalog.layout_changed()
+
+    return {"message": "좌표가 고정되었습니다"}
+
+
+@router.delete("/graph-layout/{certification_id}")
+async def unpin_graph_layout(
+    certification_id: int,
+    category: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_superuser)
+) -> Any:
+    """
+    노드 좌표 고정 해제 (관리자 전용)
+    """
+    if not await unpin_position(db, certification_id, category):
+        raise HTTPException(status_code=404, detail="고정된 좌표가 없습니다")
+    await db.commit()
+    catalog.layout_changed()
+
+    return {"message": "좌표 고정이 해제되었습니다"}
+
+
+@router.post("/graph-layout/recompute")
+async def recompute_graph_layout(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_superuser)
+) -> Any:
+    """
+    테크트리 레이아웃 즉시 재계산 (관리자 전용)
+    """
+    layout_version = await recompute_layouts(db)
+    return {"layout_version": layout_version}
+
+
 # ==================== 커리어 관리 ====================
 
 @router.get("/careers/", response_model=dict)
 async def list_careers_admin(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 값 (지정하면 page 무시)"),
     search: Optional[str] = None,
+    mode: SearchMode = SearchMode.contains,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_superuser)
 ) -> Any:
     """
     커리어 목록 조회 (관리자 전용)
+    검색은 기본적으로 이름 부분 일치이며, mode=fulltext면 전문 검색을 쓴다.
     """
     query = select(CareerPath)
 
     if search:
-        query = query.where(CareerPath.name.ilike(f"%{search}%"))
+        condition, _ = search_condition(
+            search, CareerPath.search_vector, [CareerPath.name], mode
+        )
+        query = query.where(condition)
 
     # 전체 개수
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    total, total_is_estimate = await list_total(
+        db, query, CareerPath.__table__.name, (search, search and mode.value)
+    )
 
-    # 페이지네이션
-    offset = (page - 1) * limit
-    query = query.order_by(CareerPath.id.desc()).offset(offset).limit(limit)
+    # 페이지네이션 (커서가 있으면 커서 기준, 없으면 page 번호 기준)
+    query = CAREER_ORDER.apply(query, cursor, limit)
+    if not cursor:
+        query = query.offset((page - 1) * limit)
 
     result = await db.execute(query)
-    items = result.scalars().all()
+    items, next_cursor = CAREER_ORDER.page(result.scalars().all(), limit, _id_key)
 
-    return {"items": items, "total": total}
+    return {
+        "items": items,
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+        "next_cursor": next_cursor,
+    }
 
 
 @router.post("/careers/", response_model=CareerSchema)
@@ -260,6 +396,7 @@ async def create_career_admin(
     career = CareerPath(**career_in.model_dump())
     db.add(career)
     await db.commit()
+    catalog.career_changed(career.id)
     await db.refresh(career)
     return career
 
@@ -287,6 +424,7 @@ async def update_career_admin(
         setattr(career, field, value)
 
     await db.commit()
+    catalog.career_changed(career_id)
     await db.refresh(career)
     return career
 
@@ -310,6 +448,7 @@ async def delete_career_admin(
 
     await db.delete(career)
     await db.commit()
+    catalog.career_changed(career_id)
 
     return {"message": "커리어가 삭제되었습니다"}
 
@@ -335,3 +474,25 @@ async def get_stats(
         "total_certifications": certs_count.scalar() or 0,
         "total_careers": careers_count.scalar() or 0,
     }
+
+
+@router.get("/cache/stats", response_model=CacheStats)
+async def get_cache_stats(
+    current_user: User = Depends(get_current_superuser)
+) -> Any:
+    """
+    응답 캐시 라우트별 적중/미스/밀려남 통계 (관리자 전용, 요청을 받은 워커 기준)
+    """
+    routes = []
+    for route, stats in sorted(response_cache.stats.items()):
+        lookups = stats.l1_hits + stats.l2_hits + stats.misses
+        routes.append({
+            "route": route,
+            **vars(stats),
+            "hit_ratio": (stats.l1_hits + stats.l2_hits) / lookups if lookups else 0.0,
+        })
+    return {
+        "redis_enabled": response_cache.redis_enabled,
+        "l1_entries": len(response_cache.local),
+        "routes": routes,
+    }
@@ -1,15 +1,30 @@
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from app.db.search import SearchMode, search_condition
 from app.db.session import get_db
 from app.models.career import CareerPath, Requirement
 from app.models.user import User
+from app.core.batch import (
+    MAX_BATCH_IDS,
+    cache_details,
+    cached_details,
+    in_request_order,
+    parse_ids,
+)
 from app.core.deps import get_current_superuser
+from app.core.fields import select_fields
+from app.core.http_cache import cache_control
+from app.core.pagination import NEXT_CURSOR_HEADER, Keyset
+from app.core.response_cache import response_cache
+from app.core.serialization import fast_json
+from app.services import catalog
 from app.schemas.career import (
     Career as CareerSchema,
+    CareerBatch,
     CareerCreate,
     CareerUpdate,
     CareerSimple,
@@ -20,70 +35,182 @@ from app.schemas.career import (
 
 router = APIRouter()
 
+# 공개 조회 HTTP 캐시 (초)
+CATALOG_MAX_AGE = 60
+CATALOG_STALE_WHILE_REVALIDATE = 300
+CAREER_TABLES = ("careerpath",)
+# 상세에는 요구사항과 자격증 이름이 포함됨
+CAREER_DETAIL_TABLES = ("careerpath", "requirement", "certification")
+
+# 상세 조회 응답 캐시 라우트 (일괄 조회도 같은 항목을 읽고 채움)
+DETAIL_ROUTE = "careers.detail"
+
+# 목록 정렬 순서 (ix_careerpath_listing / ix_careerpath_type_listing 인덱스와 일치)
+CAREER_ORDER = Keyset(
+    (CareerPath.name, False),
+    (CareerPath.id, False),
+)
+
+
+def _career_key(career: CareerPath):
+    return (career.name, career.id)
+
+
+def _detail_tags(params: dict, content: Any) -> List[str]:
+    # 요구사항에 자격증 이름이 들어가므로 해당 자격증이 바뀌어도 지움
+    return [
+        catalog.career_tag(params["career_id"]),
+        *(
+            catalog.certification_tag(requirement.certification_id)
+            for requirement in content.requirements
+            if requirement.certification_id is not None
+        ),
+    ]
+
 
 @router.get("/", response_model=List[CareerSimple])
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE, tables=CAREER_TABLES)
+@response_cache.cached(
+    "careers.list", List[CareerSimple], lambda params, content: [catalog.TAG_CAREERS]
+)
 async def list_careers(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True, description="cursor를 사용하세요"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
     type: Optional[CareerType] = Query(None, description="유형 필터 (job/startup)"),
     category: Optional[str] = Query(None, description="분야 필터"),
     search: Optional[str] = Query(None, description="검색어"),
+    mode: SearchMode = Query(SearchMode.fulltext, description="검색 방식"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: id,name)"),
     db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
-    커리어 목록 조회
+    커리어 목록 조회 (전문 검색 시 관련도 순)
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 돌려준다.
+    fields를 지정하면 해당 컬럼만 조회/응답한다.
     """
+    selection = select_fields(CareerSimple, fields)
     query = select(CareerPath)
+    if selection:
+        query = query.options(*selection.options(CareerPath, "name"))
 
     if type:
         query = query.where(CareerPath.type == type.value)
     if category:
         query = query.where(CareerPath.category == category)
+    rank = None
     if search:
-        query = query.where(CareerPath.name.ilike(f"%{search}%"))
+        condition, rank = search_condition(
+            search, CareerPath.search_vector, [CareerPath.name], mode
+        )
+        query = query.where(condition)
 
-    query = query.order_by(CareerPath.name)
-    query = query.offset(skip).limit(limit)
+    if rank is not None:
+        keyset = Keyset((rank, True), *CAREER_ORDER.keys)
+        query = query.add_columns(rank.label("rank"))
+    else:
+        keyset = CAREER_ORDER
+    query = keyset.apply(query, cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
 
     result = await db.execute(query)
-    return result.scalars().all()
+    if rank is not None:
+        rows, next_cursor = keyset.page(
+            result.all(), limit, lambda row: (row.rank, *_career_key(row[0]))
+        )
+        items = [row[0] for row in rows]
+    else:
+        items, next_cursor = keyset.page(result.scalars().all(), limit, _career_key)
+
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    if selection:
+        return selection.response(items, headers)
+    response.headers.update(headers)
+    return items
 
 
 @router.get("/jobs", response_model=List[CareerSimple])
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE, tables=CAREER_TABLES)
+@fast_json(List[CareerSimple])
 async def list_jobs(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True, description="cursor를 사용하세요"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
     db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     직업 목록 조회
     """
-    query = select(CareerPath).where(
-        CareerPath.type == "job"
-    ).order_by(CareerPath.name).offset(skip).limit(limit)
+    query = select(CareerPath).where(CareerPath.type == "job")
+    query = CAREER_ORDER.apply(query, cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
 
     result = await db.execute(query)
-    return result.scalars().all()
+    items, next_cursor = CAREER_ORDER.page(result.scalars().all(), limit, _career_key)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return items
 
 
 @router.get("/startups", response_model=List[CareerSimple])
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE, tables=CAREER_TABLES)
+@fast_json(List[CareerSimple])
 async def list_startups(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True, description="cursor를 사용하세요"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
     db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     창업 목록 조회
     """
-    query = select(CareerPath).where(
-        CareerPath.type == "startup"
-    ).order_by(CareerPath.name).offset(skip).limit(limit)
+    query = select(CareerPath).where(CareerPath.type == "startup")
+    query = CAREER_ORDER.apply(query, cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
 
     result = await db.execute(query)
-    return result.scalars().all()
+    items, next_cursor = CAREER_ORDER.page(result.scalars().all(), limit, _career_key)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return items
+
+
+@router.get("/batch", response_model=CareerBatch)
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE, tables=CAREER_DETAIL_TABLES)
+@fast_json(CareerBatch)
+async def get_careers_batch(
+    ids: str = Query(..., description=f"쉼표로 구분한 커리어 ID (최대 {MAX_BATCH_IDS}개)"),
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    여러 커리어 상세를 한 번에 조회 (요청 순서 유지, 없는 ID는 missing)
+    상세 조회 응답 캐시에 있는 커리어는 DB에서 읽지 않고, 새로 읽은 커리어는 캐시에 채운다.
+    """
+    career_ids = parse_ids(ids)
+    cached, misses = await cached_details(DETAIL_ROUTE, "career_id", career_ids)
+    rows = []
+    if misses:
+        query = select(CareerPath).options(
+            selectinload(CareerPath.requirements).selectinload(Requirement.certification)
+        ).where(CareerPath.id.in_(misses))
+
+        result = await db.execute(query)
+        rows = result.scalars().all()
+        await cache_details(DETAIL_ROUTE, "career_id", rows, CareerSchema, _detail_tags)
+
+    items, missing = in_request_order(career_ids, [*cached, *rows])
+    return {"items": items, "missing": missing}
 
 
 @router.get("/{career_id}", response_model=CareerSchema)
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE, tables=CAREER_DETAIL_TABLES)
+@response_cache.cached(DETAIL_ROUTE, CareerSchema, _detail_tags)
 async def get_career(
     career_id: int,
     db: AsyncSession = Depends(get_db)
@@ -116,6 +243,7 @@ async def create_career(
     career = CareerPath(**career_in.model_dump())
     db.add(career)
     await db.commit()
+    catalog.career_changed(career.id)
     await db.refresh(career)
     return career
 
@@ -143,6 +271,7 @@ async def update_career(
         setattr(career, field, value)
 
     await db.commit()
+    catalog.career_changed(career_id)
     await db.refresh(career)
     return career
 
@@ -166,6 +295,7 @@ async def delete_career(
 
     await db.delete(career)
     await db.commit()
+    catalog.career_changed(career_id)
 
     return {"message": "커리어가 삭제되었습니다"}
 
@@ -196,6 +326,7 @@ async def add_requirement(
     )
     db.add(requirement)
     await db.commit()
+    catalog.requirement_changed(career_id)
     await db.refresh(requirement)
 
     return requirement
@@ -224,5 +355,6 @@ async def remove_requirement(
 
     await db.delete(requirement)
     await db.commit()
+    catalog.requirement_changed(career_id)
 
     return {"message": "요구사항이 삭제되었습니다"}
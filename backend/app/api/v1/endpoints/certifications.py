@@ -1,80 +1,178 @@
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
-from sqlalchemy import func
+from sqlalchemy import and_, func, literal, or_, union_all
 
+from app.db.search import SearchMode, search_condition
 from app.db.session import get_db
-from app.models.certification import Certification
-from app.models.user import User
-from app.core.deps import get_current_superuser
+from app.models.certification import Certification, CertificationFacet, certification_prerequisites
+from app.models.user import User, UserCertification, UserGoal
+from app.core.batch import (
+    MAX_BATCH_IDS,
+    cache_details,
+    cached_details,
+    in_request_order,
+    parse_ids,
+)
+from app.core.deps import get_current_user, get_current_superuser
+from app.core.fields import select_fields
+from app.core.http_cache import cache_control
+from app.core.pagination import NEXT_CURSOR_HEADER, Keyset
+from app.core.payload import not_modified_response, payload_response
+from app.core.response_cache import response_cache
+from app.core.serialization import fast_json
+from app.core.singleflight import coalesce
+from app.services import catalog, closure, facets
+from app.services.graph import STATUS_ACQUIRED, STATUS_GOAL, graph_store
+from app.services.suggest import DEFAULT_SUGGEST_LIMIT, suggest_store
+from app.services.tree import MAX_TREE_DEPTH
 from app.schemas.certification import (
     Certification as CertificationSchema,
     CertificationCreate,
     CertificationUpdate,
     CertificationSimple,
+    CertificationBatch,
     GraphData,
-    GraphNode,
-    GraphEdge,
+    GraphVersion,
+    TopologicalOrder,
+    CertificationTree,
+    CertificationTreeNode,
+    CertificationTreeEdge,
+    TreeDirection,
     CategoryTree,
     CategoryCount,
+    CertificationFacets,
 )
+from app.schemas.search import SuggestItem
 
 router = APIRouter()
 
-# 레벨별 Y 위치 (테크트리 레이아웃)
-LEVEL_Y_POSITIONS = {
-    "기술사": 0,
-    "기사": 150,
-    "산업기사": 300,
-    "기능사": 450,
-}
+# 부분 그래프 조회 시 허용하는 최대 이웃 단계
+MAX_NEIGHBORHOOD_HOPS = 5
+
+# 공개 조회 HTTP 캐시 (초)
+CATALOG_MAX_AGE = 60
+CATALOG_STALE_WHILE_REVALIDATE = 300
+CERTIFICATION_TABLES = ("certification",)
+
+# expand=로만 불러오는 상세 조회 관계
+CERTIFICATION_RELATIONS = ("prerequisites", "required_for")
+
+# 상세 조회 응답 캐시 라우트 (일괄 조회도 같은 항목을 읽고 채움)
+DETAIL_ROUTE = "certifications.detail"
+
+# 목록 정렬 순서 (ix_certification_listing 인덱스와 일치)
+CERTIFICATION_ORDER = Keyset(
+    (func.coalesce(Certification.level_order, 0), True),
+    (Certification.name, False),
+    (Certification.id, False),
+)
+
+
+def _certification_key(cert: Certification):
+    return (cert.level_order or 0, cert.name, cert.id)
+
+
+def _list_tags(params: dict, content: Any) -> List[str]:
+    category = params.get("category")
+    return [catalog.category_tag(category)] if category else [catalog.TAG_CERTIFICATIONS]
+
+
+def _detail_tags(params: dict, content: Any) -> List[str]:
+    tags = [catalog.certification_tag(params["certification_id"])]
+    if content is None:
+        # fields/expand 응답은 어떤 관계가 들어 있는지 알 수 없으므로 자격증이 바뀌면 함께 지움
+        tags.append(catalog.TAG_CERTIFICATIONS)
+    else:
+        related = [*content.prerequisites, *content.required_for]
+        tags.extend(catalog.certification_tag(cert.id) for cert in related)
+    return tags
 
 
 @router.get("/", response_model=List[CertificationSimple])
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE, tables=CERTIFICATION_TABLES)
+@response_cache.cached("certifications.list", List[CertificationSimple], _list_tags)
 async def list_certifications(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True, description="cursor를 사용하세요"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     level: Optional[str] = Query(None, description="레벨 필터"),
     search: Optional[str] = Query(None, description="검색어"),
+    mode: SearchMode = Query(SearchMode.fulltext, description="검색 방식"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: id,name)"),
     db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
-    자격증 목록 조회
+    자격증 목록 조회 (전문 검색 시 관련도 순)
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 돌려준다.
+    fields를 지정하면 해당 컬럼만 조회/응답한다.
     """
+    selection = select_fields(CertificationSimple, fields)
     query = select(Certification).where(Certification.is_active == True)
+    if selection:
+        # 커서 계산에 쓰는 정렬 컬럼은 항상 읽는다
+        query = query.options(*selection.options(Certification, "level_order", "name"))
 
     if category:
         query = query.where(Certification.category_main == category)
     if level:
         query = query.where(Certification.level == level)
+    rank = None
     if search:
-        query = query.where(Certification.name.ilike(f"%{search}%"))
-
-    query = query.order_by(Certification.level_order.desc(), Certification.name)
-    query = query.offset(skip).limit(limit)
+        condition, rank = search_condition(
+            search, Certification.search_vector, [Certification.name], mode
+        )
+        query = query.where(condition)
+
+    if rank is not None:
+        keyset = Keyset((rank, True), *CERTIFICATION_ORDER.keys)
+        query = query.add_columns(rank.label("rank"))
+    else:
+        keyset = CERTIFICATION_ORDER
+    query = keyset.apply(query, cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
 
     result = await db.execute(query)
-    return result.scalars().all()
+    if rank is not None:
+        rows, next_cursor = keyset.page(
+            result.all(), limit, lambda row: (row.rank, *_certification_key(row[0]))
+        )
+        items = [row[0] for row in rows]
+    else:
+        items, next_cursor = keyset.page(result.scalars().all(), limit, _certification_key)
+
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    if selection:
+        return selection.response(items, headers)
+    response.headers.update(headers)
+    return items
 
 
 @router.get("/categories", response_model=List[CategoryTree])
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE, tables=CERTIFICATION_TABLES)
+@coalesce("certifications.categories")
+@response_cache.cached(
+    "certifications.categories", List[CategoryTree], lambda params, content: [catalog.TAG_CATEGORIES]
+)
 async def get_categories(db: AsyncSession = Depends(get_db)) -> Any:
     """
-    카테고리 트리 조회
+    카테고리 트리 조회 (패싯 카운터 테이블에서 읽음)
     """
-    # 대분류별 중분류 개수 집계
     query = select(
-        Certification.category_main,
-        Certification.category_sub,
-        func.count(Certification.id).label("count")
+        CertificationFacet.parent,
+        CertificationFacet.value,
+        CertificationFacet.count,
     ).where(
-        Certification.is_active == True
-    ).group_by(
-        Certification.category_main,
-        Certification.category_sub
+        CertificationFacet.facet == facets.FACET_CATEGORY_SUB,
+        CertificationFacet.count > 0
+    ).order_by(
+        CertificationFacet.parent,
+        CertificationFacet.value
     )
 
     result = await db.execute(query)
@@ -83,8 +181,8 @@ async def get_categories(db: AsyncSession = Depends(get_db)) -> Any:
     # 트리 구조로 변환
     category_map = {}
     for row in rows:
-        main = row.category_main or "기타"
-        sub = row.category_sub or "기타"
+        main = row.parent or "기타"
+        sub = row.value or "기타"
         count = row.count
 
         if main not in category_map:
@@ -99,97 +197,257 @@ async def get_categories(db: AsyncSession = Depends(get_db)) -> Any:
     ]
 
 
+def _facet_values(counts: dict, facet: str, parent: str = "", order=None) -> List[dict]:
+    values = [
+        {"value": value or None, "count": count}
+        for (name, value, value_parent), count in counts.items()
+        if name == facet and value_parent == parent and count > 0
+    ]
+    if order is None:
+        values.sort(key=lambda item: (-item["count"], item["value"] is None, item["value"] or ""))
+    else:
+        rank = {value: index for index, value in enumerate(order)}
+        values.sort(key=lambda item: rank.get(item["value"], len(rank)))
+    return values
+
+
+@router.get("/facets", response_model=CertificationFacets)
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE, tables=CERTIFICATION_TABLES)
+async def get_facets(
+    category: Optional[str] = Query(None, description="대분류 필터"),
+    category_sub: Optional[str] = Query(None, description="중분류 필터"),
+    level: Optional[str] = Query(None, description="레벨 필터"),
+    issuer: Optional[str] = Query(None, description="시행 기관 필터"),
+    fee_band: Optional[str] = Query(
+        None, description=f"응시료 구간 필터 ({', '.join(facets.FEE_BAND_LABELS)})"
+    ),
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    현재 필터 조건에서의 패싯(대분류/중분류/등급/시행 기관/응시료 구간) 값별 자격증 수
+    필터가 없으면 카운터 테이블만 읽고, 있으면 조건에 맞는 자격증을 한 번에 집계한다.
+    """
+    conditions = []
+    if category:
+        conditions.append(Certification.category_main == category)
+    if category_sub:
+        conditions.append(Certification.category_sub == category_sub)
+    if level:
+        conditions.append(Certification.level == level)
+    if issuer:
+        conditions.append(Certification.issuer == issuer)
+    if fee_band:
+        if fee_band not in facets.FEE_BAND_LABELS:
+            raise HTTPException(status_code=400, detail="알 수 없는 응시료 구간입니다")
+        conditions.append(facets.fee_band_expression() == fee_band)
+
+    if conditions:
+        counts = await facets.aggregate(db, conditions)
+    else:
+        counts = await facets.stored_counts(db)
+
+    categories = _facet_values(counts, facets.FACET_CATEGORY_MAIN)
+    for item in categories:
+        item["subs"] = _facet_values(counts, facets.FACET_CATEGORY_SUB, item["value"] or "")
+    return {
+        "total": sum(item["count"] for item in categories),
+        "categories": categories,
+        "levels": _facet_values(counts, facets.FACET_LEVEL),
+        "issuers": _facet_values(counts, facets.FACET_ISSUER),
+        "fee_bands": _facet_values(counts, facets.FACET_FEE_BAND, order=facets.FEE_BAND_LABELS),
+    }
+
+
+@router.get("/suggest", response_model=List[SuggestItem])
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE)
+async def suggest(
+    q: str = Query(..., min_length=1, description="입력 중인 검색어 (초성 가능)"),
+    limit: int = Query(DEFAULT_SUGGEST_LIMIT, ge=1, le=50),
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    자격증/커리어 이름 자동완성
+    메모리 인덱스에서 응답하며, 인덱스가 최신이면 DB를 조회하지 않는다.
+    """
+    index = await suggest_store.get(db)
+    return index.search(q, limit)
+
+
 @router.get("/graph", response_model=GraphData)
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE)
+@coalesce("certifications.graph", vary=("accept-encoding", "if-none-match"))
 async def get_certification_graph(
+    request: Request,
     category: Optional[str] = Query(None, description="카테고리 필터"),
     db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     React Flow용 테크트리 그래프 데이터
+
+    미리 인코딩해 둔 본문을 그대로 보내며, If-None-Match가 일치하면 본문을 만들기 전에 304로 응답한다.
     """
-    query = select(Certification).options(
-        selectinload(Certification.prerequisites)
-    ).where(Certification.is_active == True)
+    snapshot = await graph_store.get(db)
+    headers = {"X-Graph-Version": str(snapshot.version)}
+    tag = snapshot.payload_tag(category)
+    if tag is not None:
+        not_modified = not_modified_response(request, tag, headers=headers)
+        if not_modified is not None:
+            return not_modified
+    payload = await snapshot.payload(category)
+    return payload_response(request, payload, headers=headers)
+
+
+@router.get("/graph/me", response_model=GraphData)
+@cache_control(private=True)
+async def get_my_certification_graph(
+    category: Optional[str] = Query(None, description="카테고리 필터"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user)
+) -> Any:
+    """
+    사용자 상태(취득/목표/응시 가능/잠김)가 표시된 테크트리 그래프
 
-    if category:
-        query = query.where(Certification.category_main == category)
+    그래프 자체는 스냅샷에서 가져오고, 사용자 본인의 취득/목표 자격증만 조회한다.
+    """
+    snapshot = await graph_store.get(db)
+
+    acquired = set()
+    goals = set()
+    if current_user:
+        query = union_all(
+            select(
+                UserCertification.certification_id,
+                literal(STATUS_ACQUIRED).label("kind"),
+            ).where(UserCertification.user_id == current_user.id),
+            select(
+                UserGoal.certification_id,
+                literal(STATUS_GOAL).label("kind"),
+            ).where(UserGoal.user_id == current_user.id),
+        )
+        for certification_id, kind in (await db.execute(query)).all():
+            (acquired if kind == STATUS_ACQUIRED else goals).add(certification_id)
+
+    return await snapshot.personalized_graph(category, acquired, goals)
+
+
+@router.get("/graph/neighborhood", response_model=GraphData)
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE)
+async def get_certification_neighborhood(
+    focus: int = Query(..., description="기준 자격증 ID"),
+    hops: int = Query(1, ge=1, le=MAX_NEIGHBORHOOD_HOPS, description="탐색 단계 수"),
+    category: Optional[str] = Query(None, description="카테고리 필터"),
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    기준 자격증 주변 k단계 이웃만 담은 부분 그래프
+    """
+    snapshot = await graph_store.get(db)
+    if focus not in snapshot.nodes or (
+        category is not None and snapshot.nodes[focus].category_main != category
+    ):
+        raise HTTPException(status_code=404, detail="자격증을 찾을 수 없습니다")
+
+    return await snapshot.subgraph(snapshot.neighborhood(focus, hops, category), category)
+
+
+@router.get("/graph/viewport", response_model=GraphData)
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE)
+async def get_certification_viewport(
+    x_min: float = Query(..., description="뷰포트 왼쪽 X"),
+    y_min: float = Query(..., description="뷰포트 위쪽 Y"),
+    x_max: float = Query(..., description="뷰포트 오른쪽 X"),
+    y_max: float = Query(..., description="뷰포트 아래쪽 Y"),
+    category: Optional[str] = Query(None, description="카테고리 필터"),
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    레이아웃 좌표가 뷰포트 안에 있는 노드만 담은 부분 그래프
+    """
+    if x_min > x_max or y_min > y_max:
+        raise HTTPException(status_code=400, detail="뷰포트 범위가 올바르지 않습니다")
+
+    snapshot = await graph_store.get(db)
+    ids = await snapshot.in_viewport(category, x_min, y_min, x_max, y_max)
+    return await snapshot.subgraph(ids, category)
+
+
+@router.get("/graph/order", response_model=TopologicalOrder)
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE)
+async def get_certification_order(db: AsyncSession = Depends(get_db)) -> Any:
+    """
+    선수 자격증이 항상 먼저 오는 위상 순서
+    """
+    snapshot = await graph_store.get(db)
+    return TopologicalOrder(version=snapshot.version, order=snapshot.topo.order())
+
+
+@router.get("/graph/version", response_model=GraphVersion)
+async def get_certification_graph_version(db: AsyncSession = Depends(get_db)) -> Any:
+    """
+    테크트리 스냅샷 버전 조회
+    """
+    snapshot = await graph_store.get(db)
+    return GraphVersion(
+        version=snapshot.version,
+        built_at=snapshot.built_at,
+        nodes=len(snapshot.nodes),
+        edges=snapshot.edge_count,
+    )
 
-    result = await db.execute(query)
-    certs = result.scalars().all()
-
-    nodes = []
-    edges = []
-
-    # 레벨별로 그룹핑하여 X 위치 계산
-    level_groups = {}
-    for cert in certs:
-        level = cert.level or "기타"
-        if level not in level_groups:
-            level_groups[level] = []
-        level_groups[level].append(cert)
-
-    # 노드 생성
-    for cert in certs:
-        level = cert.level or "기타"
-        level_certs = level_groups.get(level, [])
-        x_index = level_certs.index(cert) if cert in level_certs else 0
-
-        # 레벨별 색상
-        level_colors = {
-            "기술사": {"background": "#fef3c7", "border": "#f59e0b"},
-            "기사": {"background": "#dbeafe", "border": "#3b82f6"},
-            "산업기사": {"background": "#dcfce7", "border": "#22c55e"},
-            "기능사": {"background": "#f3e8ff", "border": "#a855f7"},
-        }
-        colors = level_colors.get(level, {"background": "#f3f4f6", "border": "#9ca3af"})
-
-        nodes.append(GraphNode(
-            id=str(cert.id),
-            data={
-                "label": cert.name,
-                "level": level,
-                "category": cert.category_main,
-                "issuer": cert.issuer,
-            },
-            position={
-                "x": x_index * 220,
-                "y": LEVEL_Y_POSITIONS.get(level, 600)
-            },
-            type="default",
-            style={
-                "background": colors["background"],
-                "border": f"2px solid {colors['border']}",
-                "borderRadius": "8px",
-                "padding": "10px",
-                "width": 180,
-            }
-        ))
-
-        # 엣지 생성
-        for prereq in cert.prerequisites:
-            edges.append(GraphEdge(
-                id=f"e{prereq.id}-{cert.id}",
-                source=str(prereq.id),
-                target=str(cert.id),
-                type="smoothstep",
-                animated=False,
-            ))
-
-    return GraphData(nodes=nodes, edges=edges)
+
+@router.get("/batch", response_model=CertificationBatch)
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE, tables=CERTIFICATION_TABLES)
+@fast_json(CertificationBatch)
+async def get_certifications_batch(
+    ids: str = Query(..., description=f"쉼표로 구분한 자격증 ID (최대 {MAX_BATCH_IDS}개)"),
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    여러 자격증 상세를 한 번에 조회 (요청 순서 유지, 없는 ID는 missing)
+    상세 조회 응답 캐시에 있는 자격증은 DB에서 읽지 않고, 새로 읽은 자격증은 캐시에 채운다.
+    """
+    certification_ids = parse_ids(ids)
+    cached, misses = await cached_details(DETAIL_ROUTE, "certification_id", certification_ids)
+    rows = []
+    if misses:
+        query = select(Certification).options(
+            selectinload(Certification.prerequisites),
+            selectinload(Certification.required_for)
+        ).where(Certification.id.in_(misses))
+
+        result = await db.execute(query)
+        rows = result.scalars().all()
+        await cache_details(DETAIL_ROUTE, "certification_id", rows, CertificationSchema, _detail_tags)
+
+    items, missing = in_request_order(certification_ids, [*cached, *rows])
+    return {"items": items, "missing": missing}
 
 
 @router.get("/{certification_id}", response_model=CertificationSchema)
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE, tables=CERTIFICATION_TABLES)
+@response_cache.cached(DETAIL_ROUTE, CertificationSchema, _detail_tags)
 async def get_certification(
     certification_id: int,
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: id,name,level)"),
+    expand: Optional[str] = Query(
+        None, description="함께 불러올 관계 (prerequisites,required_for)"
+    ),
     db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     자격증 상세 조회
+    fields/expand를 모두 생략하면 선수/후속 자격증을 포함한 전체 정보를 돌려주고,
+    하나라도 지정하면 요청한 컬럼과 관계만 조회/응답한다.
     """
-    query = select(Certification).options(
-        selectinload(Certification.prerequisites),
-        selectinload(Certification.required_for)
-    ).where(Certification.id == certification_id)
+    selection = select_fields(CertificationSchema, fields, expand, CERTIFICATION_RELATIONS)
+    if selection:
+        options = selection.options(Certification)
+    else:
+        options = [
+            selectinload(Certification.prerequisites),
+            selectinload(Certification.required_for)
+        ]
+    query = select(Certification).options(*options).where(Certification.id == certification_id)
 
     result = await db.execute(query)
     cert = result.scalar_one_or_none()
@@ -197,9 +455,80 @@ async def get_certification(
     if not cert:
         raise HTTPException(status_code=404, detail="자격증을 찾을 수 없습니다")
 
+    if selection:
+        return selection.response(cert)
     return cert
 
 
+@router.get("/{certification_id}/tree", response_model=CertificationTree)
+@cache_control(CATALOG_MAX_AGE, CATALOG_STALE_WHILE_REVALIDATE, tables=CERTIFICATION_TABLES)
+@fast_json(CertificationTree)
+async def get_certification_tree(
+    certification_id: int,
+    direction: TreeDirection = Query(TreeDirection.BOTH, description="탐색 방향 (up/down/both)"),
+    max_depth: Optional[int] = Query(None, ge=1, le=MAX_TREE_DEPTH, description="최대 탐색 깊이"),
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    자격증 기준 선수/후속 자격증 전체 트리 조회 (선수 관계 폐쇄 테이블에서 읽음)
+    """
+    depth_limit = max_depth or MAX_TREE_DEPTH
+    depths = {TreeDirection.UP.value: {}, TreeDirection.DOWN.value: {}}
+    if direction in (TreeDirection.UP, TreeDirection.BOTH):
+        depths[TreeDirection.UP.value] = await closure.ancestors_of(db, certification_id, depth_limit)
+    if direction in (TreeDirection.DOWN, TreeDirection.BOTH):
+        depths[TreeDirection.DOWN.value] = await closure.descendants_of(db, certification_id, depth_limit)
+
+    # 탐색에 쓰인 관계: 도달한 자격증과, 그보다 한 단계 안쪽(기준 자격증 포함)의 자격증을 잇는 관계
+    cp = certification_prerequisites
+    conditions = []
+    for found, inner_column, outer_column in (
+        (depths[TreeDirection.UP.value], cp.c.certification_id, cp.c.prerequisite_id),
+        (depths[TreeDirection.DOWN.value], cp.c.prerequisite_id, cp.c.certification_id),
+    ):
+        if found:
+            inner = [certification_id, *(i for i, depth in found.items() if depth < depth_limit)]
+            conditions.append(and_(inner_column.in_(inner), outer_column.in_(list(found))))
+    edges = set()
+    if conditions:
+        edge_result = await db.execute(
+            select(cp.c.prerequisite_id, cp.c.certification_id).where(or_(*conditions))
+        )
+        edges = set(edge_result.all())
+
+    ids = {certification_id}
+    for found in depths.values():
+        ids.update(found)
+    result = await db.execute(select(Certification).where(Certification.id.in_(ids)))
+    certs = {cert.id: cert for cert in result.scalars().all()}
+
+    root = certs.get(certification_id)
+    if not root:
+        raise HTTPException(status_code=404, detail="자격증을 찾을 수 없습니다")
+
+    def tree_nodes(found: dict) -> List[CertificationTreeNode]:
+        nodes = [
+            CertificationTreeNode(
+                **CertificationSimple.model_validate(certs[node_id]).model_dump(),
+                depth=depth,
+            )
+            for node_id, depth in found.items()
+            if node_id in certs and node_id != certification_id
+        ]
+        nodes.sort(key=lambda node: (node.depth, -node.level_order, node.name))
+        return nodes
+
+    return CertificationTree(
+        root=CertificationSimple.model_validate(root),
+        ancestors=tree_nodes(depths[TreeDirection.UP.value]),
+        descendants=tree_nodes(depths[TreeDirection.DOWN.value]),
+        edges=[
+            CertificationTreeEdge(source=source, target=target)
+            for source, target in sorted(edges)
+        ],
+    )
+
+
 @router.post("/", response_model=CertificationSchema)
 async def create_certification(
     certification_in: CertificationCreate,
@@ -211,7 +540,11 @@ async def create_certification(
     """
     certification = Certification(**certification_in.model_dump())
     db.add(certification)
+    await db.flush()
+    await closure.refresh_subtree(db, certification.id)
+    await facets.apply_change(db, [], facets.facet_keys(certification))
     await db.commit()
+    catalog.certification_changed(certification.id, [certification.category_main])
     await db.refresh(certification)
     return certification
 
@@ -226,8 +559,9 @@ async def update_certification(
     """
     자격증 수정 (관리자 전용)
     """
+    # 변경 전 패싯 값을 읽는 동안 다른 수정이 끼어들지 않도록 행 잠금
     result = await db.execute(
-        select(Certification).where(Certification.id == certification_id)
+        select(Certification).where(Certification.id == certification_id).with_for_update()
     )
     cert = result.scalar_one_or_none()
 
@@ -235,10 +569,28 @@ async def update_certification(
         raise HTTPException(status_code=404, detail="자격증을 찾을 수 없습니다")
 
     update_data = certification_in.model_dump(exclude_unset=True)
+    activation_changed = (
+        "is_active" in update_data and update_data["is_active"] != cert.is_active
+    )
+    facets_before = facets.facet_keys(cert)
+    category_before = cert.category_main
     for field, value in update_data.items():
         setattr(cert, field, value)
 
+    if activation_changed:
+        if cert.is_active:
+            # 비활성인 동안 추가된 선수 관계로 순환이 생겼으면 다시 활성화하지 않음
+            await closure.lock(db)
+            if await closure.on_cycle(db, cert.id):
+                raise HTTPException(
+                    status_code=409,
+                    detail="선수 관계가 순환되므로 다시 활성화할 수 없습니다"
+                )
+        await db.flush()
+        await closure.refresh_subtree(db, cert.id)
+    await facets.apply_change(db, facets_before, facets.facet_keys(cert))
     await db.commit()
+    catalog.certification_changed(cert.id, [category_before, cert.category_main])
     await db.refresh(cert)
     return cert
 
@@ -252,16 +604,22 @@ async def delete_certification(
     """
     자격증 삭제 (관리자 전용) - Soft delete
     """
+    # 변경 전 패싯 값을 읽는 동안 다른 수정이 끼어들지 않도록 행 잠금
     result = await db.execute(
-        select(Certification).where(Certification.id == certification_id)
+        select(Certification).where(Certification.id == certification_id).with_for_update()
     )
     cert = result.scalar_one_or_none()
 
     if not cert:
         raise HTTPException(status_code=404, detail="자격증을 찾을 수 없습니다")
 
+    facets_before = facets.facet_keys(cert)
     cert.is_active = False
+    await db.flush()
+    await closure.refresh_subtree(db, cert.id)
+    await facets.apply_change(db, facets_before, [])
     await db.commit()
+    catalog.certification_changed(cert.id, [cert.category_main])
 
     return {"message": "자격증이 삭제되었습니다"}
 
@@ -295,8 +653,35 @@ async def add_prerequisite(
         raise HTTPException(status_code=404, detail="선수 자격증을 찾을 수 없습니다")
 
     if prereq not in cert.prerequisites:
+        # 로컬 위상 순서로 명백한 순환은 잠금 없이 바로 거절
+        snapshot = await graph_store.get(db, allow_stale=False)
+        creates_cycle = prereq.id == cert.id
+        if not creates_cycle and prereq.id in snapshot.topo and cert.id in snapshot.topo:
+            creates_cycle = snapshot.topo.creates_cycle(prereq.id, cert.id)
+
+        # 최종 판단은 잠금을 잡은 뒤 저장된 전체 선수 관계로 (동시에 추가된 엣지, 비활성 자격증 포함)
+        if not creates_cycle:
+            await closure.lock(db)
+            exists = await db.execute(
+                select(certification_prerequisites.c.prerequisite_id).where(
+                    certification_prerequisites.c.certification_id == cert.id,
+                    certification_prerequisites.c.prerequisite_id == prereq.id,
+                )
+            )
+            if exists.first() is not None:
+                return {"message": "선수 자격증이 추가되었습니다"}
+            creates_cycle = await closure.is_ancestor(db, cert.id, prereq.id)
+        if creates_cycle:
+            raise HTTPException(
+                status_code=409,
+                detail="선수 관계가 순환되므로 추가할 수 없습니다"
+            )
+
         cert.prerequisites.append(prereq)
+        await db.flush()
+        await closure.add_edge(db, prereq.id, cert.id)
         await db.commit()
+        catalog.prerequisite_added(prereq.id, cert.id)
 
     return {"message": "선수 자격증이 추가되었습니다"}
 
@@ -328,6 +713,9 @@ async def remove_prerequisite(
 
     if prereq and prereq in cert.prerequisites:
         cert.prerequisites.remove(prereq)
+        await db.flush()
+        await closure.refresh_subtree(db, cert.id)
         await db.commit()
+        catalog.prerequisite_removed(prereq.id, cert.id)
 
     return {"message": "선수 자격증이 제거되었습니다"}
@@ -0,0 +1,114 @@
+from typing import Any, List, Optional, Set
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.db.session import get_db
+from app.models.career import CareerPath, Requirement
+from app.models.user import User, UserCertification
+from app.core.deps import get_current_user
+from app.services.graph import GraphSnapshot, graph_store
+from app.services.roadmap import get_roadmap_index, plan_targets
+from app.schemas.certification import CertificationSimple
+from app.schemas.roadmap import Roadmap, RoadmapStep
+
+router = APIRouter()
+
+
+async def _acquired_ids(db: AsyncSession, user: Optional[User]) -> Set[int]:
+    if not user:
+        return set()
+    result = await db.execute(
+        select(UserCertification.certification_id).where(
+            UserCertification.user_id == user.id
+        )
+    )
+    return set(result.scalars().all())
+
+
+def _build_roadmap(
+    snapshot: GraphSnapshot,
+    targets: List[int],
+    acquired: Set[int],
+    require_all: bool,
+) -> Roadmap:
+    index = get_roadmap_index(snapshot)
+    target_nodes = [
+        CertificationSimple.model_validate(snapshot.nodes[i], from_attributes=True)
+        for i in targets
+    ]
+    plan = plan_targets(index, targets, acquired, require_all)
+    if plan is None:
+        return Roadmap(targets=target_nodes, reachable=False)
+
+    starts, steps, total = plan
+    return Roadmap(
+        targets=target_nodes,
+        starting_from=[
+            CertificationSimple.model_validate(snapshot.nodes[i], from_attributes=True)
+            for i in starts
+        ],
+        steps=[
+            RoadmapStep(
+                certification=CertificationSimple.model_validate(snapshot.nodes[i], from_attributes=True),
+                expected_attempts=round(index.attempts[index.index[i]], 2),
+                expected_cost=round(index.cost[index.index[i]]),
+            )
+            for i in steps
+        ],
+        total_cost=round(total),
+    )
+
+
+@router.get("/certifications/{certification_id}", response_model=Roadmap)
+async def get_certification_roadmap(
+    certification_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user)
+) -> Any:
+    """
+    목표 자격증까지의 최저 비용 로드맵
+    """
+    snapshot = await graph_store.get(db)
+    if certification_id not in snapshot.nodes:
+        raise HTTPException(status_code=404, detail="자격증을 찾을 수 없습니다")
+
+    acquired = await _acquired_ids(db, current_user)
+    return _build_roadmap(snapshot, [certification_id], acquired, require_all=True)
+
+
+@router.get("/careers/{career_id}", response_model=Roadmap)
+async def get_career_roadmap(
+    career_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user)
+) -> Any:
+    """
+    커리어 요구 자격증까지의 최저 비용 로드맵
+
+    필수 요구 자격증이 있으면 모두 취득하는 경로를, 없으면 요구 자격증 중
+    가장 저렴하게 취득할 수 있는 하나까지의 경로를 계산한다.
+    """
+    result = await db.execute(
+        select(CareerPath.id).where(CareerPath.id == career_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="커리어를 찾을 수 없습니다")
+
+    result = await db.execute(
+        select(Requirement.certification_id, Requirement.is_mandatory).where(
+            Requirement.career_path_id == career_id,
+            Requirement.certification_id.isnot(None),
+        ).order_by(Requirement.id)
+    )
+    requirements = result.all()
+
+    snapshot = await graph_store.get(db)
+    mandatory = [r.certification_id for r in requirements if r.is_mandatory and r.certification_id in snapshot.nodes]
+    candidates = [r.certification_id for r in requirements if r.certification_id in snapshot.nodes]
+    targets = list(dict.fromkeys(mandatory or candidates))
+    if not targets:
+        raise HTTPException(status_code=404, detail="요구 자격증이 없는 커리어입니다")
+
+    acquired = await _acquired_ids(db, current_user)
+    return _build_roadmap(snapshot, targets, acquired, require_all=bool(mandatory))
@@ -0,0 +1,33 @@
+from typing import Any
+from fastapi import APIRouter, HTTPException, Query
+
+from app.db.search import SearchMode
+from app.services.search import DEFAULT_SEARCH_LIMIT, unified_search
+from app.schemas.search import SearchGroup, SearchResults
+
+router = APIRouter()
+
+
+@router.get("/", response_model=SearchResults)
+async def search(
+    q: str = Query(..., min_length=1, description="검색어"),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=50, description="유형별 최대 결과 수"),
+    mode: SearchMode = Query(SearchMode.fulltext, description="검색 방식"),
+) -> Any:
+    """
+    자격증/커리어 통합 검색
+    두 검색을 동시에 실행해 한 번의 요청으로 유형별 결과와 개수를 돌려준다.
+    """
+    if not q.strip():
+        # 공백만 있으면 부분 일치 검색이 전체 카탈로그와 일치함
+        raise HTTPException(status_code=400, detail="검색어를 입력하세요")
+    (cert_hits, cert_total), (career_hits, career_total), merged = await unified_search(
+        q, mode, limit
+    )
+    return SearchResults(
+        query=q,
+        total=cert_total + career_total,
+        items=merged,
+        certifications=SearchGroup(count=cert_total, items=cert_hits),
+        careers=SearchGroup(count=career_total, items=career_hits),
+    )
@@ -1,5 +1,6 @@
 from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
@@ -9,6 +10,7 @@ from app.models.user import User, UserCertification, UserGoal
 from app.models.certification import Certification
 from app.core.deps import get_current_user_required
 from app.core.security import get_password_hash
+from app.core.serialization import fast_json
 from app.schemas.user import (
     User as UserSchema,
     UserUpdate,
@@ -60,6 +62,7 @@ async def update_my_profile(
 # ==================== 취득 자격증 ====================
 
 @router.get("/me/certifications", response_model=List[UserCertificationSchema])
+@fast_json(List[UserCertificationSchema])
 async def get_my_certifications(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user_required)
@@ -110,7 +113,12 @@ async def add_my_certification(
         **cert_in.model_dump()
     )
     db.add(user_cert)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 동시에 들어온 같은 요청 (user_id, certification_id 유니크 제약)
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="이미 등록된 자격증입니다")
     await db.refresh(user_cert)
 
     # 목표에서 해당 자격증이 있으면 완료 처리
@@ -217,7 +225,11 @@ async def add_my_goal(
         **goal_in.model_dump()
     )
     db.add(goal)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="이미 등록된 목표입니다")
     await db.refresh(goal)
 
     return goal
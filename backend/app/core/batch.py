@@ -0,0 +1,96 @@
+"""
+ID 목록 일괄 조회
+
+?ids=3,1,2 형식의 ID 목록을 해석하고, 한 번의 IN 쿼리로 읽은 행을 요청 순서대로 정렬한 뒤
+찾지 못한 ID를 따로 돌려준다.
+상세 조회 응답 캐시에 이미 있는 항목은 DB에서 다시 읽지 않고(cached_details),
+DB에서 읽은 항목은 상세 조회 캐시에 채워 둔다(cache_details).
+"""
+import json
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar
+
+from fastapi import HTTPException
+
+from app.core.cache import current_validator
+from app.core.response_cache import CachedResponse, TagsFunc, response_cache
+from app.core.serialization import json_encoder
+
+# 한 번에 조회할 수 있는 최대 ID 수
+MAX_BATCH_IDS = 200
+
+T = TypeVar("T")
+
+
+def parse_ids(value: str, max_ids: int = MAX_BATCH_IDS) -> List[int]:
+    """
+    쉼표로 구분한 ID 목록 (중복은 처음 위치만 남김, 형식 오류/개수 초과는 400)
+    """
+    ids: Dict[int, None] = {}
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            ids[int(part)] = None
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"잘못된 ID입니다: {part}")
+    if not ids:
+        raise HTTPException(status_code=400, detail="조회할 ID가 없습니다")
+    if len(ids) > max_ids:
+        raise HTTPException(
+            status_code=400, detail=f"한 번에 최대 {max_ids}개까지 조회할 수 있습니다"
+        )
+    return list(ids)
+
+
+def item_id(item: Any) -> int:
+    """ORM 객체 또는 캐시에서 꺼낸 JSON 값(dict)의 ID"""
+    return item["id"] if isinstance(item, dict) else item.id
+
+
+def in_request_order(
+    ids: List[int], rows: Iterable[T], key: Callable[[T], int] = item_id
+) -> Tuple[List[T], List[int]]:
+    """
+    조회 결과를 요청한 ID 순서대로 정렬 -> (결과, 찾지 못한 ID)
+    """
+    found = {key(row): row for row in rows}
+    items = [found[id_] for id_ in ids if id_ in found]
+    missing = [id_ for id_ in ids if id_ not in found]
+    return items, missing
+
+
+async def cached_details(route: str, param: str, ids: List[int]) -> Tuple[List[Any], List[int]]:
+    """
+    상세 조회(route)의 응답 캐시에 있는 항목 -> (JSON 값 목록, DB에서 읽어야 할 ID)
+    param: 상세 조회 엔드포인트의 ID 경로 파라미터 이름
+    """
+    validator = current_validator.get()
+    keys = {id_: response_cache.key(route, {param: id_}) for id_ in ids}
+    entries = {
+        key: entry
+        for key, entry in (await response_cache.get_many(route, keys.values())).items()
+        # 일괄 조회 응답의 ETag와 맞지 않는 오래된 항목은 DB에서 다시 읽어 교체
+        if entry.is_fresh(validator)
+    }
+    items = [json.loads(entries[key].body) for key in keys.values() if key in entries]
+    misses = [id_ for id_, key in keys.items() if key not in entries]
+    return items, misses
+
+
+async def cache_details(
+    route: str, param: str, rows: Iterable[Any], response_model: Any, tags: TagsFunc
+) -> None:
+    """DB에서 읽은 행을 상세 조회(route)의 응답 캐시에 저장 (상세 조회와 같은 키/본문/태그)"""
+    encoder = json_encoder(response_model)
+    validator = current_validator.get()
+    entries = {}
+    for row in rows:
+        params = {param: row.id}
+        entries[response_cache.key(route, params)] = CachedResponse(
+            body=encoder(row),
+            headers={},
+            tags=tuple(dict.fromkeys(tags(params, row))),
+            validator=validator,
+        )
+    await response_cache.set_many(route, entries)
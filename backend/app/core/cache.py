@@ -0,0 +1,66 @@
+"""
+프로세스 로컬 캐시
+"""
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+_MISSING = object()
+
+# 현재 요청의 HTTP 검증자 (ETag). 응답 캐시 항목과 비교해 검증자와 본문이 어긋나지 않게 한다.
+current_validator: ContextVar[Optional[str]] = ContextVar("current_validator", default=None)
+
+
+class TTLCache:
+    """
+    만료 시간이 있는 LRU 캐시 (단일 이벤트 루프에서 사용하므로 잠금 없음)
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int = 1024,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.on_evict = on_evict  # 용량 초과로 밀려난 항목 (키, 값)
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            evicted_key, (_, evicted) = self._data.popitem(last=False)
+            if self.on_evict is not None:
+                self.on_evict(evicted_key, evicted)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """만료되지 않은 (키, 값) 목록"""
+        now = time.monotonic()
+        return [(key, value) for key, (expires_at, value) in self._data.items() if expires_at > now]
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
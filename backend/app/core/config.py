@@ -29,6 +29,22 @@ class Settings(BaseSettings):
     def SQLALCHEMY_DATABASE_URI(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    # 전문 검색 설정
+    # ngram: 모든 단어를 2글자 단위로 쪼개 색인 (형태소 분석기 없이 한국어 부분 일치)
+    # parser: SEARCH_TS_CONFIG의 파서를 그대로 사용 (예: 한국어 형태소 분석 확장을 설치한 경우)
+    SEARCH_TOKENIZER: str = "ngram"
+    SEARCH_TS_CONFIG: str = "simple"
+
+    # 응답 캐시 (REDIS_URL이 비어 있으면 워커별 L1만 사용)
+    REDIS_URL: str = "redis://localhost:6379/0"
+    RESPONSE_CACHE_TTL: int = 300  # L2 (초)
+    RESPONSE_CACHE_L1_TTL: float = 5.0  # 다른 워커의 삭제가 반영되기까지 최대 지연 (초)
+    RESPONSE_CACHE_L1_SIZE: int = 512
+
+    # 캐시 예열 (시작 시, 카탈로그 변경 후, 이후 CACHE_WARM_INTERVAL초마다 응답 캐시 갱신)
+    CACHE_WARM_ENABLED: bool = True
+    CACHE_WARM_INTERVAL: int = 240  # RESPONSE_CACHE_TTL보다 짧게 두어 만료 전에 교체
+
     # 첫 슈퍼유저
     FIRST_SUPERUSER_EMAIL: str = "admin@speclab.kr"
     FIRST_SUPERUSER_PASSWORD: str = "admin123"
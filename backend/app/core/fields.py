@@ -0,0 +1,119 @@
+"""
+응답 필드 선택 (fields=) / 관계 확장 (expand=)
+
+fields=id,name 처럼 요청하면 해당 컬럼만 SELECT하고(load_only), expand=prerequisites 처럼
+요청한 관계만 eager loading 한다. 응답은 선택한 필드만 가진 스키마로 만들어 그대로 인코딩하므로
+response_model의 나머지 필드(기본값)도 본문에 붙지 않는다.
+둘 다 지정하지 않으면 None을 돌려주고, 엔드포인트는 기존 전체 응답을 그대로 사용한다.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Response
+from pydantic import BaseModel, ConfigDict, create_model
+from sqlalchemy.orm import load_only, selectinload
+
+from app.core.serialization import dumps
+
+# 항상 포함하는 필드
+ALWAYS_INCLUDED = ("id",)
+
+
+def _split(value: str) -> List[str]:
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+@lru_cache(maxsize=256)
+def partial_schema(schema: Type[BaseModel], names: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    schema에서 names 필드만 남긴 스키마 (필드 정의/검증 규칙은 그대로)
+    """
+    fields = {
+        name: (schema.model_fields[name].annotation, schema.model_fields[name])
+        for name in names
+    }
+    return create_model(
+        f"{schema.__name__}Partial",
+        __config__=ConfigDict(from_attributes=True),
+        **fields,
+    )
+
+
+@dataclass(frozen=True)
+class FieldSelection:
+    schema: Type[BaseModel]
+    columns: Tuple[str, ...]  # 스키마 필드 순서
+    expand: Tuple[str, ...]
+
+    def options(self, model, *extra_columns: str) -> list:
+        """
+        선택한 컬럼만 읽고 확장한 관계만 불러오는 로더 옵션
+        extra_columns: 응답에는 없지만 정렬/커서 계산에 필요한 컬럼
+        """
+        names = dict.fromkeys((*self.columns, *extra_columns))
+        options = [load_only(*(getattr(model, name) for name in names))]
+        options.extend(selectinload(getattr(model, name)) for name in self.expand)
+        return options
+
+    @property
+    def response_schema(self) -> Type[BaseModel]:
+        names = tuple(name for name in self.schema.model_fields if name in self.columns or name in self.expand)
+        return partial_schema(self.schema, names)
+
+    def dump(self, obj: Any) -> Dict[str, Any]:
+        return self.response_schema.model_validate(obj).model_dump(mode="json")
+
+    def response(self, content: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+        """
+        단건 또는 목록을 선택한 필드만으로 인코딩한 응답
+        (직접 Response를 돌려주므로 필요한 헤더는 headers로 넘긴다)
+        """
+        if isinstance(content, (list, tuple)):
+            body = [self.dump(obj) for obj in content]
+        else:
+            body = self.dump(content)
+        return Response(content=dumps(body), media_type="application/json", headers=headers)
+
+
+def select_fields(
+    schema: Type[BaseModel],
+    fields: Optional[str],
+    expand: Optional[str] = None,
+    relations: Sequence[str] = (),
+) -> Optional[FieldSelection]:
+    """
+    fields/expand 쿼리 파라미터 해석 (알 수 없는 이름은 400)
+
+    relations: 스키마 필드 중 expand로만 요청할 수 있는 관계 필드
+    """
+    if fields is None and expand is None:
+        return None
+
+    column_names = [name for name in schema.model_fields if name not in relations]
+    if fields is None:
+        columns = column_names
+    else:
+        requested = _split(fields)
+        _check_names(requested, column_names, "필드")
+        columns = [
+            name for name in column_names
+            if name in requested or name in ALWAYS_INCLUDED
+        ]
+
+    expanded: Iterable[str] = ()
+    if expand is not None:
+        requested = _split(expand)
+        _check_names(requested, relations, "확장 관계")
+        expanded = [name for name in relations if name in requested]
+
+    return FieldSelection(schema=schema, columns=tuple(columns), expand=tuple(expanded))
+
+
+def _check_names(requested: Iterable[str], allowed: Sequence[str], label: str) -> None:
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 {label}입니다: {', '.join(unknown)} (사용 가능: {', '.join(allowed)})",
+        )
@@ -0,0 +1,193 @@
+"""
+HTTP 캐시 헤더 / 조건부 요청 미들웨어
+
+각 라우트는 cache_control 데코레이터로 max-age, stale-while-revalidate와 응답이 의존하는 테이블을 선언한다.
+테이블을 선언한 GET 라우트는 테이블 변경 스탬프(app.db.stamps)로 ETag/Last-Modified를 만들고,
+If-None-Match / If-Modified-Since가 일치하면 엔드포인트를 실행하지 않고 304로 응답한다.
+/users/me 이하 인증 라우트는 공유 캐시에 저장되지 않도록 private으로 표시한다.
+
+정책은 라우팅이 끝난 뒤 cache_control 래퍼가 요청 상태(RequestCacheState)에 기록하고,
+미들웨어는 그 상태로 응답 헤더만 붙인다. (라우터 내부 구조를 직접 탐색하지 않으므로
+include_router 중첩 방식이 FastAPI 버전마다 달라도 같게 동작)
+"""
+import functools
+import hashlib
+import logging
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import current_validator
+from app.core.config import settings
+from app.db.stamps import EMPTY_STAMP, Stamp, current_stamps
+
+logger = logging.getLogger(__name__)
+
+# 인증 사용자 전용 경로 (항상 private)
+PRIVATE_PREFIXES = (f"{settings.API_V1_STR}/users/me",)
+
+# 캐시 헤더를 붙이는 상태 코드
+CACHEABLE_STATUS = (200, 304)
+
+@dataclass(frozen=True)
+class CachePolicy:
+    max_age: int = 0
+    stale_while_revalidate: int = 0
+    tables: Tuple[str, ...] = ()  # 검증자를 계산할 테이블 (없으면 Cache-Control만)
+    private: bool = False
+
+    def header(self) -> str:
+        if self.private:
+            return "private, no-cache"
+        value = f"public, max-age={self.max_age}"
+        if self.stale_while_revalidate:
+            value += f", stale-while-revalidate={self.stale_while_revalidate}"
+        return value
+
+
+PRIVATE_POLICY = CachePolicy(private=True)
+
+
+@dataclass
+class RequestCacheState:
+    """요청별 캐시 정책/검증자 (미들웨어가 만들고 cache_control 래퍼가 채움)"""
+    method: str
+    headers: Headers
+    policy: Optional[CachePolicy] = None
+    etag: Optional[str] = None
+    extra: Dict[str, str] = field(default_factory=dict)
+
+    async def apply(self, policy: CachePolicy) -> bool:
+        """정책을 기록하고 응답 헤더/검증자 계산, 반환: 조건부 요청이 현재 검증자와 일치하는지"""
+        self.policy = policy
+        self.extra = {"Cache-Control": policy.header()}
+        if policy.private:
+            self.extra["Vary"] = "Authorization"
+        if self.method != "GET" or not policy.tables or policy.private:
+            return False
+        try:
+            stamps = await current_stamps()
+        except Exception:
+            logger.warning("change stamps unavailable, skipping validators", exc_info=True)
+            return False
+        self.etag, last_modified = validators(stamps, policy.tables)
+        self.extra["ETag"] = self.etag
+        if last_modified is not None:
+            self.extra["Last-Modified"] = format_datetime(
+                last_modified.astimezone(timezone.utc), usegmt=True
+            )
+        return not_modified(self.headers, self.etag, last_modified)
+
+
+_request_state: ContextVar[Optional[RequestCacheState]] = ContextVar("http_cache_request", default=None)
+
+
+def cache_control(
+    max_age: int = 0,
+    stale_while_revalidate: int = 0,
+    tables: Sequence[str] = (),
+    private: bool = False,
+) -> Callable:
+    """
+    라우트의 HTTP 캐시 정책 선언 (라우터 데코레이터 아래에 둔다)
+
+    조건부 요청이 현재 검증자와 일치하면 엔드포인트를 실행하지 않고 304로 응답한다.
+    요청 밖에서 직접 호출하면(예열 등) 엔드포인트를 그대로 실행한다.
+    """
+    policy = CachePolicy(max_age, stale_while_revalidate, tuple(sorted(tables)), private)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            state = _request_state.get()
+            if state is None:
+                return await func(*args, **kwargs)
+            if await state.apply(policy):
+                return Response(status_code=304, headers=state.extra)
+            token = current_validator.set(state.etag)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                current_validator.reset(token)
+
+        wrapper.cache_policy = policy
+        return wrapper
+
+    return decorator
+
+
+def validators(stamps: Dict[str, Stamp], tables: Sequence[str]) -> Tuple[str, Optional[datetime]]:
+    """(약한 ETag, Last-Modified)"""
+    parts = []
+    last_modified = None
+    for table in tables:
+        stamp = stamps.get(table, EMPTY_STAMP)
+        changed_at = stamp.changed_at
+        parts.append(f"{table}:{stamp.version}:{changed_at.timestamp() if changed_at else 0}")
+        if changed_at is not None and (last_modified is None or changed_at > last_modified):
+            last_modified = changed_at
+    digest = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"', last_modified
+
+
+def not_modified(headers: Headers, etag: str, last_modified: Optional[datetime]) -> bool:
+    """조건부 요청 헤더가 현재 검증자와 일치하는지 (If-None-Match가 있으면 그것만 본다)"""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        # GET은 약한 비교
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or etag.removeprefix("W/") in candidates
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+class HTTPCacheMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = RequestCacheState(method=scope["method"], headers=Headers(scope=scope))
+        if scope["path"].startswith(PRIVATE_PREFIXES):
+            await state.apply(PRIVATE_POLICY)
+
+        async def send_with_headers(message: Message) -> None:
+            policy = state.policy
+            if message["type"] == "http.response.start" and policy is not None and (
+                policy.private or message["status"] in CACHEABLE_STATUS
+            ):
+                headers = MutableHeaders(raw=message["headers"])
+                own_etag = headers.get("etag")
+                for name, value in state.extra.items():
+                    # 엔드포인트가 직접 정한 값(그래프 본문 ETag 등)이 우선
+                    if name in headers:
+                        continue
+                    # 본문이 다른 검증자로 만들어졌으면(오래된 캐시 응답) 현재 Last-Modified를 붙이지 않음
+                    if name == "Last-Modified" and own_etag is not None and own_etag != state.etag:
+                        continue
+                    headers[name] = value
+            await send(message)
+
+        token = _request_state.set(state)
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _request_state.reset(token)
@@ -0,0 +1,82 @@
+"""
+커서(keyset) 페이지네이션
+
+OFFSET 대신 마지막으로 받은 행의 정렬 키 다음부터 조회하므로 페이지가 깊어져도 비용이 일정하고,
+조회 중에 행이 추가/삭제되어도 건너뛰거나 중복되는 행이 없다.
+커서는 정렬 키 값을 JSON으로 직렬화한 뒤 base64url로 인코딩한 불투명 문자열이다.
+"""
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(list(values), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """커서 -> 정렬 키 값 목록 (형식이 맞지 않으면 400)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+    return values
+
+
+class Keyset:
+    """
+    정렬 키 정의
+
+    keys: (정렬 식, 내림차순 여부) 목록. 마지막 키는 유일해야 한다(보통 id).
+    """
+
+    def __init__(self, *keys: Tuple[ColumnElement, bool]) -> None:
+        self.keys = keys
+
+    def order_by(self) -> List[ColumnElement]:
+        return [column.desc() if descending else column.asc() for column, descending in self.keys]
+
+    def after(self, values: Sequence[Any]) -> ColumnElement:
+        """정렬 순서상 values 다음에 오는 행 조건"""
+        directions = {descending for _, descending in self.keys}
+        if len(directions) == 1:
+            # 방향이 모두 같으면 행 값 비교 한 번으로 인덱스 범위 검색이 가능
+            left = tuple_(*(column for column, _ in self.keys))
+            right = tuple_(*values)
+            return left < right if directions.pop() else left > right
+
+        clauses = []
+        for i, (column, descending) in enumerate(self.keys):
+            equal = [self.keys[j][0] == values[j] for j in range(i)]
+            beyond = column < values[i] if descending else column > values[i]
+            clauses.append(and_(*equal, beyond))
+        return or_(*clauses)
+
+    def apply(self, query, cursor: Optional[str], limit: int):
+        """커서 조건, 정렬, limit(다음 페이지 확인용 1개 추가) 적용"""
+        if cursor:
+            query = query.where(self.after(decode_cursor(cursor, len(self.keys))))
+        return query.order_by(*self.order_by()).limit(limit + 1)
+
+    def page(
+        self, rows: Sequence[T], limit: int, values_of: Callable[[T], Sequence[Any]]
+    ) -> Tuple[List[T], Optional[str]]:
+        """apply()로 조회한 결과 -> (이번 페이지, 다음 커서 또는 None)"""
+        rows = list(rows)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor(values_of(rows[-1]))
@@ -0,0 +1,155 @@
+"""
+미리 직렬화/압축해 둔 JSON 응답 본문
+
+한 번 만든 바이트(원본, gzip, brotli)를 재사용하고, If-None-Match가 일치하면
+본문 없이 304로 응답한다.
+"""
+import gzip
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip/원본만 제공
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 11  # 백그라운드(예열)에서 만들 때
+BROTLI_REQUEST_QUALITY = 5  # 요청 처리 중에 만들 때 (11은 큰 본문에서 수백 ms가 걸림)
+
+# 선호 순서
+ENCODINGS = ("br", "gzip")
+
+
+def encode_json(content: Any) -> bytes:
+    """
+    FastAPI 기본 JSONResponse와 같은 형식으로 JSON 인코딩
+    """
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def payload_etags(tag: str) -> Dict[Optional[str], str]:
+    """인코딩별 ETag"""
+    etags: Dict[Optional[str], str] = {None: f'"{tag}"', "gzip": f'"{tag}-gz"'}
+    if brotli is not None:
+        etags["br"] = f'"{tag}-br"'
+    return etags
+
+
+def etag_matches(etags: Dict[Optional[str], str], if_none_match: Optional[str]) -> bool:
+    """If-None-Match 헤더가 어느 인코딩의 ETag와든 일치하는지"""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    if "*" in candidates:
+        return True
+    # 프록시가 붙인 약한 비교 접두사도 허용
+    candidates |= {tag[2:] for tag in candidates if tag.startswith("W/")}
+    return any(etag in candidates for etag in etags.values())
+
+
+class EncodedPayload:
+    """
+    인코딩 방식별로 미리 만들어 둔 응답 본문과 ETag
+
+    tag를 주지 않으면 본문 해시로 ETag를 만든다.
+    압축에 시간이 걸리므로 이벤트 루프 밖(asyncio.to_thread)에서 만드는 것을 권장한다.
+    """
+
+    def __init__(
+        self,
+        body: bytes,
+        tag: Optional[str] = None,
+        brotli_quality: int = BROTLI_QUALITY,
+    ) -> None:
+        tag = tag or hashlib.sha256(body).hexdigest()[:32]
+        self.brotli_quality = brotli_quality
+        self.etags = payload_etags(tag)
+        self.bodies: Dict[Optional[str], bytes] = {
+            None: body,
+            "gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+        }
+        if brotli is not None:
+            self.bodies["br"] = brotli.compress(body, quality=brotli_quality)
+
+    @classmethod
+    def from_content(cls, content: Any) -> "EncodedPayload":
+        return cls(encode_json(content))
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """If-None-Match 헤더가 어느 인코딩의 ETag와든 일치하는지"""
+        return etag_matches(self.etags, if_none_match)
+
+
+def accepted_encoding(accept_encoding: Optional[str], available) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 인코딩 선택 (없으면 None = 원본)
+    """
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    for coding in ENCODINGS:
+        if coding in available and accepted.get(coding, accepted.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+
+def not_modified_response(
+    request: Request,
+    tag: str,
+    headers: Optional[Dict[str, str]] = None,
+) -> Optional[Response]:
+    """
+    tag로 만든 ETag가 If-None-Match와 일치하면 본문을 만들지 않고 304 (아니면 None)
+    """
+    etags = payload_etags(tag)
+    if not etag_matches(etags, request.headers.get("if-none-match")):
+        return None
+    coding = accepted_encoding(request.headers.get("accept-encoding"), etags)
+    return Response(
+        status_code=304,
+        headers={"Vary": "Accept-Encoding", **(headers or {}), "ETag": etags[coding]},
+    )
+
+
+def payload_response(
+    request: Request,
+    payload: EncodedPayload,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    조건부 요청이면 304, 아니면 클라이언트가 받을 수 있는 인코딩으로 응답
+    """
+    response_headers = {"Vary": "Accept-Encoding", **(headers or {})}
+    coding = accepted_encoding(request.headers.get("accept-encoding"), payload.bodies)
+    response_headers["ETag"] = payload.etags[coding]
+
+    if payload.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=response_headers)
+
+    if coding is not None:
+        response_headers["Content-Encoding"] = coding
+    return Response(
+        content=payload.bodies[coding],
+        media_type="application/json",
+        headers=response_headers,
+    )
@@ -0,0 +1,422 @@
+"""
+공개 GET 응답 캐시 (워커별 L1 + Redis L2)
+
+라우트 이름과 정규화한 요청 파라미터를 키로 최종 JSON 본문과 헤더, 만들 때의 HTTP 검증자(ETag)를 저장한다.
+항목마다 태그(cert:42, category:IT, careers 등)를 붙여 두고, 카탈로그가 바뀌면
+app.services.catalog 훅에서 관련 태그의 항목을 오래된(stale) 것으로 표시한다.
+
+stale-while-revalidate: 오래된 항목(표시됐거나 검증자가 현재 요청과 다름)은 지우지 않고
+그대로 응답(X-Cache: STALE, 항목의 ETag)하면서 키별로 한 번만 백그라운드에서 새로 계산해 교체한다.
+
+- L1: 워커별 TTLCache. 다른 워커의 표시는 전달되지 않지만 검증자 비교로 1초 안에 오래된 항목을 알아챈다.
+- L2: Redis. 태그마다 키 집합(SET)을 두고, 표시할 때 집합에 든 키마다 stale 표시 키를 남긴다.
+
+redis 패키지가 없거나 REDIS_URL이 비어 있거나 Redis에 연결할 수 없으면 L2를 건너뛴다.
+(연결 실패 후 REDIS_RETRY_AFTER초 동안은 다시 시도하지 않음)
+"""
+import asyncio
+import contextlib
+import functools
+import json
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from fastapi import Response
+
+from app.core.cache import TTLCache, current_validator
+from app.core.config import settings
+from app.core.serialization import json_encoder
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis가 없으면 L1만 사용
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_HEADER = "X-Cache"
+KEY_PREFIX = "speclab:response:"
+TAG_PREFIX = "speclab:tag:"
+STALE_PREFIX = "speclab:stale:"
+
+REDIS_TIMEOUT = 0.2
+REDIS_RETRY_AFTER = 30.0
+
+# 캐시에서 꺼낸 응답에 다시 붙이지 않는 헤더 (본문에 맞게 새로 계산됨)
+SKIPPED_HEADERS = {"content-length", "content-type", CACHE_HEADER.lower()}
+
+# 캐시 키에 들어가는 엔드포인트 인자 (경로/쿼리 파라미터 값)
+PARAM_TYPES = (str, int, float, Enum)
+
+# (파라미터, 엔드포인트 반환값 또는 None) -> 태그
+TagsFunc = Callable[[Dict[str, Any], Any], Iterable[str]]
+
+# True이면 저장된 항목을 읽지 않고 새로 계산해 덮어씀 (ResponseCache.refreshing)
+_refreshing: ContextVar[bool] = ContextVar("response_cache_refreshing", default=False)
+
+
+@dataclass
+class RouteStats:
+    l1_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0  # 적중 중 오래된 항목을 보내고 백그라운드 갱신을 예약한 횟수
+    evictions: int = 0  # L1 용량 초과로 밀려난 항목
+    l2_errors: int = 0
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    headers: Dict[str, str]
+    tags: Tuple[str, ...]
+    validator: Optional[str] = None  # 만들 때의 HTTP 검증자 (ETag)
+    stale: bool = False  # 태그 변경으로 오래된 것으로 표시됨 (저장하지 않음)
+
+    def encode(self) -> bytes:
+        meta = json.dumps(
+            {"headers": self.headers, "tags": self.tags, "validator": self.validator},
+            ensure_ascii=False,
+        )
+        return meta.encode("utf-8") + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, raw: bytes) -> "CachedResponse":
+        meta, _, body = raw.partition(b"\n")
+        data = json.loads(meta)
+        return cls(
+            body=body,
+            headers=data["headers"],
+            tags=tuple(data["tags"]),
+            validator=data.get("validator"),
+        )
+
+    def is_fresh(self, validator: Optional[str]) -> bool:
+        """현재 요청의 검증자 기준으로 그대로 써도 되는지"""
+        return not self.stale and (validator is None or self.validator == validator)
+
+    def response(self, source: str) -> Response:
+        headers = {**self.headers, CACHE_HEADER: source}
+        if self.validator is not None:
+            # 본문과 맞는 ETag (오래된 항목이면 미들웨어가 계산한 현재 ETag와 다름)
+            headers["ETag"] = self.validator
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+def request_params(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """엔드포인트 인자 중 요청 파라미터 값만 (세션/Request/Response 등 의존성 제외)"""
+    return {
+        name: value for name, value in kwargs.items() if isinstance(value, PARAM_TYPES)
+    }
+
+
+def fresh_arguments(kwargs: Dict[str, Any], db: Any) -> Dict[str, Any]:
+    """
+    백그라운드 갱신용 엔드포인트 인자 (요청의 세션과 주입받은 Response는 새 것으로 교체)
+    """
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    arguments = {}
+    for name, value in kwargs.items():
+        if isinstance(value, AsyncSession):
+            value = db
+        elif isinstance(value, Response):
+            value = Response()
+        arguments[name] = value
+    return arguments
+
+
+def cache_key(route: str, params: Dict[str, Any]) -> str:
+    """라우트 + 이름순으로 정렬한 파라미터 (Enum은 값으로)"""
+    parts = []
+    for name in sorted(params):
+        value = params[name]
+        if isinstance(value, Enum):
+            value = value.value
+        parts.append(f"{name}={value}")
+    return f"{route}?{'&'.join(parts)}"
+
+
+class ResponseCache:
+    def __init__(self, redis_url: str, ttl: int, l1_ttl: float, l1_size: int) -> None:
+        self.redis_url = redis_url
+        self.ttl = ttl
+        self.local = TTLCache(ttl=l1_ttl, maxsize=l1_size, on_evict=self._evicted)
+        self.stats: Dict[str, RouteStats] = {}
+        self._redis = None
+        self._redis_down_until = 0.0
+        self._tasks: Set[asyncio.Task] = set()
+        self._revalidating: Dict[str, asyncio.Task] = {}
+
+    def route_stats(self, route: str) -> RouteStats:
+        return self.stats.setdefault(route, RouteStats())
+
+    def _evicted(self, key: str, entry: CachedResponse) -> None:
+        self.route_stats(key.partition("?")[0]).evictions += 1
+
+    def _client(self):
+        """사용할 수 있는 Redis 클라이언트 (L2를 쓰지 않으면 None)"""
+        if aioredis is None or not self.redis_url:
+            return None
+        if time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            self._redis = aioredis.from_url(
+                self.redis_url,
+                socket_timeout=REDIS_TIMEOUT,
+                socket_connect_timeout=REDIS_TIMEOUT,
+            )
+        return self._redis
+
+    def _redis_failed(self, route: Optional[str] = None) -> None:
+        logger.warning("response cache: redis unavailable, serving from L1/DB", exc_info=True)
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_AFTER
+        if route is not None:
+            self.route_stats(route).l2_errors += 1
+
+    @property
+    def redis_enabled(self) -> bool:
+        return self._client() is not None
+
+    def key(self, route: str, params: Dict[str, Any]) -> str:
+        """요청 파라미터에 해당하는 캐시 키 (검증자는 키가 아니라 항목에 저장)"""
+        return cache_key(route, params)
+
+    async def get(self, route: str, key: str) -> Optional[Tuple[CachedResponse, str]]:
+        """(항목, 출처 "HIT-L1"/"HIT-L2"), 없으면 None"""
+        stats = self.route_stats(route)
+        entry = self.local.get(key)
+        if entry is not None:
+            stats.l1_hits += 1
+            return entry, "HIT-L1"
+
+        client = self._client()
+        if client is not None:
+            try:
+                raw, marker = await client.mget([KEY_PREFIX + key, STALE_PREFIX + key])
+            except Exception:
+                self._redis_failed(route)
+                raw = None
+            if raw is not None:
+                entry = CachedResponse.decode(raw)
+                entry.stale = marker is not None
+                self.local.set(key, entry)
+                stats.l2_hits += 1
+                return entry, "HIT-L2"
+
+        stats.misses += 1
+        return None
+
+    async def get_many(self, route: str, keys: Iterable[str]) -> Dict[str, CachedResponse]:
+        """
+        여러 항목을 한 번에 조회 (L1에 없는 키는 Redis MGET 한 번), 찾은 항목만 반환
+        """
+        stats = self.route_stats(route)
+        found: Dict[str, CachedResponse] = {}
+        remaining: List[str] = []
+        for key in keys:
+            entry = self.local.get(key)
+            if entry is not None:
+                stats.l1_hits += 1
+                found[key] = entry
+            else:
+                remaining.append(key)
+
+        client = self._client()
+        if client is not None and remaining:
+            try:
+                raws = await client.mget(
+                    [prefix + key for key in remaining for prefix in (KEY_PREFIX, STALE_PREFIX)]
+                )
+            except Exception:
+                self._redis_failed(route)
+                raws = [None] * (2 * len(remaining))
+            for key, raw, marker in zip(remaining, raws[::2], raws[1::2]):
+                if raw is not None:
+                    entry = CachedResponse.decode(raw)
+                    entry.stale = marker is not None
+                    self.local.set(key, entry)
+                    stats.l2_hits += 1
+                    found[key] = entry
+
+        stats.misses += sum(1 for key in remaining if key not in found)
+        return found
+
+    async def set(self, route: str, key: str, entry: CachedResponse) -> None:
+        await self.set_many(route, {key: entry})
+
+    async def set_many(self, route: str, entries: Dict[str, CachedResponse]) -> None:
+        """여러 항목 저장 (L2는 파이프라인 한 번)"""
+        for key, entry in entries.items():
+            self.local.set(key, entry)
+        client = self._client()
+        if client is None or not entries:
+            return
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for key, entry in entries.items():
+                    pipe.set(KEY_PREFIX + key, entry.encode(), ex=self.ttl)
+                    pipe.delete(STALE_PREFIX + key)
+                    for tag in entry.tags:
+                        pipe.sadd(TAG_PREFIX + tag, key)
+                        pipe.expire(TAG_PREFIX + tag, self.ttl)
+                await pipe.execute()
+        except Exception:
+            self._redis_failed(route)
+
+    def purge(self, *tags: str) -> None:
+        """
+        태그가 붙은 항목을 오래된 것으로 표시 (지우지 않고 갱신될 때까지 계속 응답에 사용)
+        L1은 즉시, L2는 요청 처리를 기다리게 하지 않도록 백그라운드에서 표시한다.
+        """
+        targets = set(tags)
+        for key, entry in self.local.items():
+            if targets.intersection(entry.tags):
+                entry.stale = True
+
+        if self._client() is None:
+            return
+        task = asyncio.create_task(self._mark_stale_l2(targets))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _mark_stale_l2(self, tags: Set[str]) -> None:
+        client = self._client()
+        if client is None:
+            return
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.smembers(TAG_PREFIX + tag)
+                members = await pipe.execute()
+            keys = {key.decode("utf-8") for group in members for key in group}
+            if not keys:
+                return
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(STALE_PREFIX + key, b"1", ex=self.ttl)
+                await pipe.execute()
+        except Exception:
+            self._redis_failed()
+
+    def revalidate(self, key: str, refresh: Callable[[Any], Awaitable[Any]]) -> None:
+        """
+        오래된 항목을 백그라운드에서 새로 계산 (키마다 동시에 하나만)
+        refresh: 새 DB 세션을 받아 캐시 엔드포인트를 refreshing() 안에서 다시 호출하는 함수
+        """
+        running = self._revalidating.get(key)
+        if running is not None and not running.done():
+            return
+        task = asyncio.create_task(self._revalidate(key, refresh))
+        self._revalidating[key] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _revalidate(self, key: str, refresh: Callable[[Any], Awaitable[Any]]) -> None:
+        from app.db.session import SessionLocal
+
+        try:
+            async with SessionLocal() as session:
+                with self.refreshing():
+                    await refresh(session)
+        except Exception:
+            logger.exception("response cache: background refresh failed for %s", key)
+        finally:
+            if self._revalidating.get(key) is asyncio.current_task():
+                del self._revalidating[key]
+
+    async def wait(self) -> None:
+        """진행 중인 L2 표시/백그라운드 갱신이 끝날 때까지 대기"""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    @contextlib.contextmanager
+    def refreshing(self) -> Iterator[None]:
+        """
+        블록 안에서 호출한 캐시 엔드포인트는 저장된 항목 대신 새로 계산한 응답으로 덮어쓴다.
+        (예열 작업용: 갱신하는 동안 다른 요청은 기존 항목을 그대로 받음)
+        """
+        token = _refreshing.set(True)
+        try:
+            yield
+        finally:
+            _refreshing.reset(token)
+
+    def cached(self, route: str, response_model: Any, tags: TagsFunc) -> Callable:
+        """
+        엔드포인트 응답 캐시 데코레이터 (라우터 데코레이터 아래에 둔다)
+
+        캐시가 없으면 엔드포인트를 실행하고 response_model 형태로 인코딩한 본문을 저장한다. (app.core.serialization)
+        엔드포인트가 Response를 직접 돌려주면 그 본문을 그대로 저장한다.
+        오래된 항목은 그대로 응답하고 백그라운드에서 갱신한다.
+        X-Cache 헤더로 HIT-L1 / HIT-L2 / STALE / MISS를 알려준다.
+        """
+        encoder = json_encoder(response_model)
+
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                params = request_params(kwargs)
+                key = self.key(route, params)
+                # HTTP 캐시 미들웨어가 계산한 현재 검증자 (항목과 다르면 다른 워커에서 바뀐 것)
+                validator = current_validator.get()
+                hit = None if _refreshing.get() else await self.get(route, key)
+                if hit is not None:
+                    entry, source = hit
+                    if entry.is_fresh(validator):
+                        return entry.response(source)
+                    self.route_stats(route).stale_hits += 1
+                    self.revalidate(key, functools.partial(self._refresh, wrapper, kwargs, validator))
+                    return entry.response("STALE")
+
+                result = await func(*args, **kwargs)
+                if isinstance(result, Response):
+                    content = None
+                    body = result.body
+                    headers = dict(result.headers)
+                else:
+                    content = result
+                    body = encoder(result)
+                    # 엔드포인트가 주입받은 Response에 설정한 헤더 (X-Next-Cursor 등)
+                    headers = {}
+                    for value in kwargs.values():
+                        if isinstance(value, Response):
+                            headers.update(value.headers)
+
+                entry = CachedResponse(
+                    body=body,
+                    headers={
+                        name: value for name, value in headers.items()
+                        if name.lower() not in SKIPPED_HEADERS
+                    },
+                    tags=tuple(dict.fromkeys(tags(params, content))),
+                    validator=validator,
+                )
+                await self.set(route, key, entry)
+                return entry.response("MISS")
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    async def _refresh(
+        wrapper: Callable, kwargs: Dict[str, Any], validator: Optional[str], db: Any
+    ) -> None:
+        token = current_validator.set(validator)
+        try:
+            await wrapper(**fresh_arguments(kwargs, db))
+        finally:
+            current_validator.reset(token)
+
+
+response_cache = ResponseCache(
+    redis_url=settings.REDIS_URL,
+    ttl=settings.RESPONSE_CACHE_TTL,
+    l1_ttl=settings.RESPONSE_CACHE_L1_TTL,
+    l1_size=settings.RESPONSE_CACHE_L1_SIZE,
+)
@@ -0,0 +1,213 @@
+"""
+응답 스키마 기반 빠른 JSON 인코딩
+
+response_model로 검증(model_validate)한 뒤 다시 dump하는 대신, 스키마 필드 정의에서 한 번 만든
+변환 함수로 ORM 객체/행/dict에서 값을 바로 꺼내 JSON 값으로 만들고 orjson으로 인코딩한다.
+결과 바이트는 FastAPI 기본 경로(검증 -> model_dump(mode="json") -> encode_json)와 같다.
+
+- 키 순서/별칭/기본값(속성이 없을 때)은 pydantic과 같게 처리한다.
+- 값의 타입은 DB 컬럼 타입이 스키마와 맞는다고 보고 검증하지 않는다. (float 필드의 정수만 float으로 변환)
+  단, null이 될 수 없는 필드가 None이거나 필수 필드가 없으면 그 객체만 pydantic으로 검증해
+  기본 경로와 같은 ValidationError를 낸다.
+- 날짜/시간 등 나머지 타입은 해당 필드만 pydantic 직렬화기로 변환한다.
+- field/model serializer, computed field가 있는 스키마는 pydantic 경로를 그대로 쓴다.
+- dict 필드는 값을 그대로 쓴다. (그래프 좌표 등 정수/문자열만 담음)
+
+orjson이 없거나 orjson이 인코딩할 수 없는 값(64비트를 넘는 정수 등)이면 encode_json으로 인코딩한다.
+orjson은 1e-4 미만 float을 json과 다르게 표기하므로(1e-05 -> 0.00001) float 필드의 이런 값과
+NaN/Infinity는 json 표기 그대로 넣는다. (NaN/Infinity는 기본 경로처럼 ValueError)
+tests/test_serialization.py에서 사용 중인 스키마마다 기본 경로와 바이트 단위로 비교한다.
+"""
+import functools
+import math
+import typing
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+from app.core.payload import encode_json
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+# 값을 그대로 쓰는 타입
+PASSTHROUGH_TYPES = (str, int, bool, dict, Any)
+
+# 주입받은 Response에서 옮기지 않는 헤더 (본문에 맞게 새로 계산됨)
+SKIPPED_HEADERS = {"content-length", "content-type"}
+
+Converter = Optional[Callable[[Any], Any]]  # None이면 값을 그대로 사용
+
+_MISSING = object()
+
+
+class _JsonFloat(float):
+    """orjson 표기가 json과 다른 float (orjson은 default로 넘기고, json은 float과 같게 인코딩)"""
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, _JsonFloat):
+        return orjson.Fragment(encode_json(float(value)))
+    raise TypeError
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 값 인코딩 (encode_json과 같은 바이트)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=_default)
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    return encode_json(content)
+
+
+def _list_converter(item: Converter) -> Callable[[Any], Any]:
+    if item is None:
+        return list
+    return lambda values: [item(value) for value in values]
+
+
+def _optional_converter(inner: Converter) -> Converter:
+    if inner is None:
+        return None
+    return lambda value: None if value is None else inner(value)
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _float_value(value: Any) -> float:
+    value = float(value)
+    if value == 0.0 or 1e-4 <= abs(value) < math.inf:
+        return value
+    return _JsonFloat(value)
+
+
+def _is_nullable(annotation: Any) -> bool:
+    if annotation is Any or annotation is None or annotation is type(None):
+        return True
+    return typing.get_origin(annotation) is typing.Union and type(None) in typing.get_args(annotation)
+
+
+def _converter(annotation: Any) -> Converter:
+    """타입 주석 -> JSON 값 변환 함수"""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Union:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1 and len(args) == 2:
+            return _optional_converter(_converter(members[0]))
+    elif origin is list and len(args) == 1:
+        return _list_converter(_converter(args[0]))
+    elif origin is dict and args[1:] == (Any,):
+        return None
+    elif origin is None:
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            return _enum_value
+        if annotation in PASSTHROUGH_TYPES:
+            return None
+        if annotation is float:
+            return _float_value
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return model_converter(annotation)
+
+    adapter = TypeAdapter(annotation)
+    return functools.partial(adapter.dump_python, mode="json")
+
+
+def _has_custom_serialization(model: Type[BaseModel]) -> bool:
+    decorators = model.__pydantic_decorators__
+    return bool(
+        decorators.field_serializers
+        or decorators.model_serializers
+        or decorators.computed_fields
+    )
+
+
+@lru_cache(maxsize=None)
+def model_converter(model: Type[BaseModel]) -> Callable[[Any], Dict[str, Any]]:
+    """
+    스키마 인스턴스로 검증할 수 있는 객체(ORM 객체, 행, dict, 스키마 인스턴스) -> JSON 값 dict
+    """
+    adapter = TypeAdapter(model)
+
+    def validated(obj: Any) -> Dict[str, Any]:
+        return adapter.dump_python(adapter.validate_python(obj, from_attributes=True), mode="json")
+
+    if _has_custom_serialization(model):
+        return validated
+
+    # (응답 키, 속성 이름, 기본값, null 허용, 변환 함수)
+    fields: List[Tuple[str, str, Any, bool, Converter]] = []
+    for name, field in model.model_fields.items():
+        if field.exclude:
+            continue
+        if field.default is not PydanticUndefined:
+            default = field.default
+        elif field.default_factory is not None:
+            default = field.default_factory()
+        else:
+            default = _MISSING
+        key = field.serialization_alias or field.alias or name
+        nullable = _is_nullable(field.annotation)
+        fields.append((key, name, default, nullable, _converter(field.annotation)))
+
+    def convert(obj: Any) -> Dict[str, Any]:
+        get = obj.get if isinstance(obj, dict) else functools.partial(getattr, obj)
+        result = {}
+        for key, name, default, nullable, conv in fields:
+            value = get(name, default)
+            if value is _MISSING or (value is None and not nullable):
+                # 기본 경로와 같은 검증 오류를 내도록 pydantic으로 검증
+                return validated(obj)
+            result[key] = value if conv is None else conv(value)
+        return result
+
+    return convert
+
+
+@lru_cache(maxsize=256)
+def json_encoder(response_model: Any) -> Callable[[Any], bytes]:
+    """response_model 형태의 엔드포인트 반환값 -> JSON 본문"""
+    conv = _converter(response_model)
+    if conv is None:
+        return dumps
+    return lambda content: dumps(conv(content))
+
+
+def fast_json(response_model: Any) -> Callable:
+    """
+    엔드포인트 반환값을 response_model 재검증 없이 인코딩하는 데코레이터 (라우터 데코레이터 아래에 둔다)
+
+    OpenAPI 문서는 라우터의 response_model을 그대로 사용한다.
+    엔드포인트가 Response를 직접 돌려주면(fields= 선택 등) 그대로 보내고,
+    주입받은 Response에 설정한 헤더(X-Next-Cursor 등)는 응답에 옮겨 붙인다.
+    """
+    encoder = json_encoder(response_model)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = await func(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+            headers = {}
+            for value in kwargs.values():
+                if isinstance(value, Response):
+                    headers.update(
+                        (name, header) for name, header in value.headers.items()
+                        if name not in SKIPPED_HEADERS
+                    )
+            return Response(content=encoder(result), media_type="application/json", headers=headers)
+
+        return wrapper
+
+    return decorator
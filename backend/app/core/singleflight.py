@@ -0,0 +1,161 @@
+"""
+동일한 동시 요청 합치기 (single flight)
+
+같은 키의 호출이 진행 중이면 새로 실행하지 않고 먼저 시작한 호출(리더)의 결과를 함께 기다린다.
+캐시가 비었을 때 수백 개의 같은 요청이 같은 무거운 쿼리를 동시에 실행해 커넥션 풀을 소진하는 것을 막는다.
+
+- 결과/예외는 기다리던 모든 호출에 그대로 전달하고, 끝나면 키를 지우므로 실패가 이후 호출에 남지 않는다.
+- 리더는 자신의 요청에서 직접 실행하고(리더의 세션/의존성 사용), 기다리는 쪽에만 제한 시간을 둔다.
+- 리더 요청이 취소되면(클라이언트 연결 종료 등) 기다리던 호출 중 하나가 새 리더가 되어 다시 실행한다.
+"""
+import asyncio
+import functools
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Request, Response
+
+from app.core.response_cache import cache_key, request_params
+
+# 리더를 기다리는 최대 시간 (초)
+DEFAULT_WAIT_TIMEOUT = 10.0
+
+
+class WaitTimeout(Exception):
+    """리더의 결과를 제한 시간 안에 받지 못함"""
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0  # 리더 결과를 받아 간 호출 수
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = DEFAULT_WAIT_TIMEOUT,
+    ) -> Any:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를, 없으면 func()를 실행한 결과를 돌려준다.
+        기다리는 쪽이 timeout을 넘기면 WaitTimeout (리더의 실행은 계속됨)
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                return await self._lead(key, func)
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    # 리더가 취소됨: 이 호출이 다시 실행
+                    continue
+                raise
+            except asyncio.TimeoutError:
+                if not future.done():
+                    raise WaitTimeout(key)
+                raise
+            self.coalesced += 1
+            return result
+
+    async def _lead(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # 기다리는 호출이 없어도 "exception was never retrieved" 경고가 나지 않도록
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+
+single_flight = SingleFlight()
+
+
+@dataclass(frozen=True)
+class SharedResponse:
+    """
+    리더가 만든 Response의 본문/상태/헤더
+
+    Response 객체는 미들웨어가 헤더를 덧붙이는 등 요청마다 바뀌므로 호출마다 새로 만든다.
+    """
+    body: bytes
+    status_code: int
+    raw_headers: Tuple[Tuple[bytes, bytes], ...]
+
+    @classmethod
+    def capture(cls, response: Response) -> "SharedResponse":
+        return cls(response.body, response.status_code, tuple(response.raw_headers))
+
+    def response(self) -> Response:
+        response = Response(content=self.body, status_code=self.status_code)
+        response.raw_headers = list(self.raw_headers)
+        return response
+
+
+async def _shareable(func: Callable[[], Awaitable[Any]]) -> Any:
+    """본문이 정해진 Response는 SharedResponse로 바꿔 공유 (스트리밍 응답 등은 그대로)"""
+    result = await func()
+    if isinstance(result, Response) and isinstance(getattr(result, "body", None), bytes):
+        return SharedResponse.capture(result)
+    return result
+
+
+def coalesce(
+    route: str,
+    vary: Sequence[str] = (),
+    timeout: Optional[float] = DEFAULT_WAIT_TIMEOUT,
+    flight: SingleFlight = single_flight,
+) -> Callable:
+    """
+    엔드포인트용 single flight 데코레이터 (라우터 데코레이터 바로 아래에 둔다)
+
+    키: 라우트 + 요청 파라미터 + 사용자(current_user 인자, 없으면 익명) + vary에 지정한 요청 헤더
+    (응답이 Accept-Encoding/If-None-Match 등에 따라 달라지는 엔드포인트는 vary에 지정)
+    기다리는 요청이 timeout을 넘기면 503으로 응답한다.
+    리더가 Response를 돌려주면 본문/상태/헤더만 공유하고 호출마다 새 Response를 만든다.
+    그 밖의 반환값은 그대로 공유하므로, 주입받은 Response에 헤더를 쓰는 엔드포인트는
+    응답 캐시 데코레이터와 함께(그 바깥에) 사용한다.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            user = kwargs.get("current_user")
+            params = {
+                **request_params(kwargs),
+                "_user": getattr(user, "id", "anonymous"),
+            }
+            request = next((value for value in kwargs.values() if isinstance(value, Request)), None)
+            if request is not None:
+                for header in vary:
+                    params[f"_{header.lower()}"] = request.headers.get(header, "")
+            key = cache_key(route, params)
+
+            try:
+                result = await flight.do(key, lambda: _shareable(lambda: func(*args, **kwargs)), timeout)
+            except WaitTimeout:
+                raise HTTPException(
+                    status_code=503,
+                    detail="같은 요청을 처리하는 중입니다. 잠시 후 다시 시도해 주세요",
+                    headers={"Retry-After": "1"},
+                )
+            if isinstance(result, SharedResponse):
+                return result.response()
+            return result
+
+        return wrapper
+
+    return decorator
@@ -2,5 +2,6 @@
 # imported by Alembic
 from app.db.base_class import Base
 from app.models.user import User, UserCertification, UserGoal
-from app.models.certification import Certification, ExamSchedule
+from app.models.certification import Certification, CertificationFacet, ExamSchedule, GraphLayout
 from app.models.career import CareerPath, Requirement
+from app.models.change_stamp import ChangeStamp
@@ -0,0 +1,54 @@
+"""
+관리자 목록의 전체 개수
+
+- 필터가 없으면 플래너 통계(pg_class.reltuples)의 추정치를 사용 (테이블이 작거나 통계가 없으면 정확히 계산)
+- 필터가 있으면 정확히 세되, 같은 필터에 대해서는 잠시 캐시
+"""
+from typing import Hashable, Tuple
+
+from sqlalchemy import func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.cache import TTLCache
+
+COUNT_CACHE_TTL = 30  # 초
+# 추정치가 이보다 작으면 정확히 세도 충분히 빠름
+ESTIMATE_MIN_ROWS = 10000
+
+count_cache = TTLCache(ttl=COUNT_CACHE_TTL, maxsize=1024)
+
+
+async def estimated_count(db: AsyncSession, table_name: str) -> int:
+    """플래너 통계의 행 수 추정치 (ANALYZE 전이면 -1)"""
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(quote_ident(:table_name))"),
+        {"table_name": table_name},
+    )
+    estimate = result.scalar()
+    return -1 if estimate is None else estimate
+
+
+async def exact_count(db: AsyncSession, query, key: Hashable) -> int:
+    """정확한 개수 (key별로 COUNT_CACHE_TTL 동안 캐시)"""
+    total = count_cache.get(key)
+    if total is None:
+        result = await db.execute(select(func.count()).select_from(query.order_by(None).subquery()))
+        total = result.scalar() or 0
+        count_cache.set(key, total)
+    return total
+
+
+async def list_total(
+    db: AsyncSession, query, table_name: str, filters: Tuple[Hashable, ...]
+) -> Tuple[int, bool]:
+    """
+    목록 전체 개수
+    filters: 적용된 필터 값 (모두 비어 있으면 필터 없음으로 간주)
+    반환: (개수, 추정치 여부)
+    """
+    if not any(filters):
+        estimate = await estimated_count(db, table_name)
+        if estimate >= ESTIMATE_MIN_ROWS:
+            return estimate, True
+    return await exact_count(db, query, (table_name, *filters)), False
@@ -0,0 +1,97 @@
+"""
+PostgreSQL 전문 검색 (tsvector 생성 컬럼 + GIN 인덱스)
+
+한국어는 띄어쓰기 단위가 검색 단위와 맞지 않으므로 (예: "전기안전관리자"를 "전기 안전"으로 검색)
+기본적으로 문서와 검색어 모두 2글자 n-gram으로 쪼개 색인/검색한다.
+SEARCH_TOKENIZER=parser로 설정하면 SEARCH_TS_CONFIG의 파서를 그대로 사용한다.
+"""
+from enum import Enum
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy import DDL, Index, cast, event, func, or_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import settings
+from app.db.base_class import Base
+
+NGRAM_FUNCTION = "korean_ngrams"
+
+# n-gram 검색에서 이보다 짧은 검색어는 부분 문자열 검색으로 대체
+MIN_NGRAM_QUERY_LENGTH = 2
+
+# 생성 컬럼에서 쓰려면 IMMUTABLE이어야 한다
+KOREAN_NGRAMS_DDL = DDL(f"""
+CREATE OR REPLACE FUNCTION {NGRAM_FUNCTION}(input text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT coalesce(string_agg(substr(word, i, 2), ' '), '')
+    FROM regexp_split_to_table(lower(coalesce(input, '')), '[^[:alnum:]가-힣]+') AS word,
+         generate_series(1, greatest(length(word) - 1, 1)) AS i
+    WHERE word <> ''
+$$
+""")
+
+# 관리자 목록의 부분 문자열 검색(ILIKE '%...%')용 trigram 인덱스
+PG_TRGM_DDL = DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+# create_all로 테이블을 만들기 전에 함수/확장부터 생성
+event.listen(Base.metadata, "before_create", KOREAN_NGRAMS_DDL)
+event.listen(Base.metadata, "before_create", PG_TRGM_DDL)
+
+
+class SearchMode(str, Enum):
+    fulltext = "fulltext"  # 전문 검색 (관련도 순)
+    contains = "contains"  # 이름 부분 일치 (기존 방식)
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """ILIKE 부분 일치 검색용 GIN trigram 인덱스"""
+    return Index(name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+
+
+def _uses_ngrams() -> bool:
+    return settings.SEARCH_TOKENIZER == "ngram"
+
+
+def document_expression(*weighted_columns: Tuple[str, str]) -> str:
+    """
+    생성 컬럼 정의용 SQL 식
+    weighted_columns: (컬럼 이름, 가중치 A~D) 목록
+    """
+    config = settings.SEARCH_TS_CONFIG
+    parts = []
+    for column, weight in weighted_columns:
+        text = f"coalesce({column}, '')"
+        if _uses_ngrams():
+            text = f"{NGRAM_FUNCTION}({text})"
+        parts.append(f"setweight(to_tsvector('{config}'::regconfig, {text}), '{weight}')")
+    return " || ".join(parts)
+
+
+def search_query(search: str) -> ColumnElement:
+    """검색어 -> tsquery (n-gram 모드에서는 모든 조각이 포함되어야 일치)"""
+    config = cast(settings.SEARCH_TS_CONFIG, REGCONFIG)
+    if _uses_ngrams():
+        return func.plainto_tsquery(config, getattr(func, NGRAM_FUNCTION)(search))
+    return func.websearch_to_tsquery(config, search)
+
+
+def search_condition(
+    search: str,
+    vector: ColumnElement,
+    contains_columns: Sequence[ColumnElement],
+    mode: SearchMode = SearchMode.fulltext,
+) -> Tuple[ColumnElement, Optional[ColumnElement]]:
+    """
+    검색 조건과 관련도 식
+    반환: (where 조건, ts_rank 식 또는 None)
+    부분 문자열 검색이거나 n-gram으로 쪼갤 수 없는 짧은 검색어면 관련도는 None
+    """
+    search = search.strip()
+    if mode == SearchMode.contains or (
+        _uses_ngrams() and len(search) < MIN_NGRAM_QUERY_LENGTH
+    ):
+        return or_(*(column.ilike(f"%{search}%") for column in contains_columns)), None
+
+    query = search_query(search)
+    return vector.op("@@")(query), func.ts_rank(vector, query)
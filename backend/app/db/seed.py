@@ -9,6 +9,8 @@ from app.models.career import CareerPath, Requirement
 from app.models.user import User
 from app.core.security import get_password_hash
 from app.core.config import settings
+from app.services.closure import rebuild_closure
+from app.services.facets import rebuild_facets
 
 # 자격증 데이터
 CERTIFICATIONS = [
@@ -413,6 +415,15 @@ async def seed_database():
                 )
                 session.add(requirement)
 
+        # 6. 선수 관계 폐쇄 테이블 생성
+        print("Building prerequisite closure...")
+        await session.flush()
+        await rebuild_closure(session)
+
+        # 7. 패싯 카운터 생성
+        print("Counting facets...")
+        await rebuild_facets(session)
+
         await session.commit()
         print("Seed completed successfully!")
 
@@ -8,3 +8,7 @@ SessionLocal = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 async def get_db():
     async with SessionLocal() as session:
         yield session
+
+
+# 변경 스탬프 세션 이벤트 등록
+from app.db import stamps  # noqa: E402, F401
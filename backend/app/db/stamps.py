@@ -0,0 +1,127 @@
+"""
+테이블 변경 스탬프 (change_stamp)
+
+STAMPED_TABLES의 행을 추가/수정/삭제한 flush마다 같은 트랜잭션 안에서 해당 테이블의 버전을 올린다.
+(ORM 세션 이벤트로 처리하므로 엔드포인트마다 따로 호출하지 않음)
+ORM 객체를 거치지 않는 Core insert/update/delete는 bump_stamps()로 직접 올린다. (graph_layout 등)
+조회 쪽은 워커별로 STAMP_CACHE_TTL초 동안 캐시하고, 이 워커에서 커밋한 변경은 즉시 반영한다.
+이 워커에서 커밋한 마지막 버전은 committed_version()으로 확인할 수 있다. (커밋 직후 후처리용)
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy import event, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.singleflight import single_flight
+from app.models.change_stamp import ChangeStamp
+
+# 공개 조회 응답에 영향을 주는 테이블 (선수 관계 변경은 자격증 행 변경으로 잡힘)
+STAMPED_TABLES = frozenset({"certification", "careerpath", "requirement", "graph_layout"})
+
+STAMP_CACHE_TTL = 1.0
+
+_VERSIONS_KEY = "change_stamp_versions"
+
+_cache = TTLCache(ttl=STAMP_CACHE_TTL, maxsize=1)
+
+# 이 워커에서 커밋한 테이블별 마지막 버전
+_committed: Dict[str, int] = {}
+
+
+@dataclass(frozen=True)
+class Stamp:
+    version: int
+    changed_at: Optional[datetime]
+
+
+EMPTY_STAMP = Stamp(version=0, changed_at=None)
+
+
+def _changed_tables(session: Session) -> Set[str]:
+    tables = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None and table.name in STAMPED_TABLES:
+            tables.add(table.name)
+    return tables
+
+
+def _bump_statement(tables: Iterable[str]):
+    stmt = insert(ChangeStamp).values(
+        [{"table_name": name, "version": 1} for name in sorted(tables)]
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[ChangeStamp.table_name],
+        set_={"version": ChangeStamp.version + 1, "changed_at": func.now()},
+    ).returning(ChangeStamp.table_name, ChangeStamp.version)
+
+
+def _record(session: Session, rows) -> Dict[str, int]:
+    bumped = dict(rows)
+    session.info.setdefault(_VERSIONS_KEY, {}).update(bumped)
+    return bumped
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_stamps(session: Session, flush_context) -> None:
+    tables = _changed_tables(session)
+    if not tables:
+        return
+    _record(session, session.connection().execute(_bump_statement(tables)).all())
+
+
+async def bump_stamps(db: AsyncSession, *tables: str) -> Dict[str, int]:
+    """
+    ORM 행 변경으로 잡히지 않는 쓰기의 테이블 버전을 올림 (커밋 전에 같은 트랜잭션에서 호출)
+    반환: 테이블 이름 -> 새 버전 (커밋되면 committed_version()에도 반영)
+    """
+    result = await db.execute(_bump_statement(tables))
+    return _record(db.sync_session, result.all())
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_after_commit(session: Session) -> None:
+    versions = session.info.pop(_VERSIONS_KEY, None)
+    if versions:
+        for name, version in versions.items():
+            _committed[name] = max(version, _committed.get(name, 0))
+        _cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_after_rollback(session: Session) -> None:
+    session.info.pop(_VERSIONS_KEY, None)
+
+
+def committed_version(table: str) -> Optional[int]:
+    """이 워커에서 마지막으로 커밋한 테이블 버전 (없으면 None)"""
+    return _committed.get(table)
+
+
+async def _load_stamps() -> Dict[str, Stamp]:
+    from app.db.session import SessionLocal
+
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(ChangeStamp.table_name, ChangeStamp.version, ChangeStamp.changed_at)
+        )
+        return {
+            name: Stamp(version=version, changed_at=changed_at)
+            for name, version, changed_at in result.all()
+        }
+
+
+async def current_stamps() -> Dict[str, Stamp]:
+    """테이블 이름 -> 스탬프 (한 번도 바뀌지 않은 테이블은 없음)"""
+    stamps = _cache.get("all")
+    if stamps is None:
+        stamps = await single_flight.do("change_stamps", _load_stamps, timeout=None)
+        _cache.set("all", stamps)
+    return stamps
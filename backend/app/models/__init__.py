@@ -1,3 +1,4 @@
 from app.models.user import User
-from app.models.certification import Certification, ExamSchedule
+from app.models.certification import Certification, CertificationFacet, ExamSchedule, GraphLayout
 from app.models.career import CareerPath, Requirement
+from app.models.change_stamp import ChangeStamp
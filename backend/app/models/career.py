@@ -1,12 +1,25 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Integer, String, ForeignKey, Text, Boolean, Index, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from app.db.base_class import Base
+from app.db.search import document_expression, trigram_index
 
 
 class CareerPath(Base):
     """
     커리어 패스 (직업 또는 창업) 모델
     """
+    __table_args__ = (
+        Index('ix_careerpath_search_vector', 'search_vector', postgresql_using='gin'),
+        # 관리자 목록 부분 일치 검색
+        trigram_index('ix_careerpath_name_trgm', 'name'),
+        # 커서 페이지네이션 (name, id 순)
+        Index('ix_careerpath_listing', 'name', 'id'),
+        Index('ix_careerpath_type_listing', 'type', 'name', 'id'),
+        # 활성 커리어만 조회하는 검색/자동완성
+        Index('ix_careerpath_active_name', 'name', 'id', postgresql_where=text('is_active')),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True, nullable=False)  # 이름 (예: 전기안전관리자, 인력사무소)
     type = Column(String, index=True)  # 유형 (job 또는 startup)
@@ -16,6 +29,19 @@ class CareerPath(Base):
     growth_potential = Column(String)  # 성장 가능성 (높음, 보통, 낮음)
     is_active = Column(Boolean, default=True)  # 활성 상태
 
+    # 전문 검색용 문서 (이름 > 분야 > 설명 순 가중치)
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            document_expression(
+                ("name", "A"),
+                ("category", "B"),
+                ("description", "C"),
+            ),
+            persisted=True,
+        ),
+    ))
+
     requirements = relationship("Requirement", back_populates="career_path", cascade="all, delete-orphan")
 
 
@@ -24,8 +50,8 @@ class Requirement(Base):
     요구사항 모델 (커리어와 자격증 연결)
     """
     id = Column(Integer, primary_key=True, index=True)
-    career_path_id = Column(Integer, ForeignKey('careerpath.id'))
-    certification_id = Column(Integer, ForeignKey('certification.id'), nullable=True)
+    career_path_id = Column(Integer, ForeignKey('careerpath.id'), index=True)
+    certification_id = Column(Integer, ForeignKey('certification.id'), nullable=True, index=True)
     description = Column(Text)  # 법적 요건 텍스트 설명
     is_mandatory = Column(Boolean, default=False)  # 필수 여부
 
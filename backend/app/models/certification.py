@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table, Date, Text, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Integer, String, ForeignKey, Table, Date, Text, Boolean, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from app.db.base_class import Base
+from app.db.search import document_expression, trigram_index
 
 # 선수 자격증 관계를 위한 연결 테이블 (Self-referential Many-to-Many)
 certification_prerequisites = Table(
@@ -10,11 +12,28 @@ certification_prerequisites = Table(
     Column('prerequisite_id', Integer, ForeignKey('certification.id'), primary_key=True)
 )
 
+# 선수 관계 전이 폐쇄 테이블 (활성 자격증 기준, 자기 자신은 depth=0)
+certification_closure = Table(
+    'certification_closure',
+    Base.metadata,
+    Column('ancestor_id', Integer, ForeignKey('certification.id', ondelete="CASCADE"), primary_key=True),
+    Column('descendant_id', Integer, ForeignKey('certification.id', ondelete="CASCADE"), primary_key=True),
+    Column('depth', Integer, nullable=False),  # 최단 경로 길이
+    Index('ix_certification_closure_descendant', 'descendant_id', 'ancestor_id'),
+)
+
 
 class Certification(Base):
     """
     자격증 정보 모델
     """
+    __table_args__ = (
+        Index('ix_certification_search_vector', 'search_vector', postgresql_using='gin'),
+        # 관리자 목록 부분 일치 검색
+        trigram_index('ix_certification_name_trgm', 'name'),
+        trigram_index('ix_certification_code_trgm', 'code'),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True, nullable=False)  # 자격증 이름 (예: 정보처리기사)
     code = Column(String, unique=True, index=True)  # 자격증 코드
@@ -39,6 +58,20 @@ class Certification(Base):
 
     is_active = Column(Boolean, default=True)  # 활성 상태
 
+    # 전문 검색용 문서 (이름 > 설명 > 응시 자격/시험 과목 순 가중치)
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            document_expression(
+                ("name", "A"),
+                ("description", "B"),
+                ("eligibility", "C"),
+                ("subjects", "C"),
+            ),
+            persisted=True,
+        ),
+    ))
+
     # 테크트리를 위한 자기 참조 관계
     prerequisites = relationship(
         'Certification',
@@ -49,12 +82,33 @@ class Certification(Base):
     )
 
 
+# 목록 조회 정렬 순서 (level_order desc, name, id)용 커서 페이지네이션 인덱스
+Index(
+    'ix_certification_listing',
+    func.coalesce(Certification.level_order, 0).desc(),
+    Certification.name,
+    Certification.id,
+    postgresql_where=Certification.is_active == True,
+)
+
+# 카테고리 필터 + 목록 정렬 (CertificationSimple 컬럼을 포함해 인덱스만으로 응답)
+Index(
+    'ix_certification_category_listing',
+    Certification.category_main,
+    func.coalesce(Certification.level_order, 0).desc(),
+    Certification.name,
+    Certification.id,
+    postgresql_include=['code', 'category_sub', 'level', 'level_order'],
+    postgresql_where=Certification.is_active == True,
+)
+
+
 class ExamSchedule(Base):
     """
     시험 일정 모델
     """
     id = Column(Integer, primary_key=True, index=True)
-    certification_id = Column(Integer, ForeignKey('certification.id'))
+    certification_id = Column(Integer, ForeignKey('certification.id'), index=True)
     round_name = Column(String)  # 회차 명 (예: 2024년 정기 기사 1회)
     application_start_date = Column(Date)  # 원서 접수 시작일
     application_end_date = Column(Date)  # 원서 접수 마감일
@@ -62,3 +116,29 @@ class ExamSchedule(Base):
     result_announcement_date = Column(Date)  # 합격자 발표일
 
     certification = relationship("Certification", backref="schedules")
+
+
+class GraphLayout(Base):
+    """
+    테크트리 노드 좌표 (카테고리별로 저장, 카탈로그 변경 시 재계산)
+    """
+    __tablename__ = "graph_layout"
+
+    certification_id = Column(Integer, ForeignKey("certification.id", ondelete="CASCADE"), primary_key=True)
+    category = Column(String, primary_key=True)  # 대분류 (전체 그래프는 "*")
+    x = Column(Integer, nullable=False)
+    y = Column(Integer, nullable=False)
+    layout_version = Column(Integer, nullable=False, default=0)  # 계산된 레이아웃 버전
+    is_pinned = Column(Boolean, default=False)  # 관리자가 고정한 위치 (재계산 시 유지)
+
+
+class CertificationFacet(Base):
+    """
+    활성 자격증의 패싯 값별 개수 (자격증 생성/수정/비활성화 시 같은 트랜잭션에서 증감)
+    """
+    __tablename__ = "certification_facet"
+
+    facet = Column(String, primary_key=True)  # category_main, category_sub, level, issuer, fee_band
+    value = Column(String, primary_key=True)  # 값이 없으면 ""
+    parent = Column(String, primary_key=True, default="")  # category_sub의 대분류 (그 외 "")
+    count = Column(Integer, nullable=False, default=0)
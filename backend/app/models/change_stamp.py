@@ -0,0 +1,13 @@
+from sqlalchemy import BigInteger, Column, DateTime, String, func
+from app.db.base_class import Base
+
+
+class ChangeStamp(Base):
+    """
+    테이블별 변경 스탬프 (행이 바뀐 트랜잭션 안에서 버전 증가, HTTP 캐시 검증자 계산에 사용)
+    """
+    __tablename__ = "change_stamp"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    changed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
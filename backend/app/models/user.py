@@ -1,12 +1,19 @@
-from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
+from app.db.search import trigram_index
 
 
 class User(Base):
     """
     사용자 모델
     """
+    __table_args__ = (
+        # 관리자 사용자 검색 (이메일/이름 부분 일치)
+        trigram_index('ix_user_email_trgm', 'email'),
+        trigram_index('ix_user_full_name_trgm', 'full_name'),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)  # 이메일 (로그인 ID)
     hashed_password = Column(String, nullable=False)  # 해시된 비밀번호
@@ -24,6 +31,10 @@ class UserCertification(Base):
     사용자가 취득한 자격증
     """
     __tablename__ = "user_certifications"
+    __table_args__ = (
+        # 같은 자격증을 두 번 등록할 수 없음 (user_id로 시작하므로 사용자별 조회에도 사용)
+        UniqueConstraint('user_id', 'certification_id', name='uq_user_certifications_user_certification'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
@@ -42,6 +53,9 @@ class UserGoal(Base):
     사용자의 목표 자격증
     """
     __tablename__ = "user_goals"
+    __table_args__ = (
+        UniqueConstraint('user_id', 'certification_id', name='uq_user_goals_user_certification'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
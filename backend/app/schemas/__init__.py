@@ -4,11 +4,22 @@ from app.schemas.certification import (
     CertificationUpdate,
     CertificationSimple,
     CertificationDetail,
+    CertificationBatch,
+    CertificationTree,
+    CertificationTreeNode,
+    CertificationTreeEdge,
+    TreeDirection,
     GraphNode,
     GraphEdge,
     GraphData,
+    GraphVersion,
+    GraphLayoutPin,
+    TopologicalOrder,
     CategoryCount,
     CategoryTree,
+    FacetValue,
+    CategoryFacet,
+    CertificationFacets,
 )
 from app.schemas.career import (
     Career,
@@ -16,6 +27,7 @@ from app.schemas.career import (
     CareerUpdate,
     CareerSimple,
     CareerDetail,
+    CareerBatch,
     CareerType,
     Requirement,
     RequirementCreate,
@@ -30,3 +42,18 @@ from app.schemas.user import (
     LoginRequest,
     RegisterRequest,
 )
+from app.schemas.roadmap import (
+    Roadmap,
+    RoadmapStep,
+)
+from app.schemas.search import (
+    SearchKind,
+    SuggestItem,
+    SearchHit,
+    SearchGroup,
+    SearchResults,
+)
+from app.schemas.cache import (
+    CacheRouteStats,
+    CacheStats,
+)
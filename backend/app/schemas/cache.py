@@ -0,0 +1,20 @@
+from typing import List
+from pydantic import BaseModel
+
+
+class CacheRouteStats(BaseModel):
+    """라우트별 응답 캐시 통계 (워커 기동 이후 누적)"""
+    route: str
+    l1_hits: int
+    l2_hits: int
+    misses: int
+    stale_hits: int
+    evictions: int
+    l2_errors: int
+    hit_ratio: float
+
+
+class CacheStats(BaseModel):
+    redis_enabled: bool
+    l1_entries: int
+    routes: List[CacheRouteStats]
@@ -69,6 +69,12 @@ class Career(CareerBase):
         from_attributes = True
 
 
+class CareerBatch(BaseModel):
+    """ID 목록 일괄 조회 결과 (요청 순서 유지)"""
+    items: List[Career]
+    missing: List[int] = []
+
+
 class CareerDetail(Career):
     """상세 커리어 정보 (관련 자격증 포함)"""
     required_certifications: List["CertificationSimple"] = []
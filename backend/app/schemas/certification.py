@@ -1,4 +1,6 @@
 from typing import Optional, List
+from datetime import datetime
+from enum import Enum
 from pydantic import BaseModel
 
 
@@ -64,6 +66,36 @@ class Certification(CertificationBase):
         from_attributes = True
 
 
+class CertificationBatch(BaseModel):
+    """ID 목록 일괄 조회 결과 (요청 순서 유지)"""
+    items: List[Certification]
+    missing: List[int] = []
+
+
+class TreeDirection(str, Enum):
+    UP = "up"  # 선수 자격증 방향
+    DOWN = "down"  # 다음 단계 자격증 방향
+    BOTH = "both"
+
+
+class CertificationTreeNode(CertificationSimple):
+    """트리 탐색 결과 노드 (기준 자격증으로부터의 거리 포함)"""
+    depth: int
+
+
+class CertificationTreeEdge(BaseModel):
+    source: int  # 선수 자격증
+    target: int  # 자격증
+
+
+class CertificationTree(BaseModel):
+    """자격증 기준 상하위 전체 트리"""
+    root: CertificationSimple
+    ancestors: List[CertificationTreeNode] = []
+    descendants: List[CertificationTreeNode] = []
+    edges: List[CertificationTreeEdge] = []
+
+
 class CertificationDetail(Certification):
     """상세 자격증 정보 (관련 직업 포함)"""
     related_careers: List["CareerSimple"] = []
@@ -91,6 +123,27 @@ class GraphData(BaseModel):
     edges: List[GraphEdge]
 
 
+class GraphVersion(BaseModel):
+    """테크트리 스냅샷 버전 정보"""
+    version: int
+    built_at: datetime
+    nodes: int
+    edges: int
+
+
+class GraphLayoutPin(BaseModel):
+    """관리자가 고정할 노드 좌표 (category가 없으면 전체 그래프)"""
+    category: Optional[str] = None
+    x: int
+    y: int
+
+
+class TopologicalOrder(BaseModel):
+    """선수 자격증이 항상 먼저 오는 자격증 id 순서"""
+    version: int
+    order: List[int]
+
+
 # 카테고리
 class CategoryCount(BaseModel):
     name: str
@@ -103,6 +156,25 @@ class CategoryTree(BaseModel):
     total: int
 
 
+# 패싯
+class FacetValue(BaseModel):
+    value: Optional[str] = None  # 값이 없는 자격증은 null
+    count: int
+
+
+class CategoryFacet(FacetValue):
+    subs: List[FacetValue] = []
+
+
+class CertificationFacets(BaseModel):
+    """필터 조건에 맞는 활성 자격증의 패싯 값별 개수"""
+    total: int
+    categories: List[CategoryFacet]
+    levels: List[FacetValue]
+    issuers: List[FacetValue]
+    fee_bands: List[FacetValue]
+
+
 # Forward reference 해결
 from app.schemas.career import CareerSimple
 CertificationDetail.model_rebuild()
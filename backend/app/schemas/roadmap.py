@@ -0,0 +1,19 @@
+from typing import List
+from pydantic import BaseModel
+from app.schemas.certification import CertificationSimple
+
+
+class RoadmapStep(BaseModel):
+    """로드맵의 한 단계 (취득할 자격증)"""
+    certification: CertificationSimple
+    expected_attempts: float  # 기대 응시 횟수
+    expected_cost: int  # 기대 응시료
+
+
+class Roadmap(BaseModel):
+    """목표까지의 최저 비용 로드맵"""
+    targets: List[CertificationSimple]
+    reachable: bool = True
+    starting_from: List[CertificationSimple] = []  # 출발점이 된 취득 자격증
+    steps: List[RoadmapStep] = []
+    total_cost: int = 0
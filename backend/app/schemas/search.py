@@ -0,0 +1,49 @@
+from typing import List, Optional
+from enum import Enum
+from pydantic import BaseModel
+
+
+class SearchKind(str, Enum):
+    certification = "certification"
+    career = "career"
+
+
+class SuggestItem(BaseModel):
+    """자동완성 후보"""
+    kind: SearchKind
+    id: int
+    name: str
+    level: Optional[str] = None
+    category: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class SearchHit(BaseModel):
+    """통합 검색 결과 항목"""
+    kind: SearchKind
+    id: int
+    name: str
+    category: Optional[str] = None
+    level: Optional[str] = None  # 자격증 등급
+    career_type: Optional[str] = None  # 커리어 유형 (job/startup)
+    score: float
+
+    class Config:
+        from_attributes = True
+
+
+class SearchGroup(BaseModel):
+    """유형별 검색 결과"""
+    count: int  # 전체 일치 수
+    items: List[SearchHit]
+
+
+class SearchResults(BaseModel):
+    """자격증/커리어 통합 검색 결과"""
+    query: str
+    total: int
+    items: List[SearchHit]  # 유형 구분 없이 점수순 상위 결과
+    certifications: SearchGroup
+    careers: SearchGroup
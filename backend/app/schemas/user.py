@@ -107,3 +107,5 @@ class RegisterRequest(UserCreate):
 class UserList(BaseModel):
     items: List[User]
     total: int
+    total_is_estimate: bool = False  # True면 total은 통계 기반 추정치
+    next_cursor: Optional[str] = None
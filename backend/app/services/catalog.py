@@ -0,0 +1,85 @@
+"""
+카탈로그 변경 후처리
+
+자격증/선수 관계 변경이 커밋된 뒤 호출해 그래프 스냅샷과 저장된 레이아웃, 응답 캐시 등
+파생 데이터를 갱신하고 백그라운드 예열을 예약한다. (변경 엔드포인트마다 같은 처리를 반복하지 않도록 한곳에 모음)
+"""
+from typing import Iterable, Optional
+
+from app.core.response_cache import response_cache
+from app.db.counts import count_cache
+from app.services.graph import graph_store
+from app.services.graph_layout import layout_recomputer
+from app.services.suggest import suggest_store
+from app.services.warmer import cache_warmer
+
+# 응답 캐시 태그
+TAG_CERTIFICATIONS = "certifications"  # 대분류 필터가 없는 자격증 목록
+TAG_CATEGORIES = "categories"
+TAG_CAREERS = "careers"
+
+
+def certification_tag(certification_id: int) -> str:
+    return f"cert:{certification_id}"
+
+
+def category_tag(category: str) -> str:
+    return f"category:{category}"
+
+
+def career_tag(career_id: int) -> str:
+    return f"career:{career_id}"
+
+
+def certification_changed(
+    certification_id: int, categories: Iterable[Optional[str]] = ()
+) -> None:
+    """
+    자격증 생성/수정/삭제
+    categories: 변경 전후의 대분류 (해당 대분류로 필터한 목록 캐시만 지움)
+    """
+    graph_store.invalidate()
+    suggest_store.invalidate()
+    count_cache.clear()
+    layout_recomputer.schedule()
+    response_cache.purge(
+        TAG_CERTIFICATIONS,
+        TAG_CATEGORIES,
+        certification_tag(certification_id),
+        *(category_tag(category) for category in categories if category),
+    )
+    cache_warmer.schedule()
+
+
+def career_changed(career_id: int) -> None:
+    """커리어 생성/수정/삭제"""
+    suggest_store.invalidate()
+    count_cache.clear()
+    response_cache.purge(TAG_CAREERS, career_tag(career_id))
+    cache_warmer.schedule()
+
+
+def requirement_changed(career_id: int) -> None:
+    """커리어 요구사항 추가/제거"""
+    response_cache.purge(career_tag(career_id))
+
+
+def prerequisite_added(prereq_id: int, certification_id: int) -> None:
+    """선수 관계 추가"""
+    graph_store.add_edge(prereq_id, certification_id)
+    layout_recomputer.schedule()
+    response_cache.purge(certification_tag(prereq_id), certification_tag(certification_id))
+    cache_warmer.schedule()
+
+
+def prerequisite_removed(prereq_id: int, certification_id: int) -> None:
+    """선수 관계 제거"""
+    graph_store.remove_edge(prereq_id, certification_id)
+    layout_recomputer.schedule()
+    response_cache.purge(certification_tag(prereq_id), certification_tag(certification_id))
+    cache_warmer.schedule()
+
+
+def layout_changed() -> None:
+    """관리자가 좌표를 고정/해제"""
+    layout_recomputer.schedule()
@@ -0,0 +1,247 @@
+"""
+선수 관계 전이 폐쇄(closure) 테이블 관리
+
+certification_closure에는 활성 자격증 사이의 (조상, 후손, 최단 거리)가 저장된다.
+선수 관계 추가/제거와 자격증 비활성화 시 같은 트랜잭션 안에서 갱신한다.
+전체 재계산(prerequisite_walk)과 증분 추가 모두 최단 거리가 MAX_TREE_DEPTH 이하인 쌍만 저장한다.
+갱신 함수는 트랜잭션 단위 advisory lock(lock())을 잡으므로 동시에 들어온 변경은 커밋 순서대로 반영되고,
+순환 검사도 같은 잠금 안에서 하면 두 트랜잭션이 서로의 엣지를 보지 못해 순환을 만드는 일이 없다.
+순환 검사(is_ancestor, on_cycle)는 폐쇄 테이블이 아니라 원본 선수 관계를 비활성 자격증까지 깊이 제한 없이
+따라간다. (비활성 자격증을 거치거나 MAX_TREE_DEPTH보다 긴 경로도 재활성화되면 순환이 되므로)
+
+사용법:
+    python -m app.services.closure rebuild   # 전체 재계산
+    python -m app.services.closure check     # 전체 재계산 결과와 비교
+"""
+import asyncio
+import sys
+from typing import Dict, List, Tuple
+
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql.selectable import CTE
+
+from app.models.certification import Certification, certification_closure, certification_prerequisites
+from app.services.tree import MAX_TREE_DEPTH, prerequisite_walk
+
+closure = certification_closure
+
+# pg_advisory_xact_lock 키 (선수 관계/폐쇄 테이블 변경 직렬화)
+CLOSURE_LOCK_KEY = 7_310_431_250_001
+
+
+async def lock(db: AsyncSession) -> None:
+    """
+    선수 관계 변경 잠금 (트랜잭션이 끝나면 풀림, 같은 트랜잭션에서 여러 번 잡아도 됨)
+
+    잠금을 잡은 뒤 실행하는 쿼리는 앞서 잠금을 가졌던 트랜잭션의 커밋을 본다. (READ COMMITTED)
+    """
+    await db.execute(select(func.pg_advisory_xact_lock(CLOSURE_LOCK_KEY)))
+
+
+async def add_edge(db: AsyncSession, prereq_id: int, certification_id: int) -> None:
+    """
+    선수 관계(prereq -> certification) 추가 반영
+
+    prereq의 모든 조상과 certification의 모든 후손을 잇는 행을 추가하고,
+    이미 있는 행은 더 짧은 거리로 갱신한다. (거리가 MAX_TREE_DEPTH를 넘는 쌍은 저장하지 않음)
+    """
+    await lock(db)
+    upper = closure.alias("upper")
+    lower = closure.alias("lower")
+    depth = upper.c.depth + lower.c.depth + 1
+    pairs = select(
+        upper.c.ancestor_id,
+        lower.c.descendant_id,
+        depth.label("depth"),
+    ).where(
+        upper.c.descendant_id == prereq_id,
+        lower.c.ancestor_id == certification_id,
+        depth <= MAX_TREE_DEPTH,
+    )
+    stmt = insert(closure).from_select(["ancestor_id", "descendant_id", "depth"], pairs)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[closure.c.ancestor_id, closure.c.descendant_id],
+        set_={"depth": func.least(closure.c.depth, stmt.excluded.depth)},
+    )
+    await db.execute(stmt)
+
+
+async def refresh_subtree(db: AsyncSession, certification_id: int) -> None:
+    """
+    자격증과 그 모든 후손의 조상 행을 다시 계산
+
+    선수 관계 제거, 자격증 생성/비활성화/재활성화처럼 기존 행이 사라지거나
+    생겨야 하는 경우에 사용한다.
+    """
+    await lock(db)
+    walk = prerequisite_walk([certification_id], upward=False, name="subtree")
+    result = await db.execute(select(walk.c.node_id).distinct())
+    subtree = {certification_id, *result.scalars().all()}
+
+    await db.execute(delete(closure).where(closure.c.descendant_id.in_(subtree)))
+    active = await db.execute(
+        select(Certification.id).where(
+            Certification.id.in_(subtree),
+            Certification.is_active == True,
+        )
+    )
+    await _insert_ancestors(db, list(active.scalars().all()))
+
+
+async def rebuild_closure(db: AsyncSession) -> None:
+    """폐쇄 테이블 전체 재계산"""
+    await lock(db)
+    await db.execute(delete(closure))
+    active = await db.execute(select(Certification.id).where(Certification.is_active == True))
+    await _insert_ancestors(db, list(active.scalars().all()))
+
+
+async def _insert_ancestors(db: AsyncSession, ids: List[int]) -> None:
+    """주어진 (활성) 자격증들의 자기 자신 행과 모든 조상 행 삽입"""
+    if not ids:
+        return
+    await db.execute(
+        insert(closure),
+        [{"ancestor_id": i, "descendant_id": i, "depth": 0} for i in ids],
+    )
+    walk = prerequisite_walk(ids, upward=True, name="ancestors")
+    pairs = select(
+        walk.c.node_id,
+        walk.c.start_id,
+        func.min(walk.c.depth),
+    ).where(
+        walk.c.node_id != walk.c.start_id
+    ).group_by(walk.c.node_id, walk.c.start_id)
+    await db.execute(
+        insert(closure).from_select(["ancestor_id", "descendant_id", "depth"], pairs)
+    )
+
+
+def _stored_ancestors(certification_id: int) -> CTE:
+    """
+    저장된 모든 선수 관계를 따라 도달하는 조상 (활성 여부와 깊이 무관)
+    UNION이 이미 도달한 자격증을 다시 넣지 않으므로 순환이 있어도 끝난다.
+    """
+    cp = certification_prerequisites
+    walk = select(cp.c.prerequisite_id.label("node_id")).where(
+        cp.c.certification_id == certification_id
+    ).cte("stored_ancestors", recursive=True)
+    return walk.union(
+        select(cp.c.prerequisite_id).join(walk, cp.c.certification_id == walk.c.node_id)
+    )
+
+
+async def _reaches(db: AsyncSession, ancestor_id: int, descendant_id: int) -> bool:
+    walk = _stored_ancestors(descendant_id)
+    result = await db.execute(
+        select(walk.c.node_id).where(walk.c.node_id == ancestor_id).limit(1)
+    )
+    return result.first() is not None
+
+
+async def is_ancestor(db: AsyncSession, ancestor_id: int, descendant_id: int) -> bool:
+    """
+    ancestor에서 descendant로 가는 선수 관계 경로가 있는지 (자기 자신 포함, 순환 검사용)
+    비활성 자격증과 MAX_TREE_DEPTH보다 긴 경로까지 포함한다. (lock()을 잡은 뒤 호출)
+    """
+    if ancestor_id == descendant_id:
+        return True
+    return await _reaches(db, ancestor_id, descendant_id)
+
+
+async def on_cycle(db: AsyncSession, certification_id: int) -> bool:
+    """자격증이 저장된 선수 관계의 순환 위에 있는지 (재활성화 전 검사, lock()을 잡은 뒤 호출)"""
+    return await _reaches(db, certification_id, certification_id)
+
+
+async def ancestors_of(
+    db: AsyncSession, certification_id: int, max_depth: int = MAX_TREE_DEPTH
+) -> Dict[int, int]:
+    """max_depth 단계 안의 모든 선수 자격증 id -> 거리"""
+    result = await db.execute(
+        select(closure.c.ancestor_id, closure.c.depth).where(
+            closure.c.descendant_id == certification_id,
+            closure.c.depth > 0,
+            closure.c.depth <= max_depth,
+        )
+    )
+    return dict(result.all())
+
+
+async def descendants_of(
+    db: AsyncSession, certification_id: int, max_depth: int = MAX_TREE_DEPTH
+) -> Dict[int, int]:
+    """해당 자격증으로 max_depth 단계 안에 열리는 모든 자격증 id -> 거리"""
+    result = await db.execute(
+        select(closure.c.descendant_id, closure.c.depth).where(
+            closure.c.ancestor_id == certification_id,
+            closure.c.depth > 0,
+            closure.c.depth <= max_depth,
+        )
+    )
+    return dict(result.all())
+
+
+async def check_closure(db: AsyncSession) -> Dict[str, List[Tuple[int, int, int]]]:
+    """
+    폐쇄 테이블과 전체 재계산 결과 비교
+
+    반환: missing(없어야 할 것이 빠짐), extra(있으면 안 되는 행), wrong_depth(거리 불일치)
+    각 항목은 (ancestor_id, descendant_id, depth) 목록
+    """
+    stored_result = await db.execute(
+        select(closure.c.ancestor_id, closure.c.descendant_id, closure.c.depth)
+    )
+    stored = {(a, d): depth for a, d, depth in stored_result.all()}
+
+    active = await db.execute(select(Certification.id).where(Certification.is_active == True))
+    ids = list(active.scalars().all())
+    expected = {(i, i): 0 for i in ids}
+    if ids:
+        walk = prerequisite_walk(ids, upward=True, name="ancestors")
+        expected_result = await db.execute(
+            select(walk.c.node_id, walk.c.start_id, func.min(walk.c.depth)).where(
+                walk.c.node_id != walk.c.start_id
+            ).group_by(walk.c.node_id, walk.c.start_id)
+        )
+        for a, d, depth in expected_result.all():
+            expected[(a, d)] = depth
+
+    return {
+        "missing": sorted((a, d, depth) for (a, d), depth in expected.items() if (a, d) not in stored),
+        "extra": sorted((a, d, depth) for (a, d), depth in stored.items() if (a, d) not in expected),
+        "wrong_depth": sorted(
+            (a, d, stored[(a, d)])
+            for (a, d), depth in expected.items()
+            if (a, d) in stored and stored[(a, d)] != depth
+        ),
+    }
+
+
+async def main(command: str) -> int:
+    from app.db.session import SessionLocal
+
+    async with SessionLocal() as session:
+        if command == "rebuild":
+            await rebuild_closure(session)
+            await session.commit()
+            print("Closure table rebuilt!")
+            return 0
+
+        report = await check_closure(session)
+        problems = sum(len(rows) for rows in report.values())
+        for kind, rows in report.items():
+            print(f"{kind}: {len(rows)}")
+            for row in rows[:20]:
+                print(f"  ancestor={row[0]} descendant={row[1]} depth={row[2]}")
+        return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in ("rebuild", "check"):
+        print("usage: python -m app.services.closure [rebuild|check]")
+        sys.exit(2)
+    sys.exit(asyncio.run(main(sys.argv[1])))
@@ -0,0 +1,226 @@
+"""
+자격증 패싯(대분류/중분류/등급/시행 기관/응시료 구간) 개수 관리
+
+certification_facet에는 활성 자격증의 패싯 값별 개수가 저장된다.
+자격증 생성/수정/비활성화 시 변경 전후의 패싯 값 차이만큼 같은 트랜잭션 안에서 증감하므로,
+필터 없는 패싯 조회는 전체 자격증 집계 없이 패싯 값 개수만큼의 행만 읽는다.
+
+사용법:
+    python -m app.services.facets rebuild   # 전체 재계산
+    python -m app.services.facets check     # 전체 재계산 결과와 비교
+"""
+import asyncio
+import sys
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import case, delete, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.certification import Certification, CertificationFacet
+
+FACET_CATEGORY_MAIN = "category_main"
+FACET_CATEGORY_SUB = "category_sub"
+FACET_LEVEL = "level"
+FACET_ISSUER = "issuer"
+FACET_FEE_BAND = "fee_band"
+
+# 응시료(필기 + 실기) 구간 [하한, 상한), 상한 None은 무제한
+FEE_BANDS: Tuple[Tuple[int, Optional[int]], ...] = (
+    (0, 20000),
+    (20000, 50000),
+    (50000, 100000),
+    (100000, None),
+)
+
+# (패싯, 값, 상위 값) - 값이 없으면 ""
+FacetKey = Tuple[str, str, str]
+
+
+def fee_band_label(lower: int, upper: Optional[int]) -> str:
+    return f"{lower}-{upper}" if upper is not None else f"{lower}-"
+
+
+FEE_BAND_LABELS = [fee_band_label(lower, upper) for lower, upper in FEE_BANDS]
+
+
+def fee_band(fee_written: Optional[int], fee_practical: Optional[int]) -> str:
+    """응시료 구간 (응시료 정보가 없으면 "")"""
+    if fee_written is None and fee_practical is None:
+        return ""
+    total = (fee_written or 0) + (fee_practical or 0)
+    for lower, upper in FEE_BANDS:
+        if total >= lower and (upper is None or total < upper):
+            return fee_band_label(lower, upper)
+    return ""
+
+
+def fee_band_expression() -> ColumnElement:
+    """fee_band()와 같은 구간을 계산하는 SQL 식"""
+    total = func.coalesce(Certification.fee_written, 0) + func.coalesce(Certification.fee_practical, 0)
+    whens = [(
+        (Certification.fee_written == None) & (Certification.fee_practical == None),
+        "",
+    )]
+    for lower, upper in FEE_BANDS:
+        condition = total >= lower if upper is None else (total >= lower) & (total < upper)
+        whens.append((condition, fee_band_label(lower, upper)))
+    return case(*whens, else_="")
+
+
+def facet_keys(cert: Certification) -> List[FacetKey]:
+    """자격증이 세는 패싯 값 목록 (비활성 자격증은 세지 않음)"""
+    if not cert.is_active:
+        return []
+    main = cert.category_main or ""
+    return [
+        (FACET_CATEGORY_MAIN, main, ""),
+        (FACET_CATEGORY_SUB, cert.category_sub or "", main),
+        (FACET_LEVEL, cert.level or "", ""),
+        (FACET_ISSUER, cert.issuer or "", ""),
+        (FACET_FEE_BAND, fee_band(cert.fee_written, cert.fee_practical), ""),
+    ]
+
+
+async def apply_change(db: AsyncSession, before: Sequence[FacetKey], after: Sequence[FacetKey]) -> None:
+    """
+    변경 전후 패싯 값 차이만큼 개수 증감
+
+    before/after는 변경 전후의 facet_keys() 결과 (생성은 before=[], 비활성화는 after=[]).
+    동시에 같은 값을 갱신해도 행 단위 upsert라 개수가 어긋나지 않는다.
+    before는 자격증 행을 잠근 채(SELECT ... FOR UPDATE) 읽어야 동시 수정이 같은 변경 전 값을
+    두 번 빼지 않는다.
+    """
+    delta = Counter(after)
+    delta.subtract(Counter(before))
+    rows = [
+        {"facet": facet, "value": value, "parent": parent, "count": count}
+        for (facet, value, parent), count in delta.items()
+        if count
+    ]
+    if not rows:
+        return
+    stmt = insert(CertificationFacet).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            CertificationFacet.facet,
+            CertificationFacet.value,
+            CertificationFacet.parent,
+        ],
+        set_={"count": CertificationFacet.count + stmt.excluded.count},
+    )
+    await db.execute(stmt)
+
+
+async def aggregate(db: AsyncSession, conditions: Iterable[ColumnElement] = ()) -> Dict[FacetKey, int]:
+    """
+    조건에 맞는 활성 자격증의 패싯 값별 개수를 직접 집계 (GROUPING SETS 한 번으로 모든 패싯)
+    """
+    base = select(
+        Certification.category_main,
+        Certification.category_sub,
+        Certification.level,
+        Certification.issuer,
+        fee_band_expression().label("fee_band"),
+    ).where(Certification.is_active == True, *conditions).subquery("facet_source")
+
+    columns = [base.c.category_main, base.c.category_sub, base.c.level, base.c.issuer, base.c.fee_band]
+    sets = {
+        FACET_CATEGORY_MAIN: (0,),
+        FACET_CATEGORY_SUB: (0, 1),
+        FACET_LEVEL: (2,),
+        FACET_ISSUER: (3,),
+        FACET_FEE_BAND: (4,),
+    }
+    # GROUPING(...) 비트: 묶지 않은 컬럼이 1 (첫 번째 컬럼이 최상위 비트)
+    facet_of_mask = {
+        sum(1 << (len(columns) - 1 - i) for i in range(len(columns)) if i not in grouped): facet
+        for facet, grouped in sets.items()
+    }
+
+    query = select(
+        *columns,
+        func.grouping(*columns).label("grouping"),
+        func.count().label("count"),
+    ).group_by(
+        func.grouping_sets(*(tuple_(*(columns[i] for i in grouped)) for grouped in sets.values()))
+    )
+
+    counts: Dict[FacetKey, int] = {}
+    for row in (await db.execute(query)).all():
+        facet = facet_of_mask[row.grouping]
+        main = row.category_main or ""
+        if facet == FACET_CATEGORY_MAIN:
+            key = (facet, main, "")
+        elif facet == FACET_CATEGORY_SUB:
+            key = (facet, row.category_sub or "", main)
+        else:
+            key = (facet, getattr(row, facet) or "", "")
+        # NULL과 ""은 같은 값으로 취급
+        counts[key] = counts.get(key, 0) + row.count
+    return counts
+
+
+async def stored_counts(db: AsyncSession) -> Dict[FacetKey, int]:
+    """카운터 테이블에 저장된 패싯 값별 개수 (0개 제외)"""
+    result = await db.execute(
+        select(
+            CertificationFacet.facet,
+            CertificationFacet.value,
+            CertificationFacet.parent,
+            CertificationFacet.count,
+        ).where(CertificationFacet.count > 0)
+    )
+    return {(facet, value, parent): count for facet, value, parent, count in result.all()}
+
+
+async def rebuild_facets(db: AsyncSession) -> None:
+    """카운터 테이블 전체 재계산"""
+    await db.execute(delete(CertificationFacet))
+    counts = await aggregate(db)
+    if counts:
+        await db.execute(
+            insert(CertificationFacet),
+            [
+                {"facet": facet, "value": value, "parent": parent, "count": count}
+                for (facet, value, parent), count in counts.items()
+            ],
+        )
+
+
+async def check_facets(db: AsyncSession) -> List[Tuple[FacetKey, int, int]]:
+    """카운터와 전체 재계산 결과가 다른 패싯 값 목록 (키, 저장된 개수, 실제 개수)"""
+    stored = await stored_counts(db)
+    expected = await aggregate(db)
+    return sorted(
+        (key, stored.get(key, 0), expected.get(key, 0))
+        for key in stored.keys() | expected.keys()
+        if stored.get(key, 0) != expected.get(key, 0)
+    )
+
+
+async def main(command: str) -> int:
+    from app.db.session import SessionLocal
+
+    async with SessionLocal() as session:
+        if command == "rebuild":
+            await rebuild_facets(session)
+            await session.commit()
+            print("Facet counters rebuilt!")
+            return 0
+
+        problems = await check_facets(session)
+        print(f"mismatched: {len(problems)}")
+        for (facet, value, parent), stored, expected in problems[:20]:
+            print(f"  {facet}={value!r} (parent={parent!r}) stored={stored} expected={expected}")
+        return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in ("rebuild", "check"):
+        print("usage: python -m app.services.facets [rebuild|check]")
+        sys.exit(2)
+    sys.exit(asyncio.run(main(sys.argv[1])))
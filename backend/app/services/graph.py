@@ -0,0 +1,626 @@
+"""
+테크트리 그래프 스냅샷 (프로세스 로컬 캐시)
+
+카탈로그가 변경될 때만 다시 빌드하고, 그 사이의 요청은 DB 조회 없이 스냅샷에서 응답한다.
+다른 워커에서 바뀐 카탈로그/레이아웃은 certification, graph_layout 변경 스탬프(app.db.stamps)를 비교해 감지한다.
+"""
+import asyncio
+import hashlib
+import logging
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.payload import BROTLI_REQUEST_QUALITY, EncodedPayload
+from app.core.serialization import json_encoder
+from app.db.stamps import EMPTY_STAMP, committed_version, current_stamps
+from app.models.certification import Certification, GraphLayout, certification_prerequisites
+from app.schemas.certification import GraphData, GraphNode, GraphEdge
+from app.services.layout import Position, compute_layout
+from app.services.topo import CycleError, DynamicTopologicalOrder
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷이 따라가는 변경 스탬프 테이블 (선수 관계 변경도 자격증 행 변경으로 기록됨)
+GRAPH_STAMP_TABLE = "certification"
+LAYOUT_STAMP_TABLE = "graph_layout"
+
+# 증분 반영 사이에 다른 워커의 변경이 끼어든 경우 (_follow_commit)
+_DIVERGED = -1
+
+# level_order가 비어 있을 때 사용할 레벨별 기본 순서
+LEVEL_ORDERS = {
+    "기술사": 4,
+    "기사": 3,
+    "산업기사": 2,
+    "기능사": 1,
+}
+
+# 레벨별 색상
+LEVEL_COLORS = {
+    "기술사": {"background": "#fef3c7", "border": "#f59e0b"},
+    "기사": {"background": "#dbeafe", "border": "#3b82f6"},
+    "산업기사": {"background": "#dcfce7", "border": "#22c55e"},
+    "기능사": {"background": "#f3e8ff", "border": "#a855f7"},
+}
+DEFAULT_COLORS = {"background": "#f3f4f6", "border": "#9ca3af"}
+
+# 전체 그래프 레이아웃을 저장할 때 사용하는 카테고리 키
+ALL_CATEGORIES = "*"
+
+# 사용자별 노드 상태
+STATUS_ACQUIRED = "acquired"  # 취득
+STATUS_GOAL = "goal"  # 목표
+STATUS_ELIGIBLE = "eligible"  # 지금 응시 가능
+STATUS_LOCKED = "locked"  # 선수 자격증 필요
+
+
+@dataclass(frozen=True)
+class CertNode:
+    """스냅샷에 담기는 자격증 노드 (ORM 객체와 분리된 읽기 전용 값)"""
+    id: int
+    name: str
+    code: Optional[str]
+    issuer: Optional[str]
+    category_main: Optional[str]
+    category_sub: Optional[str]
+    level: Optional[str]
+    level_order: int
+    fee_written: Optional[int]
+    fee_practical: Optional[int]
+    pass_rate: Optional[str]
+
+
+@dataclass
+class GraphSnapshot:
+    """
+    특정 버전의 테크트리 그래프
+
+    - nodes: 활성 자격증 id -> 노드
+    - prerequisites: 자격증 id -> 선수 자격증 id 목록
+    - dependents: 자격증 id -> 해당 자격증을 선수로 요구하는 자격증 id 목록
+    - categories: 대분류 -> 자격증 id 목록
+    - topo: 선수 자격증이 항상 먼저 오는 위상 순서 (엣지 추가 시 증분 갱신)
+    - stored_layouts / pinned_layouts: graph_layout 테이블에 저장된 좌표 / 그중 고정 좌표
+    - stamp: 스냅샷이 반영한 certification 변경 스탬프 버전 (스탬프를 읽지 못했으면 None)
+    - layout_stamp: 스냅샷이 반영한 graph_layout 변경 스탬프 버전 (좌표 고정/해제/재계산)
+    - layout_version: 저장된 레이아웃 버전 (graph_layout.layout_version 최댓값)
+    """
+    version: int
+    built_at: datetime
+    nodes: Dict[int, CertNode]
+    prerequisites: Dict[int, Tuple[int, ...]]
+    dependents: Dict[int, Tuple[int, ...]]
+    categories: Dict[str, Tuple[int, ...]]
+    topo: DynamicTopologicalOrder
+    stored_layouts: Dict[str, Dict[int, Position]] = field(default_factory=dict)
+    pinned_layouts: Dict[str, Dict[int, Position]] = field(default_factory=dict)
+    stamp: Optional[int] = None
+    layout_stamp: Optional[int] = None
+    layout_version: int = 0
+    _layouts: Dict[Optional[str], Dict[int, Position]] = field(default_factory=dict, repr=False)
+    _graphs: Dict[Optional[str], GraphData] = field(default_factory=dict, repr=False)
+    _payloads: Dict[Optional[str], EncodedPayload] = field(default_factory=dict, repr=False)
+    _spatial: Dict[Optional[str], Tuple[List[int], List[int]]] = field(default_factory=dict, repr=False)
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(prereqs) for prereqs in self.prerequisites.values())
+
+    def slice_ids(self, category: Optional[str] = None) -> Tuple[int, ...]:
+        """카테고리에 해당하는 자격증 id 목록 (None이면 전체)"""
+        if category is None:
+            return tuple(self.nodes)
+        return self.categories.get(category, ())
+
+    def layout_input(self, ids: Tuple[int, ...]) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """레이아웃 엔진 입력 (중분류, 이름 순으로 정렬한 노드와 슬라이스 내부 엣지)"""
+        ordered = sorted(
+            ids,
+            key=lambda i: (self.nodes[i].category_sub or "", self.nodes[i].name, i),
+        )
+        nodes = [(i, self.nodes[i].level_order) for i in ordered]
+        included = set(ids)
+        edges = [
+            (prereq_id, cert_id)
+            for cert_id in ordered
+            for prereq_id in self.prerequisites.get(cert_id, ())
+            if prereq_id in included
+        ]
+        return nodes, edges
+
+    async def layout(self, category: Optional[str] = None) -> Dict[int, Position]:
+        """
+        카테고리별 노드 좌표
+
+        저장된 레이아웃이 슬라이스 전체를 덮으면 그대로 쓰고, 아직 재계산되지 않은
+        노드가 있으면 고정 좌표를 반영해 메모리에서 한 번 계산한다.
+        """
+        positions = self._layouts.get(category)
+        if positions is None:
+            key = layout_key(category)
+            ids = self.slice_ids(category)
+            stored = self.stored_layouts.get(key, {})
+            if all(i in stored for i in ids):
+                positions = stored
+            else:
+                nodes, edges = self.layout_input(ids)
+                positions = await compute_layout(nodes, edges, pinned=self.pinned_layouts.get(key))
+            self._layouts[category] = positions
+        return positions
+
+    async def graph(self, category: Optional[str] = None) -> GraphData:
+        """React Flow용 그래프 데이터 (카테고리별로 한 번만 생성)"""
+        graph = self._graphs.get(category)
+        if graph is None:
+            positions = await self.layout(category)
+            graph = await asyncio.to_thread(
+                build_graph_data, self, self.slice_ids(category), positions
+            )
+            self._graphs[category] = graph
+        return graph
+
+    def payload_tag(self, category: Optional[str] = None) -> Optional[str]:
+        """
+        그래프 응답 ETag의 기준값 (본문을 만들지 않고 조건부 요청에 답할 때 사용)
+
+        본문은 카탈로그(certification 스탬프)와 저장된 좌표(graph_layout 스탬프)로 정해지므로
+        두 값이 같으면 워커가 달라도 같은 태그가 된다. 스탬프를 모르면 None.
+        """
+        if self.stamp is None or self.layout_stamp is None:
+            return None
+        slice_hash = hashlib.sha1(layout_key(category).encode()).hexdigest()[:8]
+        return f"g{self.stamp}.{self.layout_stamp}.{slice_hash}"
+
+    async def payload(
+        self,
+        category: Optional[str] = None,
+        brotli_quality: int = BROTLI_REQUEST_QUALITY,
+    ) -> EncodedPayload:
+        """
+        직렬화/압축까지 끝낸 그래프 응답 본문 (카테고리별로 한 번만 생성)
+
+        인코딩/압축은 이벤트 루프 밖에서 한다. 요청 중에는 낮은 brotli 품질로 만들고,
+        예열이 더 높은 품질을 요청하면 그때 다시 만들어 교체한다.
+        """
+        payload = self._payloads.get(category)
+        if payload is None or payload.brotli_quality < brotli_quality:
+            graph = await self.graph(category)
+            payload = await asyncio.to_thread(
+                _encode_payload, graph, self.payload_tag(category), brotli_quality
+            )
+            self._payloads[category] = payload
+        return payload
+
+    def neighborhood(self, focus_id: int, hops: int, category: Optional[str] = None) -> Set[int]:
+        """
+        기준 자격증에서 선수/후속 관계를 방향 구분 없이 hops 단계까지 따라간 노드 집합
+        """
+        allowed = None if category is None else set(self.slice_ids(category))
+        found = {focus_id}
+        queue = deque([(focus_id, 0)])
+        while queue:
+            node_id, distance = queue.popleft()
+            if distance == hops:
+                continue
+            for neighbor in self.prerequisites.get(node_id, ()) + self.dependents.get(node_id, ()):
+                if neighbor in found or (allowed is not None and neighbor not in allowed):
+                    continue
+                found.add(neighbor)
+                queue.append((neighbor, distance + 1))
+        return found
+
+    async def in_viewport(
+        self,
+        category: Optional[str],
+        x_min: float,
+        y_min: float,
+        x_max: float,
+        y_max: float,
+    ) -> Set[int]:
+        """레이아웃 좌표가 사각형 안에 들어오는 노드 집합 (X 정렬 인덱스 + 이분 탐색)"""
+        positions = await self.layout(category)
+        spatial = self._spatial.get(category)
+        if spatial is None:
+            ordered = sorted(positions, key=lambda i: (positions[i][0], i))
+            spatial = ([positions[i][0] for i in ordered], ordered)
+            self._spatial[category] = spatial
+        xs, ordered = spatial
+        return {
+            node_id
+            for node_id in ordered[bisect_left(xs, x_min):bisect_right(xs, x_max)]
+            if y_min <= positions[node_id][1] <= y_max
+        }
+
+    def is_unlocked(self, certification_id: int, acquired: Set[int]) -> bool:
+        """선수 자격증이 없거나, 그중 하나 이상을 취득했으면 응시 가능"""
+        prereqs = self.prerequisites.get(certification_id, ())
+        return not prereqs or any(prereq_id in acquired for prereq_id in prereqs)
+
+    async def personalized_graph(
+        self,
+        category: Optional[str],
+        acquired: Set[int],
+        goals: Set[int],
+    ) -> GraphData:
+        """
+        공유 그래프에 사용자 상태(status, eligible)만 덧붙인 사본
+        """
+        graph = await self.graph(category)
+        nodes = []
+        for node in graph.nodes:
+            cert_id = int(node.id)
+            eligible = cert_id not in acquired and self.is_unlocked(cert_id, acquired)
+            if cert_id in acquired:
+                status = STATUS_ACQUIRED
+            elif cert_id in goals:
+                status = STATUS_GOAL
+            elif eligible:
+                status = STATUS_ELIGIBLE
+            else:
+                status = STATUS_LOCKED
+            nodes.append(node.model_copy(
+                update={"data": {**node.data, "status": status, "eligible": eligible}}
+            ))
+        return GraphData(nodes=nodes, edges=graph.edges)
+
+    async def subgraph(self, ids: Set[int], category: Optional[str] = None) -> GraphData:
+        """노드 집합과 그 사이의 엣지만 담은 그래프 (좌표는 카테고리 전체 레이아웃 기준)"""
+        positions = await self.layout(category)
+        ordered = tuple(i for i in self.slice_ids(category) if i in ids)
+        return build_graph_data(self, ordered, positions)
+
+
+def layout_key(category: Optional[str]) -> str:
+    """graph_layout.category 값"""
+    return ALL_CATEGORIES if category is None else category
+
+
+def _encode_payload(graph: GraphData, tag: Optional[str], brotli_quality: int) -> EncodedPayload:
+    return EncodedPayload(json_encoder(GraphData)(graph), tag=tag, brotli_quality=brotli_quality)
+
+
+def build_graph_data(
+    snapshot: GraphSnapshot,
+    ids: Tuple[int, ...],
+    positions: Dict[int, Position],
+) -> GraphData:
+    """
+    스냅샷의 일부 노드로 GraphData 생성
+    """
+    nodes = []
+    edges = []
+    included = set(ids)
+
+    for cert_id in ids:
+        cert = snapshot.nodes[cert_id]
+        level = cert.level or "기타"
+        colors = LEVEL_COLORS.get(level, DEFAULT_COLORS)
+        x, y = positions[cert_id]
+
+        nodes.append(GraphNode(
+            id=str(cert.id),
+            data={
+                "label": cert.name,
+                "level": level,
+                "category": cert.category_main,
+                "issuer": cert.issuer,
+            },
+            position={"x": x, "y": y},
+            type="default",
+            style={
+                "background": colors["background"],
+                "border": f"2px solid {colors['border']}",
+                "borderRadius": "8px",
+                "padding": "10px",
+                "width": 180,
+            }
+        ))
+
+        for prereq_id in snapshot.prerequisites.get(cert_id, ()):
+            if prereq_id not in included:
+                continue
+            edges.append(GraphEdge(
+                id=f"e{prereq_id}-{cert_id}",
+                source=str(prereq_id),
+                target=str(cert_id),
+                type="smoothstep",
+                animated=False,
+            ))
+
+    return GraphData(nodes=nodes, edges=edges)
+
+
+async def load_snapshot(db: AsyncSession, version: int) -> GraphSnapshot:
+    """
+    DB에서 활성 자격증과 선수 관계를 읽어 스냅샷 생성
+    """
+    cert_result = await db.execute(
+        select(
+            Certification.id,
+            Certification.name,
+            Certification.code,
+            Certification.issuer,
+            Certification.category_main,
+            Certification.category_sub,
+            Certification.level,
+            Certification.level_order,
+            Certification.fee_written,
+            Certification.fee_practical,
+            Certification.pass_rate,
+        ).where(Certification.is_active == True).order_by(Certification.id)
+    )
+    nodes: Dict[int, CertNode] = {}
+    categories: Dict[str, List[int]] = {}
+    for row in cert_result.all():
+        node = CertNode(
+            id=row.id,
+            name=row.name,
+            code=row.code,
+            issuer=row.issuer,
+            category_main=row.category_main,
+            category_sub=row.category_sub,
+            level=row.level,
+            level_order=row.level_order or LEVEL_ORDERS.get(row.level, 0),
+            fee_written=row.fee_written,
+            fee_practical=row.fee_practical,
+            pass_rate=row.pass_rate,
+        )
+        nodes[node.id] = node
+        if node.category_main is not None:
+            categories.setdefault(node.category_main, []).append(node.id)
+
+    edge_result = await db.execute(
+        select(
+            certification_prerequisites.c.certification_id,
+            certification_prerequisites.c.prerequisite_id,
+        ).order_by(
+            certification_prerequisites.c.certification_id,
+            certification_prerequisites.c.prerequisite_id,
+        )
+    )
+    prerequisites: Dict[int, List[int]] = {}
+    dependents: Dict[int, List[int]] = {}
+    for cert_id, prereq_id in edge_result.all():
+        # 비활성 자격증과 연결된 관계는 그래프에서 제외
+        if cert_id not in nodes or prereq_id not in nodes:
+            continue
+        prerequisites.setdefault(cert_id, []).append(prereq_id)
+        dependents.setdefault(prereq_id, []).append(cert_id)
+
+    stored_layouts: Dict[str, Dict[int, Position]] = {}
+    pinned_layouts: Dict[str, Dict[int, Position]] = {}
+    layout_version = 0
+    layout_result = await db.execute(
+        select(
+            GraphLayout.category,
+            GraphLayout.certification_id,
+            GraphLayout.x,
+            GraphLayout.y,
+            GraphLayout.is_pinned,
+            GraphLayout.layout_version,
+        )
+    )
+    for row in layout_result.all():
+        layout_version = max(layout_version, row.layout_version)
+        if row.certification_id not in nodes:
+            continue
+        stored_layouts.setdefault(row.category, {})[row.certification_id] = (row.x, row.y)
+        if row.is_pinned:
+            pinned_layouts.setdefault(row.category, {})[row.certification_id] = (row.x, row.y)
+
+    return GraphSnapshot(
+        version=version,
+        built_at=datetime.utcnow(),
+        nodes=nodes,
+        prerequisites={k: tuple(v) for k, v in prerequisites.items()},
+        dependents={k: tuple(v) for k, v in dependents.items()},
+        categories={k: tuple(v) for k, v in categories.items()},
+        topo=DynamicTopologicalOrder(
+            nodes,
+            ((p, c) for c, prereqs in prerequisites.items() for p in prereqs),
+        ),
+        stored_layouts=stored_layouts,
+        pinned_layouts=pinned_layouts,
+        layout_version=layout_version,
+    )
+
+
+class GraphStore:
+    """
+    버전이 붙은 그래프 스냅샷 보관소
+
+    카탈로그 변경 시 invalidate()로 표시만 해두고, 다음 조회 시점에 한 번만 다시 빌드한다.
+    조회할 때 certification/graph_layout 변경 스탬프가 스냅샷과 다르면(다른 워커의 변경) 역시 다시 빌드한다.
+    재빌드가 진행 중이면 다른 조회는 기다리지 않고 직전 스냅샷을 받는다. (stale-while-revalidate)
+    버전은 빌드될 때마다 1씩 증가한다.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: Optional[GraphSnapshot] = None
+        self._stale = True
+        self._version = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def is_stale(self) -> bool:
+        return self._stale or self._snapshot is None
+
+    def invalidate(self) -> None:
+        """카탈로그 변경 표시 (다음 조회 때 재빌드)"""
+        self._stale = True
+
+    async def get(self, db: AsyncSession, allow_stale: bool = True) -> GraphSnapshot:
+        """
+        최신 스냅샷 반환 (필요한 경우에만 DB에서 재빌드)
+        allow_stale=False이면 진행 중인 재빌드가 끝날 때까지 기다린다. (순환 검사, 레이아웃 재계산 등)
+        """
+        stamps = await self._current_stamps()
+        snapshot = self._snapshot
+        if stamps is not None and snapshot is not None and stamps != (snapshot.stamp, snapshot.layout_stamp):
+            self._stale = True
+        if not self.is_stale:
+            return self._snapshot
+        if allow_stale and self._snapshot is not None and self._lock.locked():
+            return self._snapshot
+
+        async with self._lock:
+            if self.is_stale:
+                # 빌드 중 들어온 변경은 다시 stale로 표시되도록 먼저 해제
+                self._stale = False
+                # 스탬프는 데이터보다 먼저 읽음 (사이에 커밋된 변경은 다음 조회에서 다시 감지)
+                stamps = await self._current_stamps()
+                try:
+                    snapshot = await load_snapshot(db, self._version + 1)
+                except Exception:
+                    self._stale = True
+                    raise
+                if stamps is not None:
+                    snapshot.stamp, snapshot.layout_stamp = stamps
+                self._version = snapshot.version
+                self._snapshot = snapshot
+        return self._snapshot
+
+    async def _current_stamps(self) -> Optional[Tuple[int, int]]:
+        """(certification 스탬프 버전, graph_layout 스탬프 버전)"""
+        try:
+            stamps = await current_stamps()
+        except Exception:
+            logger.warning("change stamps unavailable, graph snapshot follows local changes only", exc_info=True)
+            return None
+        return (
+            stamps.get(GRAPH_STAMP_TABLE, EMPTY_STAMP).version,
+            stamps.get(LAYOUT_STAMP_TABLE, EMPTY_STAMP).version,
+        )
+
+    def _follow_commit(self, snapshot: GraphSnapshot) -> Optional[int]:
+        """
+        이 워커의 커밋 직후 증분 반영할 때 새 스탬프 버전
+        그 사이 다른 워커의 변경이 끼어들었으면(버전이 1보다 많이 오름) _DIVERGED
+        """
+        committed = committed_version(GRAPH_STAMP_TABLE)
+        if snapshot.stamp is None or committed is None:
+            return snapshot.stamp
+        if committed != snapshot.stamp + 1:
+            return _DIVERGED
+        return committed
+
+    def add_edge(self, prereq_id: int, certification_id: int) -> None:
+        """
+        커밋된 선수 관계 추가를 전체 재빌드 없이 반영 (위상 순서는 증분 갱신)
+        """
+        snapshot = self._snapshot
+        if (
+            self.is_stale
+            or prereq_id not in snapshot.nodes
+            or certification_id not in snapshot.nodes
+        ):
+            self.invalidate()
+            return
+        stamp = self._follow_commit(snapshot)
+        if stamp == _DIVERGED:
+            self.invalidate()
+            return
+        try:
+            snapshot.topo.add_edge(prereq_id, certification_id)
+        except CycleError:
+            # 다른 프로세스의 변경으로 로컬 스냅샷이 뒤처진 경우
+            self.invalidate()
+            return
+
+        prerequisites = dict(snapshot.prerequisites)
+        prerequisites[certification_id] = tuple(
+            sorted({*prerequisites.get(certification_id, ()), prereq_id})
+        )
+        dependents = dict(snapshot.dependents)
+        dependents[prereq_id] = tuple(
+            sorted({*dependents.get(prereq_id, ()), certification_id})
+        )
+        self._replace(snapshot, prerequisites, dependents, stamp)
+
+    def remove_edge(self, prereq_id: int, certification_id: int) -> None:
+        """커밋된 선수 관계 제거 반영 (기존 위상 순서는 그대로 유효)"""
+        snapshot = self._snapshot
+        if self.is_stale:
+            return
+        stamp = self._follow_commit(snapshot)
+        if stamp == _DIVERGED:
+            self.invalidate()
+            return
+        snapshot.topo.remove_edge(prereq_id, certification_id)
+
+        prerequisites = dict(snapshot.prerequisites)
+        prerequisites[certification_id] = tuple(
+            i for i in prerequisites.get(certification_id, ()) if i != prereq_id
+        )
+        dependents = dict(snapshot.dependents)
+        dependents[prereq_id] = tuple(
+            i for i in dependents.get(prereq_id, ()) if i != certification_id
+        )
+        self._replace(snapshot, prerequisites, dependents, stamp)
+
+    def replace_layouts(
+        self,
+        stored_layouts: Dict[str, Dict[int, Position]],
+        pinned_layouts: Dict[str, Dict[int, Position]],
+        layout_version: int,
+        layout_stamp: int,
+    ) -> None:
+        """
+        새로 저장한 레이아웃을 현재 스냅샷에 반영 (관계/위상 순서는 그대로 두고 좌표에서 파생된 캐시만 새로 계산)
+        layout_stamp: 저장한 트랜잭션이 올린 graph_layout 스탬프 버전 (잠금 안에서 올렸으므로 그 시점의 최신)
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return
+        self._version += 1
+        self._snapshot = GraphSnapshot(
+            version=self._version,
+            built_at=datetime.utcnow(),
+            nodes=snapshot.nodes,
+            prerequisites=snapshot.prerequisites,
+            dependents=snapshot.dependents,
+            categories=snapshot.categories,
+            topo=snapshot.topo,
+            stored_layouts=stored_layouts,
+            pinned_layouts=pinned_layouts,
+            stamp=snapshot.stamp,
+            layout_stamp=layout_stamp,
+            layout_version=layout_version,
+        )
+
+    def _replace(
+        self,
+        snapshot: GraphSnapshot,
+        prerequisites: Dict[int, Tuple[int, ...]],
+        dependents: Dict[int, Tuple[int, ...]],
+        stamp: Optional[int],
+    ) -> None:
+        """관계만 바뀐 새 버전 스냅샷으로 교체 (레이아웃/응답 캐시는 새로 계산)"""
+        self._version += 1
+        self._snapshot = GraphSnapshot(
+            version=self._version,
+            built_at=datetime.utcnow(),
+            nodes=snapshot.nodes,
+            prerequisites=prerequisites,
+            dependents=dependents,
+            categories=snapshot.categories,
+            topo=snapshot.topo,
+            stored_layouts=snapshot.stored_layouts,
+            pinned_layouts=snapshot.pinned_layouts,
+            stamp=stamp,
+            layout_stamp=snapshot.layout_stamp,
+            layout_version=snapshot.layout_version,
+        )
+
+
+graph_store = GraphStore()
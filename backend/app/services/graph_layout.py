@@ -0,0 +1,177 @@
+"""
+저장된 테크트리 레이아웃 (graph_layout 테이블)
+
+카탈로그가 바뀌면 요청 처리와 별개로 전체/대분류별 좌표를 다시 계산해 저장하고,
+조회 시에는 저장된 좌표를 그대로 사용한다. 관리자가 고정한 좌표는 재계산 시 그대로 유지된다.
+재계산과 고정/해제는 트랜잭션 단위 advisory lock(lock())으로 직렬화한다. (관리자 즉시 재계산과
+백그라운드 재계산이 겹치거나, 재계산 도중 커밋된 고정 좌표가 새 행과 충돌하지 않도록)
+"""
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from sqlalchemy import delete, func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.db.stamps import bump_stamps
+from app.models.certification import GraphLayout
+from app.services.graph import LAYOUT_STAMP_TABLE, GraphSnapshot, graph_store, layout_key
+from app.services.layout import Position, compute_layout
+from app.services.warmer import cache_warmer
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_xact_lock 키 (graph_layout 변경 직렬화)
+LAYOUT_LOCK_KEY = 7_310_431_250_002
+
+
+async def lock(db: AsyncSession) -> None:
+    """레이아웃 변경 잠금 (트랜잭션이 끝나면 풀림)"""
+    await db.execute(select(func.pg_advisory_xact_lock(LAYOUT_LOCK_KEY)))
+
+
+async def recompute_layouts(db: AsyncSession) -> int:
+    """
+    전체 그래프와 모든 대분류의 레이아웃을 다시 계산해 저장
+    반환: 새 layout_version
+    """
+    await lock(db)
+    version_result = await db.execute(select(func.max(GraphLayout.layout_version)))
+    layout_version = (version_result.scalar() or 0) + 1
+
+    pinned_result = await db.execute(
+        select(GraphLayout.category, GraphLayout.certification_id, GraphLayout.x, GraphLayout.y)
+        .where(GraphLayout.is_pinned == True)
+    )
+    pinned: Dict[str, Dict[int, Position]] = {}
+    for row in pinned_result.all():
+        pinned.setdefault(row.category, {})[row.certification_id] = (row.x, row.y)
+
+    snapshot = await graph_store.get(db, allow_stale=False)
+    stored: Dict[str, Dict[int, Position]] = {}
+    rows = []
+    for category in [None, *sorted(snapshot.categories)]:
+        key = layout_key(category)
+        positions = await _compute(snapshot, category, pinned.get(key))
+        stored[key] = {**positions, **pinned.get(key, {})}
+        rows.extend(
+            {
+                "certification_id": cert_id,
+                "category": key,
+                "x": x,
+                "y": y,
+                "layout_version": layout_version,
+                "is_pinned": False,
+            }
+            for cert_id, (x, y) in positions.items()
+            if cert_id not in pinned.get(key, {})
+        )
+
+    await db.execute(delete(GraphLayout).where(GraphLayout.is_pinned == False))
+    await db.execute(
+        update(GraphLayout)
+        .where(GraphLayout.is_pinned == True)
+        .values(layout_version=layout_version)
+    )
+    if rows:
+        await db.execute(insert(GraphLayout), rows)
+    stamps = await bump_stamps(db, LAYOUT_STAMP_TABLE)
+    await db.commit()
+    # 관계는 그대로이므로 스냅샷을 다시 빌드하지 않고 좌표만 교체 (다른 워커는 스탬프로 감지)
+    graph_store.replace_layouts(stored, pinned, layout_version, stamps[LAYOUT_STAMP_TABLE])
+    return layout_version
+
+
+async def _compute(
+    snapshot: GraphSnapshot,
+    category: Optional[str],
+    pinned: Optional[Dict[int, Position]],
+) -> Dict[int, Position]:
+    """저장된 좌표를 무시하고 고정 좌표만 반영해 새로 계산"""
+    nodes, edges = snapshot.layout_input(snapshot.slice_ids(category))
+    return await compute_layout(nodes, edges, pinned=pinned)
+
+
+async def pin_position(
+    db: AsyncSession, certification_id: int, category: Optional[str], x: int, y: int
+) -> None:
+    """노드 좌표 고정 (이미 저장된 행이 있으면 덮어씀)"""
+    await lock(db)
+    stmt = insert(GraphLayout).values(
+        certification_id=certification_id,
+        category=layout_key(category),
+        x=x,
+        y=y,
+        layout_version=0,
+        is_pinned=True,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[GraphLayout.certification_id, GraphLayout.category],
+        set_={"x": x, "y": y, "is_pinned": True},
+    )
+    await db.execute(stmt)
+    await bump_stamps(db, LAYOUT_STAMP_TABLE)
+
+
+async def unpin_position(db: AsyncSession, certification_id: int, category: Optional[str]) -> bool:
+    """고정 해제 (고정된 좌표가 없었으면 False)"""
+    await lock(db)
+    result = await db.execute(
+        update(GraphLayout)
+        .where(
+            GraphLayout.certification_id == certification_id,
+            GraphLayout.category == layout_key(category),
+            GraphLayout.is_pinned == True,
+        )
+        .values(is_pinned=False)
+    )
+    if result.rowcount == 0:
+        return False
+    await bump_stamps(db, LAYOUT_STAMP_TABLE)
+    return True
+
+
+class LayoutRecomputer:
+    """
+    백그라운드 레이아웃 재계산
+
+    짧은 시간에 여러 번 요청되면 실행 중인 작업이 끝난 뒤 한 번만 더 계산한다.
+    """
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task] = None
+        self._pending = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def schedule(self) -> None:
+        """재계산 예약 (요청 처리를 기다리게 하지 않음)"""
+        self._pending = True
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        from app.db.session import SessionLocal
+
+        while self._pending:
+            self._pending = False
+            try:
+                async with SessionLocal() as session:
+                    await recompute_layouts(session)
+            except Exception:
+                logger.exception("graph layout recomputation failed")
+            else:
+                # 새 좌표로 그래프 본문을 다시 만들어 둠
+                cache_warmer.schedule()
+
+    async def wait(self) -> None:
+        """진행 중인 재계산이 끝날 때까지 대기"""
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+
+layout_recomputer = LayoutRecomputer()
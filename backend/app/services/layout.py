@@ -0,0 +1,234 @@
+"""
+테크트리 계층형(Sugiyama) 레이아웃 엔진
+
+1. 레이어 배정: level_order 기준 (기술사가 최상단)
+2. 긴 엣지 분할: 두 레이어 이상 건너뛰는 엣지에 더미 노드 삽입
+3. 교차 최소화: 무게중심(barycenter) 정렬을 위/아래로 번갈아 반복
+4. 좌표 배정: 이웃 노드의 평균 X로 끌어당기되 최소 간격 유지
+
+관리자가 고정(pin)한 노드는 주어진 좌표를 그대로 쓰고, 나머지 노드의 정렬 기준으로만 참여한다.
+모든 단계는 입력 순서 외의 무작위성이 없으므로 같은 입력에 대해 항상 같은 결과를 낸다.
+"""
+import asyncio
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+TOP_LEVEL_ORDER = 4  # 기술사
+X_SPACING = 220
+Y_SPACING = 150
+CROSSING_SWEEPS = 4
+COORDINATE_PASSES = 2
+
+# 이 크기 이상의 그래프는 이벤트 루프를 막지 않도록 스레드에서 계산
+OFFLOAD_THRESHOLD = 2000
+
+Position = Tuple[int, int]
+
+
+class _Dummy(tuple):
+    """긴 엣지를 분할하기 위한 가상 노드 (엣지 번호, 레이어)"""
+    __slots__ = ()
+
+
+def assign_layer(level_order: int, top_level_order: int = TOP_LEVEL_ORDER) -> int:
+    """level_order를 레이어 번호로 변환 (0이 최상단)"""
+    return top_level_order - min(max(level_order, 0), top_level_order)
+
+
+def count_crossings(upper: Sequence[Hashable], lower: Sequence[Hashable],
+                    down: Dict[Hashable, List[Hashable]]) -> int:
+    """
+    인접한 두 레이어 사이의 엣지 교차 수 (Fenwick 트리, O(E log V))
+    """
+    lower_pos = {node: i for i, node in enumerate(lower)}
+    targets = []
+    for node in upper:
+        targets.extend(sorted(lower_pos[m] for m in down.get(node, ())))
+    if not targets:
+        return 0
+
+    size = len(lower)
+    tree = [0] * (size + 1)
+    crossings = 0
+    seen = 0
+    for target in targets:
+        # 이미 본 엣지 중 target보다 오른쪽 끝점을 가진 것과 교차
+        i = target + 1
+        not_greater = 0
+        while i > 0:
+            not_greater += tree[i]
+            i -= i & -i
+        crossings += seen - not_greater
+        seen += 1
+        i = target + 1
+        while i <= size:
+            tree[i] += 1
+            i += i & -i
+    return crossings
+
+
+def _total_crossings(layers: List[List[Hashable]], down: Dict[Hashable, List[Hashable]]) -> int:
+    return sum(
+        count_crossings(layers[i], layers[i + 1], down)
+        for i in range(len(layers) - 1)
+    )
+
+
+def _reorder(layer: List[Hashable], neighbors: Dict[Hashable, List[Hashable]],
+             neighbor_pos: Dict[Hashable, int],
+             pinned_slots: Dict[Hashable, float]) -> List[Hashable]:
+    """
+    인접 레이어 이웃의 평균 위치(barycenter) 기준 정렬
+    이웃이 없으면 현재 위치를, 고정 노드는 고정 좌표에 해당하는 위치를 유지
+    """
+    keyed = []
+    for i, node in enumerate(layer):
+        adjacent = neighbors.get(node)
+        if node in pinned_slots:
+            key = pinned_slots[node]
+        elif adjacent:
+            key = sum(neighbor_pos[m] for m in adjacent) / len(adjacent)
+        else:
+            key = float(i)
+        keyed.append((key, i, node))
+    keyed.sort(key=lambda item: (item[0], item[1]))
+    return [node for _, _, node in keyed]
+
+
+def _place_layer(layer: List[Hashable], desired: List[float], spacing: int,
+                 pinned_x: Dict[Hashable, float]) -> List[float]:
+    """
+    정해진 순서를 지키면서 원하는 X에 최대한 가깝게 배치
+    (왼쪽부터 최소 간격을 보장한 뒤, 전체를 평균 오차만큼 평행 이동. 고정 노드는 그대로)
+    """
+    placed = []
+    prev = None
+    for x in desired:
+        if prev is not None and x < prev + spacing:
+            x = prev + spacing
+        placed.append(x)
+        prev = x
+    shift = (sum(desired) - sum(placed)) / len(placed)
+    return [
+        pinned_x[node] if node in pinned_x else x + shift
+        for node, x in zip(layer, placed)
+    ]
+
+
+def layered_layout(
+    nodes: Sequence[Tuple[int, int]],
+    edges: Sequence[Tuple[int, int]],
+    sweeps: int = CROSSING_SWEEPS,
+    x_spacing: int = X_SPACING,
+    y_spacing: int = Y_SPACING,
+    pinned: Optional[Dict[int, Position]] = None,
+) -> Dict[int, Position]:
+    """
+    계층형 레이아웃 계산
+
+    - nodes: (자격증 id, level_order) 목록. 입력 순서가 동점일 때의 기준이 된다.
+    - edges: (선수 자격증 id, 자격증 id) 목록
+    - pinned: 자격증 id -> 고정 좌표
+    - 반환: 자격증 id -> (x, y)
+    """
+    if not nodes:
+        return {}
+    pinned = dict(pinned or {})
+    pinned_x = {node_id: float(pos[0]) for node_id, pos in pinned.items()}
+    pinned_slots = {node_id: x / x_spacing for node_id, x in pinned_x.items()}
+
+    layer_of: Dict[Hashable, int] = {}
+    for node_id, level_order in nodes:
+        layer_of[node_id] = assign_layer(level_order or 0)
+    depth = max(layer_of.values()) + 1
+    layers: List[List[Hashable]] = [[] for _ in range(depth)]
+    for node_id, _ in nodes:
+        layers[layer_of[node_id]].append(node_id)
+
+    # 인접 레이어 간 연결만 남기고, 긴 엣지는 더미 노드로 분할
+    up: Dict[Hashable, List[Hashable]] = {}
+    down: Dict[Hashable, List[Hashable]] = {}
+    for index, (source, target) in enumerate(edges):
+        if source not in layer_of or target not in layer_of:
+            continue
+        top, bottom = (source, target) if layer_of[source] < layer_of[target] else (target, source)
+        top_layer, bottom_layer = layer_of[top], layer_of[bottom]
+        if top_layer == bottom_layer:
+            continue
+        prev = top
+        for layer in range(top_layer + 1, bottom_layer):
+            dummy = _Dummy((index, layer))
+            layers[layer].append(dummy)
+            down.setdefault(prev, []).append(dummy)
+            up.setdefault(dummy, []).append(prev)
+            prev = dummy
+        down.setdefault(prev, []).append(bottom)
+        up.setdefault(bottom, []).append(prev)
+
+    # 교차 최소화 (가장 교차가 적었던 배치를 유지)
+    best = [list(layer) for layer in layers]
+    best_crossings = _total_crossings(best, down)
+    for sweep in range(sweeps):
+        if best_crossings == 0:
+            break
+        if sweep % 2 == 0:
+            for i in range(1, depth):
+                pos = {node: j for j, node in enumerate(layers[i - 1])}
+                layers[i] = _reorder(layers[i], up, pos, pinned_slots)
+        else:
+            for i in range(depth - 2, -1, -1):
+                pos = {node: j for j, node in enumerate(layers[i + 1])}
+                layers[i] = _reorder(layers[i], down, pos, pinned_slots)
+        crossings = _total_crossings(layers, down)
+        if crossings < best_crossings:
+            best = [list(layer) for layer in layers]
+            best_crossings = crossings
+    layers = best
+
+    # 좌표 배정
+    x_of: Dict[Hashable, float] = {}
+    for layer in layers:
+        for j, node in enumerate(layer):
+            x_of[node] = pinned_x.get(node, float(j * x_spacing))
+    for coordinate_pass in range(COORDINATE_PASSES):
+        if coordinate_pass % 2 == 0:
+            order, neighbors = range(1, depth), up
+        else:
+            order, neighbors = range(depth - 2, -1, -1), down
+        for i in order:
+            layer = layers[i]
+            if not layer:
+                continue
+            desired = []
+            for node in layer:
+                adjacent = neighbors.get(node)
+                if adjacent:
+                    desired.append(sum(x_of[m] for m in adjacent) / len(adjacent))
+                else:
+                    desired.append(x_of[node])
+            for node, x in zip(layer, _place_layer(layer, desired, x_spacing, pinned_x)):
+                x_of[node] = x
+
+    real = [node_id for node_id, _ in nodes]
+    # 고정 노드가 있으면 좌표계를 옮기지 않음
+    min_x = 0.0 if pinned else min(x_of[node_id] for node_id in real)
+    positions = {
+        node_id: (int(round(x_of[node_id] - min_x)), layer_of[node_id] * y_spacing)
+        for node_id in real
+    }
+    for node_id, position in pinned.items():
+        if node_id in positions:
+            positions[node_id] = (int(position[0]), int(position[1]))
+    return positions
+
+
+async def compute_layout(
+    nodes: Sequence[Tuple[int, int]],
+    edges: Sequence[Tuple[int, int]],
+    pinned: Optional[Dict[int, Position]] = None,
+) -> Dict[int, Position]:
+    """
+    레이아웃 계산 (큰 그래프는 워커 스레드에서 실행)
+    """
+    if len(nodes) >= OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(layered_layout, nodes, edges, pinned=pinned)
+    return layered_layout(nodes, edges, pinned=pinned)
@@ -0,0 +1,180 @@
+"""
+비용/난이도 가중 최적 로드맵 계산
+
+자격증 하나를 취득하는 기대 비용 = (필기 + 실기 응시료) x 기대 응시 횟수(1 / 합격률)
+선수 자격증이 여러 개면 그중 하나만 있으면 되므로, 목표에서 선수 방향으로
+다익스트라 탐색을 하다가 처음 만나는 시작점(이미 취득했거나 선수 자격증이 없는 자격증)이
+가장 저렴한 경로의 출발점이 된다.
+
+탐색은 ORM 객체가 아니라 스냅샷에서 만든 정수 인덱스 배열 위에서 수행하고,
+같은 입력에 대한 결과는 스냅샷 버전별로 메모이즈한다.
+"""
+import heapq
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from app.services.graph import CertNode, GraphSnapshot
+
+DEFAULT_PASS_RATE = 0.5  # 합격률 정보가 없을 때
+MIN_PASS_RATE = 0.05  # 기대 응시 횟수 상한 (20회)
+ROADMAP_CACHE_SIZE = 4096
+
+
+def parse_pass_rate(value: Optional[str]) -> Optional[float]:
+    """'45.2%' -> 0.452"""
+    if not value:
+        return None
+    try:
+        rate = float(value.strip().rstrip("%")) / 100
+    except ValueError:
+        return None
+    return rate if rate > 0 else None
+
+
+def expected_attempts(node: CertNode) -> float:
+    """합격할 때까지의 기대 응시 횟수 (기하분포)"""
+    rate = parse_pass_rate(node.pass_rate) or DEFAULT_PASS_RATE
+    return 1 / max(min(rate, 1.0), MIN_PASS_RATE)
+
+
+def expected_cost(node: CertNode) -> float:
+    """취득까지의 기대 응시료"""
+    fee = (node.fee_written or 0) + (node.fee_practical or 0)
+    return fee * expected_attempts(node)
+
+
+class RoadmapIndex:
+    """
+    로드맵 탐색용 압축 인접 구조 (자격증 id 대신 0부터 시작하는 정수 인덱스 사용)
+    """
+
+    def __init__(self, snapshot: GraphSnapshot) -> None:
+        self.version = snapshot.version
+        self.ids: List[int] = list(snapshot.nodes)
+        self.index: Dict[int, int] = {cert_id: i for i, cert_id in enumerate(self.ids)}
+        self.cost: List[float] = [expected_cost(snapshot.nodes[i]) for i in self.ids]
+        self.attempts: List[float] = [expected_attempts(snapshot.nodes[i]) for i in self.ids]
+        self.prereqs: List[Tuple[int, ...]] = [
+            tuple(self.index[p] for p in snapshot.prerequisites.get(cert_id, ()))
+            for cert_id in self.ids
+        ]
+        self._ancestors = lru_cache(maxsize=ROADMAP_CACHE_SIZE)(self._ancestors_uncached)
+        self._solve = lru_cache(maxsize=ROADMAP_CACHE_SIZE)(self._solve_uncached)
+
+    def _ancestors_uncached(self, target: int) -> FrozenSet[int]:
+        seen = {target}
+        stack = [target]
+        while stack:
+            for prereq in self.prereqs[stack.pop()]:
+                if prereq not in seen:
+                    seen.add(prereq)
+                    stack.append(prereq)
+        return frozenset(seen)
+
+    def _solve_uncached(
+        self, target: int, acquired: FrozenSet[int]
+    ) -> Optional[Tuple[Optional[int], Tuple[int, ...], float]]:
+        """
+        반환: (출발점이 된 취득 자격증 또는 None, 취득할 자격증 경로, 총 기대 비용)
+        경로가 없으면 None
+        """
+        if target in acquired:
+            return target, (), 0.0
+
+        dist = {target: self.cost[target]}
+        parent: Dict[int, int] = {}
+        heap = [(self.cost[target], target)]
+        while heap:
+            d, node = heapq.heappop(heap)
+            if d > dist[node]:
+                continue
+            if node in acquired or not self.prereqs[node]:
+                # 경로 복원: node -> ... -> target
+                path = [node]
+                while path[-1] != target:
+                    path.append(parent[path[-1]])
+                if node in acquired:
+                    return node, tuple(path[1:]), d
+                return None, tuple(path), d
+            for prereq in self.prereqs[node]:
+                step = 0.0 if prereq in acquired else self.cost[prereq]
+                candidate = d + step
+                if candidate < dist.get(prereq, float("inf")):
+                    dist[prereq] = candidate
+                    parent[prereq] = node
+                    heapq.heappush(heap, (candidate, prereq))
+        return None
+
+    def cheapest_path(
+        self, target_id: int, acquired_ids: Iterable[int]
+    ) -> Optional[Tuple[Optional[int], List[int], float]]:
+        """
+        목표 자격증까지의 최저 비용 경로 (자격증 id 기준)
+        목표와 무관한 취득 자격증은 캐시 키에서 제외한다.
+        """
+        target = self.index[target_id]
+        ancestors = self._ancestors(target)
+        acquired = frozenset(
+            self.index[i] for i in acquired_ids
+            if i in self.index and self.index[i] in ancestors
+        )
+        solved = self._solve(target, acquired)
+        if solved is None:
+            return None
+        start, path, total = solved
+        return (
+            self.ids[start] if start is not None else None,
+            [self.ids[i] for i in path],
+            total,
+        )
+
+
+_index: Optional[RoadmapIndex] = None
+
+
+def get_roadmap_index(snapshot: GraphSnapshot) -> RoadmapIndex:
+    """스냅샷 버전에 맞는 인덱스 반환 (버전이 바뀌면 메모이즈 결과와 함께 새로 생성)"""
+    global _index
+    if _index is None or _index.version != snapshot.version:
+        _index = RoadmapIndex(snapshot)
+    return _index
+
+
+def plan_targets(
+    index: RoadmapIndex,
+    targets: List[int],
+    acquired: Set[int],
+    require_all: bool,
+) -> Optional[Tuple[List[int], List[int], float]]:
+    """
+    여러 목표에 대한 로드맵
+
+    - require_all=True: 모든 목표가 필요 (경로 합집합, 공통 단계는 한 번만 계산)
+    - require_all=False: 가장 저렴한 목표 하나
+    반환: (출발점 자격증 id 목록, 취득 순서대로의 자격증 id, 총 기대 비용)
+    """
+    plans = []
+    for target_id in targets:
+        solved = index.cheapest_path(target_id, acquired)
+        if solved is None:
+            if require_all:
+                return None
+            continue
+        plans.append(solved)
+    if not plans:
+        return None
+
+    if not require_all:
+        start, path, total = min(plans, key=lambda plan: plan[2])
+        return ([start] if start is not None else []), path, total
+
+    starts: List[int] = []
+    steps: List[int] = []
+    for start, path, _ in plans:
+        if start is not None and start not in starts:
+            starts.append(start)
+        for cert_id in path:
+            if cert_id not in steps:
+                steps.append(cert_id)
+    total = sum(index.cost[index.index[cert_id]] for cert_id in steps)
+    return starts, steps, total
@@ -0,0 +1,160 @@
+"""
+자격증/커리어 통합 검색
+
+두 검색을 각각 별도의 풀 연결에서 동시에 실행하고, 같은 점수 함수로 합쳐 정렬한다.
+점수(관련도 + 이름 일치 가산점)는 SQL에서 계산하므로 유형별 상위 limit개도 같은 점수로 고른다.
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from sqlalchemy import case, func, literal
+from sqlalchemy.future import select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.db.search import SearchMode, search_condition
+from app.models.career import CareerPath
+from app.models.certification import Certification
+from app.schemas.search import SearchKind
+
+DEFAULT_SEARCH_LIMIT = 10
+
+# 이름이 검색어와 같거나 검색어로 시작하면 가산점 (ts_rank는 보통 0~1 사이)
+EXACT_NAME_BONUS = 1.0
+PREFIX_NAME_BONUS = 0.5
+
+
+@dataclass
+class SearchHit:
+    kind: SearchKind
+    id: int
+    name: str
+    category: Optional[str]
+    level: Optional[str]
+    career_type: Optional[str]
+    score: float
+
+
+def score_expression(
+    search: str, name: ColumnElement, rank: Optional[ColumnElement]
+) -> ColumnElement:
+    """
+    자격증/커리어 공통 점수 식 = 전문 검색 관련도 + 이름 일치 가산점
+    이름과 검색어는 공백을 모두 빼고 소문자로 비교한다.
+    """
+    normalized_search = "".join(search.split()).lower()
+    normalized_name = func.lower(func.regexp_replace(name, r"\s+", "", "g"))
+    bonus = case(
+        (normalized_name == normalized_search, EXACT_NAME_BONUS),
+        (normalized_name.startswith(normalized_search, autoescape=True), PREFIX_NAME_BONUS),
+        else_=0.0,
+    )
+    return (rank if rank is not None else literal(0.0)) + bonus
+
+
+async def search_certifications(
+    search: str, mode: SearchMode, limit: int
+) -> Tuple[List[SearchHit], int]:
+    """활성 자격증 검색 (반환: 상위 결과, 전체 일치 수)"""
+    from app.db.session import SessionLocal
+
+    condition, rank = search_condition(
+        search, Certification.search_vector, [Certification.name], mode
+    )
+    score = score_expression(search, Certification.name, rank)
+    query = select(
+        Certification.id,
+        Certification.name,
+        Certification.category_main,
+        Certification.level,
+        score.label("score"),
+        func.count().over().label("total"),
+    ).where(
+        Certification.is_active == True,
+        condition,
+    ).order_by(
+        score.desc(), Certification.level_order.desc(), Certification.name, Certification.id
+    ).limit(limit)
+
+    async with SessionLocal() as session:
+        result = await session.execute(query)
+        rows = result.all()
+
+    hits = [
+        SearchHit(
+            kind=SearchKind.certification,
+            id=row.id,
+            name=row.name,
+            category=row.category_main,
+            level=row.level,
+            career_type=None,
+            score=round(row.score, 6),
+        )
+        for row in rows
+    ]
+    return hits, rows[0].total if rows else 0
+
+
+async def search_careers(
+    search: str, mode: SearchMode, limit: int
+) -> Tuple[List[SearchHit], int]:
+    """활성 커리어 검색 (반환: 상위 결과, 전체 일치 수)"""
+    from app.db.session import SessionLocal
+
+    condition, rank = search_condition(
+        search, CareerPath.search_vector, [CareerPath.name], mode
+    )
+    score = score_expression(search, CareerPath.name, rank)
+    query = select(
+        CareerPath.id,
+        CareerPath.name,
+        CareerPath.category,
+        CareerPath.type,
+        score.label("score"),
+        func.count().over().label("total"),
+    ).where(
+        CareerPath.is_active == True,
+        condition,
+    ).order_by(
+        score.desc(), CareerPath.name, CareerPath.id
+    ).limit(limit)
+
+    async with SessionLocal() as session:
+        result = await session.execute(query)
+        rows = result.all()
+
+    hits = [
+        SearchHit(
+            kind=SearchKind.career,
+            id=row.id,
+            name=row.name,
+            category=row.category,
+            level=None,
+            career_type=row.type,
+            score=round(row.score, 6),
+        )
+        for row in rows
+    ]
+    return hits, rows[0].total if rows else 0
+
+
+async def unified_search(
+    search: str,
+    mode: SearchMode = SearchMode.fulltext,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+) -> Tuple[Tuple[List[SearchHit], int], Tuple[List[SearchHit], int], List[SearchHit]]:
+    """
+    반환: ((자격증 결과, 자격증 수), (커리어 결과, 커리어 수), 점수순으로 합친 상위 limit개)
+    """
+    (cert_hits, cert_total), (career_hits, career_total) = await asyncio.gather(
+        search_certifications(search, mode, limit),
+        search_careers(search, mode, limit),
+    )
+    cert_hits.sort(key=_rank_key)
+    career_hits.sort(key=_rank_key)
+    merged = sorted(cert_hits + career_hits, key=_rank_key)[:limit]
+    return (cert_hits, cert_total), (career_hits, career_total), merged
+
+
+def _rank_key(hit: SearchHit):
+    return (-hit.score, hit.kind != SearchKind.certification, hit.name, hit.id)
@@ -0,0 +1,259 @@
+"""
+검색어 자동완성 (프로세스 로컬 인덱스)
+
+자격증/커리어 이름을 정규화한 키와 초성 키로 만든 정렬 배열에서 bisect로 접두사 범위를 찾는다.
+- 완성된 음절 접두사: "정보처" -> 정보처리기사
+- 초성: "ㅈㅂㅊㄹ" -> 정보처리기사
+- 음절과 초성 혼합: "정보ㅊㄹ" -> 정보처리기사
+- 띄어쓴 이름은 각 단어의 시작에서도 일치
+카탈로그가 변경되면 다시 빌드하고, 조회 시에는 DB에 접근하지 않는다.
+다른 워커에서 바뀐 자격증/커리어는 변경 스탬프(app.db.stamps)를 비교해 감지한다.
+"""
+import asyncio
+import heapq
+import logging
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.db.stamps import EMPTY_STAMP, current_stamps
+from app.models.career import CareerPath
+from app.models.certification import Certification
+from app.models.user import UserCertification, UserGoal
+
+logger = logging.getLogger(__name__)
+
+# 인덱스가 따라가는 변경 스탬프 테이블
+SUGGEST_STAMP_TABLES = ("certification", "careerpath")
+
+# 한글 음절의 초성 (유니코드 호환 자모)
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A3
+SYLLABLES_PER_CHOSUNG = 588  # 중성 21 x 종성 28
+
+# 접두사 범위의 끝을 찾기 위한 가장 큰 문자
+PREFIX_END = "\U0010ffff"
+
+KIND_CERTIFICATION = "certification"
+KIND_CAREER = "career"
+
+DEFAULT_SUGGEST_LIMIT = 10
+SUGGEST_CACHE_SIZE = 4096
+# 인기도(취득/목표 사용자 수)를 반영하기 위해 카탈로그 변경이 없어도 주기적으로 재빌드
+SUGGEST_MAX_AGE = 600
+
+
+def chosung_of(char: str) -> str:
+    """한글 음절이면 초성, 아니면 그대로"""
+    code = ord(char)
+    if HANGUL_START <= code <= HANGUL_END:
+        return CHOSUNG[(code - HANGUL_START) // SYLLABLES_PER_CHOSUNG]
+    return char
+
+
+def normalize(text: str) -> str:
+    """공백 제거 + 소문자"""
+    return "".join(text.split()).lower()
+
+
+def to_chosung(text: str) -> str:
+    return "".join(chosung_of(char) for char in text)
+
+
+def _char_matches(query_char: str, name_char: str) -> bool:
+    if query_char in CHOSUNG:
+        return chosung_of(name_char) == query_char
+    return query_char == name_char
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    kind: str  # certification / career
+    id: int
+    name: str
+    level: Optional[str]
+    category: Optional[str]
+    score: Tuple[int, int]  # (인기도, level_order)
+
+
+class SuggestIndex:
+    """
+    접두사 검색용 정렬 배열
+
+    names: (정규화한 이름 접미부, 항목 번호) 정렬 목록 - 이름 전체와 각 단어 시작 위치
+    chosungs: 같은 키의 초성 버전
+    """
+
+    def __init__(self, entries: List[Suggestion]) -> None:
+        self.entries = entries
+        names: List[Tuple[str, int]] = []
+        chosungs: List[Tuple[str, int]] = []
+        for i, entry in enumerate(entries):
+            words = entry.name.split()
+            for start in range(len(words)):
+                key = normalize("".join(words[start:]))
+                names.append((key, i))
+                chosungs.append((to_chosung(key), i))
+        names.sort()
+        chosungs.sort()
+        self._names = names
+        self._name_keys = [key for key, _ in names]
+        self._chosungs = chosungs
+        self._chosung_keys = [key for key, _ in chosungs]
+        self._search = lru_cache(maxsize=SUGGEST_CACHE_SIZE)(self._search_uncached)
+
+    def search(self, query: str, limit: int = DEFAULT_SUGGEST_LIMIT) -> List[Suggestion]:
+        return self._search(normalize(query), limit)
+
+    def _search_uncached(self, query: str, limit: int) -> List[Suggestion]:
+        if not query:
+            return []
+        if all(char in CHOSUNG for char in query):
+            matched = self._prefix(self._chosungs, self._chosung_keys, query)
+        else:
+            # 첫 초성 앞까지의 음절로 범위를 좁힌 뒤 글자 단위로 확인
+            literal = query
+            for position, char in enumerate(query):
+                if char in CHOSUNG:
+                    literal = query[:position]
+                    break
+            matched = self._prefix(self._names, self._name_keys, literal)
+            if literal != query:
+                matched = [
+                    (key, i) for key, i in matched
+                    if len(key) >= len(query)
+                    and all(_char_matches(q, c) for q, c in zip(query, key))
+                ]
+
+        seen = set()
+        candidates = []
+        for _, i in matched:
+            if i not in seen:
+                seen.add(i)
+                candidates.append(i)
+        best = heapq.nsmallest(limit, candidates, key=self._rank_key)
+        return [self.entries[i] for i in best]
+
+    @staticmethod
+    def _prefix(pairs: List[Tuple[str, int]], keys: List[str], prefix: str) -> List[Tuple[str, int]]:
+        start = bisect_left(keys, prefix)
+        end = bisect_left(keys, prefix + PREFIX_END, start)
+        return pairs[start:end]
+
+    def _rank_key(self, i: int):
+        entry = self.entries[i]
+        popularity, level_order = entry.score
+        return (-popularity, -level_order, len(entry.name), entry.name, i)
+
+
+async def load_suggest_index(db: AsyncSession) -> SuggestIndex:
+    """활성 자격증/커리어와 자격증별 인기도(취득 또는 목표로 등록한 사용자 수) 로드"""
+    holders = union_all(
+        select(UserCertification.certification_id, UserCertification.user_id),
+        select(UserGoal.certification_id, UserGoal.user_id),
+    ).subquery()
+    popularity_result = await db.execute(
+        select(holders.c.certification_id, func.count(func.distinct(holders.c.user_id)))
+        .group_by(holders.c.certification_id)
+    )
+    popularity: Dict[int, int] = dict(popularity_result.all())
+
+    entries: List[Suggestion] = []
+    cert_result = await db.execute(
+        select(
+            Certification.id,
+            Certification.name,
+            Certification.level,
+            Certification.level_order,
+            Certification.category_main,
+        ).where(Certification.is_active == True)
+    )
+    for row in cert_result.all():
+        entries.append(Suggestion(
+            kind=KIND_CERTIFICATION,
+            id=row.id,
+            name=row.name,
+            level=row.level,
+            category=row.category_main,
+            score=(popularity.get(row.id, 0), row.level_order or 0),
+        ))
+
+    career_result = await db.execute(
+        select(CareerPath.id, CareerPath.name, CareerPath.category)
+        .where(CareerPath.is_active == True)
+    )
+    for row in career_result.all():
+        entries.append(Suggestion(
+            kind=KIND_CAREER,
+            id=row.id,
+            name=row.name,
+            level=None,
+            category=row.category,
+            score=(0, 0),
+        ))
+    return SuggestIndex(entries)
+
+
+class SuggestStore:
+    """
+    자동완성 인덱스 보관소 (GraphStore와 같이 변경 시 표시만 하고 다음 조회 때 재빌드)
+    조회할 때 자격증/커리어 변경 스탬프가 인덱스와 다르면(다른 워커의 변경) 역시 다시 빌드한다.
+    """
+
+    def __init__(self) -> None:
+        self._index: Optional[SuggestIndex] = None
+        self._built_at = 0.0
+        self._stamps: Optional[Tuple[int, ...]] = None  # 인덱스가 반영한 스탬프 버전
+        self._stale = True
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self._stale
+            or self._index is None
+            or time.monotonic() - self._built_at > SUGGEST_MAX_AGE
+        )
+
+    def invalidate(self) -> None:
+        self._stale = True
+
+    async def get(self, db: AsyncSession) -> SuggestIndex:
+        stamps = await self._current_stamps()
+        if stamps is not None and self._index is not None and stamps != self._stamps:
+            self._stale = True
+        if not self.is_stale:
+            return self._index
+
+        async with self._lock:
+            if self.is_stale:
+                self._stale = False
+                # 스탬프는 데이터보다 먼저 읽음 (사이에 커밋된 변경은 다음 조회에서 다시 감지)
+                stamps = await self._current_stamps()
+                try:
+                    index = await load_suggest_index(db)
+                except Exception:
+                    self._stale = True
+                    raise
+                self._index = index
+                self._stamps = stamps
+                self._built_at = time.monotonic()
+        return self._index
+
+    async def _current_stamps(self) -> Optional[Tuple[int, ...]]:
+        try:
+            stamps = await current_stamps()
+        except Exception:
+            logger.warning("change stamps unavailable, suggest index follows local changes only", exc_info=True)
+            return None
+        return tuple(stamps.get(table, EMPTY_STAMP).version for table in SUGGEST_STAMP_TABLES)
+
+
+suggest_store = SuggestStore()
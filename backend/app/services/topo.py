@@ -0,0 +1,143 @@
+"""
+동적 위상 정렬 (Pearce-Kelly)
+
+엣지(선수 자격증 -> 자격증)가 추가될 때마다 전체를 다시 정렬하지 않고,
+순서를 어기는 구간([ord(target), ord(source)])의 노드만 재배치한다.
+추가하려는 엣지가 순환을 만들면 CycleError를 던지고 상태는 바뀌지 않는다.
+"""
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class CycleError(Exception):
+    """엣지를 추가하면 순환이 생기는 경우"""
+
+    def __init__(self, source: int, target: int) -> None:
+        super().__init__(f"edge {source} -> {target} would create a cycle")
+        self.source = source
+        self.target = target
+
+
+class DynamicTopologicalOrder:
+    """
+    노드마다 정수 순서(ord)를 유지하며, 모든 엣지 u -> v에 대해 ord[u] < ord[v]를 보장한다.
+    """
+
+    def __init__(self, nodes: Iterable[int], edges: Iterable[Tuple[int, int]]) -> None:
+        self.successors: Dict[int, Set[int]] = {}
+        self.predecessors: Dict[int, Set[int]] = {}
+        for node in nodes:
+            self.successors[node] = set()
+            self.predecessors[node] = set()
+        for source, target in edges:
+            if source in self.successors and target in self.successors:
+                self.successors[source].add(target)
+                self.predecessors[target].add(source)
+
+        self.ord: Dict[int, int] = {}
+        # 기존 데이터에 이미 순환이 있으면 해당 노드들은 정렬할 수 없으므로 따로 기록
+        self.cyclic: Set[int] = set()
+        self._initial_order()
+        self._order: Optional[List[int]] = None
+
+    def _initial_order(self) -> None:
+        """Kahn 알고리즘 (같은 단계에서는 id가 작은 노드부터)"""
+        indegree = {node: len(preds) for node, preds in self.predecessors.items()}
+        heap = [node for node, degree in indegree.items() if degree == 0]
+        heapq.heapify(heap)
+        position = 0
+        while heap:
+            node = heapq.heappop(heap)
+            self.ord[node] = position
+            position += 1
+            for successor in self.successors[node]:
+                indegree[successor] -= 1
+                if indegree[successor] == 0:
+                    heapq.heappush(heap, successor)
+        for node in sorted(set(self.successors) - set(self.ord)):
+            self.cyclic.add(node)
+            self.ord[node] = position
+            position += 1
+
+    def __contains__(self, node: int) -> bool:
+        return node in self.ord
+
+    def order(self) -> List[int]:
+        """위상 순서대로 정렬된 노드 목록"""
+        if self._order is None:
+            self._order = sorted(self.ord, key=self.ord.__getitem__)
+        return self._order
+
+    def add_node(self, node: int) -> None:
+        if node in self.ord:
+            return
+        self.successors[node] = set()
+        self.predecessors[node] = set()
+        self.ord[node] = max(self.ord.values(), default=-1) + 1
+        self._order = None
+
+    def _forward(self, start: int, upper: int, source: int) -> List[int]:
+        """start에서 ord가 upper보다 작은 노드만 따라 내려감 (source에 닿으면 순환)"""
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for successor in self.successors[node]:
+                if successor == source:
+                    raise CycleError(source, start)
+                if successor not in visited and self.ord[successor] < upper:
+                    visited.add(successor)
+                    stack.append(successor)
+        return list(visited)
+
+    def _backward(self, start: int, lower: int) -> List[int]:
+        """start에서 ord가 lower보다 큰 노드만 따라 올라감"""
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for predecessor in self.predecessors[node]:
+                if predecessor not in visited and self.ord[predecessor] > lower:
+                    visited.add(predecessor)
+                    stack.append(predecessor)
+        return list(visited)
+
+    def check_edge(self, source: int, target: int) -> Tuple[List[int], List[int]]:
+        """
+        source -> target 추가 시 재배치가 필요한 (뒤로 보낼 노드, 앞으로 당길 노드)
+        순환이 생기면 CycleError
+        """
+        if source == target:
+            raise CycleError(source, target)
+        lower, upper = self.ord[target], self.ord[source]
+        if lower > upper:
+            return [], []
+        return self._forward(target, upper, source), self._backward(source, lower)
+
+    def creates_cycle(self, source: int, target: int) -> bool:
+        try:
+            self.check_edge(source, target)
+        except CycleError:
+            return True
+        return False
+
+    def add_edge(self, source: int, target: int) -> None:
+        """엣지 추가 및 영향 구간만 재정렬"""
+        if target in self.successors[source]:
+            return
+        forward, backward = self.check_edge(source, target)
+        if forward:
+            forward.sort(key=self.ord.__getitem__)
+            backward.sort(key=self.ord.__getitem__)
+            nodes = backward + forward
+            slots = sorted(self.ord[node] for node in nodes)
+            for node, slot in zip(nodes, slots):
+                self.ord[node] = slot
+            self._order = None
+        self.successors[source].add(target)
+        self.predecessors[target].add(source)
+
+    def remove_edge(self, source: int, target: int) -> None:
+        """엣지 제거 (기존 순서는 그대로 유효)"""
+        self.successors.get(source, set()).discard(target)
+        self.predecessors.get(target, set()).discard(source)
@@ -0,0 +1,65 @@
+"""
+선수 자격증 관계 재귀 탐색 (PostgreSQL recursive CTE)
+"""
+from typing import Iterable
+
+from sqlalchemy import literal
+from sqlalchemy.future import select
+from sqlalchemy.sql.selectable import CTE
+
+from app.models.certification import Certification, certification_prerequisites
+
+# 순환이 남아 있더라도 탐색이 끝나도록 하는 최대 깊이
+MAX_TREE_DEPTH = 20
+
+
+def prerequisite_walk(
+    start_ids: Iterable[int],
+    upward: bool,
+    max_depth: int = MAX_TREE_DEPTH,
+    name: str = "walk",
+) -> CTE:
+    """
+    시작 자격증에서 선수 관계를 따라가는 재귀 CTE
+
+    - upward=True: 선수 자격증 방향 (조상)
+    - upward=False: 해당 자격증이 선수인 자격증 방향 (후손)
+
+    결과 컬럼: start_id(시작 자격증), source(선수 자격증), target(자격증),
+    node_id(새로 도달한 자격증), depth
+    비활성 자격증은 지나가지 않으며, 같은 (엣지, 깊이)는 한 번만 남긴다(UNION).
+    """
+    cp = certification_prerequisites
+    if upward:
+        origin, reached = cp.c.certification_id, cp.c.prerequisite_id
+    else:
+        origin, reached = cp.c.prerequisite_id, cp.c.certification_id
+    base = select(
+        origin.label("start_id"),
+        cp.c.prerequisite_id.label("source"),
+        cp.c.certification_id.label("target"),
+        reached.label("node_id"),
+        literal(1).label("depth"),
+    ).join(
+        Certification, Certification.id == reached
+    ).where(
+        origin.in_(start_ids),
+        Certification.is_active == True,
+    )
+    walk = base.cte(name, recursive=True)
+
+    step = select(
+        walk.c.start_id,
+        cp.c.prerequisite_id,
+        cp.c.certification_id,
+        reached,
+        walk.c.depth + 1,
+    ).join(
+        walk, origin == walk.c.node_id
+    ).join(
+        Certification, Certification.id == reached
+    ).where(
+        Certification.is_active == True,
+        walk.c.depth < max_depth,
+    )
+    return walk.union(step)
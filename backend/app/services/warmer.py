@@ -0,0 +1,158 @@
+"""
+캐시 예열 / 백그라운드 갱신
+
+배포 직후 첫 사용자가 빈 캐시에서 수 초씩 기다리지 않도록, 앱 시작 시와 카탈로그 변경 후에
+자주 쓰는 응답을 요청 처리와 별개로 미리 만들어 둔다.
+
+- 그래프 스냅샷과 전체/대분류별 그래프 본문
+- 카테고리 트리, 자격증(전체/대분류별)/커리어 목록 첫 페이지 (응답 캐시)
+
+응답 캐시 항목은 CACHE_WARM_INTERVAL초마다 새로 계산해 덮어쓰므로 만료되기 전에 교체되고,
+갱신하는 동안 다른 요청은 기존 항목을 그대로 받는다. (그래프는 GraphStore가 재빌드 중 직전 스냅샷으로 응답)
+"""
+import asyncio
+import inspect
+import logging
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence
+
+from fastapi import Response
+from pydantic.fields import FieldInfo
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import current_validator
+from app.core.config import settings
+from app.core.http_cache import validators
+from app.core.payload import BROTLI_QUALITY
+from app.core.response_cache import response_cache
+from app.db.stamps import current_stamps
+from app.services.graph import graph_store
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_graph(db: AsyncSession) -> Sequence[str]:
+    """그래프 스냅샷과 전체/대분류별 응답 본문 생성 (최고 압축률), 반환: 대분류 목록"""
+    snapshot = await graph_store.get(db, allow_stale=False)
+    categories = sorted(snapshot.categories)
+    for category in [None, *categories]:
+        await snapshot.payload(category, brotli_quality=BROTLI_QUALITY)
+    return categories
+
+
+async def refresh_endpoint(endpoint: Callable, db: AsyncSession, **values: Any) -> None:
+    """
+    응답 캐시가 붙은 엔드포인트를 기본 쿼리 파라미터로 호출해 캐시 항목을 새로 채움 (values로 일부 지정)
+    HTTP 캐시 미들웨어와 같은 검증자를 항목에 저장해야 실제 요청이 최신 항목으로 쓴다.
+    """
+    arguments = {}
+    for name, parameter in inspect.signature(endpoint).parameters.items():
+        if name in values:
+            arguments[name] = values[name]
+        elif parameter.annotation is AsyncSession:
+            arguments[name] = db
+        elif parameter.annotation is Response:
+            arguments[name] = Response()
+        elif isinstance(parameter.default, FieldInfo):
+            arguments[name] = parameter.default.default
+
+    policy = getattr(endpoint, "cache_policy", None)
+    etag = None
+    if policy is not None and policy.tables:
+        etag, _ = validators(await current_stamps(), policy.tables)
+
+    token = current_validator.set(etag)
+    try:
+        with response_cache.refreshing():
+            await endpoint(**arguments)
+    finally:
+        current_validator.reset(token)
+
+
+async def warm_responses(db: AsyncSession, categories: Sequence[str]) -> None:
+    """카테고리 트리와 목록 첫 페이지"""
+    from app.api.v1.endpoints import careers, certifications
+
+    await refresh_endpoint(certifications.get_categories, db)
+    await refresh_endpoint(certifications.list_certifications, db)
+    for category in categories:
+        await refresh_endpoint(certifications.list_certifications, db, category=category)
+    await refresh_endpoint(careers.list_careers, db)
+
+
+async def warm(db: AsyncSession) -> None:
+    # 직전 변경으로 예약된 L2 삭제가 새로 채운 항목을 지우지 않도록 먼저 끝냄
+    await response_cache.wait()
+    categories = await warm_graph(db)
+    await warm_responses(db, categories)
+
+
+class CacheWarmer:
+    """
+    백그라운드 캐시 예열
+
+    schedule()은 LayoutRecomputer처럼 실행 중이면 끝난 뒤 한 번만 더 실행하고,
+    start()로 시작한 주기 작업은 interval초마다 예열을 예약한다.
+    """
+
+    def __init__(self, interval: float, enabled: bool = True) -> None:
+        self.interval = interval
+        self.enabled = enabled
+        self.last_warmed_at: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self._periodic: Optional[asyncio.Task] = None
+        self._pending = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def schedule(self) -> None:
+        """예열 예약 (요청 처리를 기다리게 하지 않음)"""
+        if not self.enabled:
+            return
+        self._pending = True
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        from app.db.session import SessionLocal
+
+        while self._pending:
+            self._pending = False
+            try:
+                async with SessionLocal() as session:
+                    await warm(session)
+            except Exception:
+                logger.exception("cache warm-up failed")
+            else:
+                self.last_warmed_at = datetime.utcnow()
+
+    async def _loop(self) -> None:
+        while True:
+            self.schedule()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """앱 시작 시 예열 후 주기적으로 갱신"""
+        if self.enabled and self._periodic is None:
+            self._periodic = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        tasks = [task for task in (self._periodic, self._task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._periodic = None
+        self._task = None
+
+    async def wait(self) -> None:
+        """진행 중인 예열이 끝날 때까지 대기"""
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+
+cache_warmer = CacheWarmer(
+    interval=settings.CACHE_WARM_INTERVAL,
+    enabled=settings.CACHE_WARM_ENABLED,
+)
@@ -1,14 +1,31 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.http_cache import HTTPCacheMiddleware
+from app.services.warmer import cache_warmer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 캐시 예열은 백그라운드에서 (시작 직후 요청도 바로 받음)
+    cache_warmer.start()
+    yield
+    await cache_warmer.stop()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
+# 공개 조회 Cache-Control / 조건부 요청 (CORS 헤더가 304에도 붙도록 CORS보다 안쪽)
+app.add_middleware(HTTPCacheMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,183 @@
+"""
+인덱스 마이그레이션 전/후 쿼리 벤치마크
+
+별도 스키마(bench_indexes)에 합성 데이터를 만든 뒤, 모델의 기본 단일 컬럼 인덱스만 있는 상태와
+마이그레이션(77034d362509)의 인덱스를 추가한 상태에서 주요 쿼리의 실행 시간을 비교한다.
+실행 후 스키마는 삭제한다.
+
+사용법: python scripts/bench_indexes.py [규모 배수 (기본 1 = 자격증 10만, 사용자 자격증 100만 행)]
+"""
+import asyncio
+import json
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+
+SCHEMA = "bench_indexes"
+REPEAT = 20
+
+BASE_ROWS = {
+    "certification": 100_000,
+    "careerpath": 50_000,
+    "requirement": 300_000,
+    "examschedule": 400_000,
+    "user_certifications": 1_000_000,
+    "user_goals": 1_000_000,
+}
+USERS = 200_000
+CATEGORIES = 30
+
+# 기존 모델의 index=True / 기본 키 인덱스
+BASELINE_DDL = [
+    """CREATE TABLE certification (
+        id integer PRIMARY KEY, name varchar NOT NULL, code varchar, category_main varchar,
+        category_sub varchar, level varchar, level_order integer, is_active boolean)""",
+    "CREATE INDEX ON certification (name)",
+    "CREATE INDEX ON certification (category_main)",
+    "CREATE INDEX ON certification (category_sub)",
+    "CREATE INDEX ON certification (level)",
+    """CREATE TABLE careerpath (
+        id integer PRIMARY KEY, name varchar NOT NULL, type varchar, category varchar,
+        is_active boolean)""",
+    "CREATE INDEX ON careerpath (name)",
+    "CREATE INDEX ON careerpath (type)",
+    "CREATE INDEX ON careerpath (category)",
+    """CREATE TABLE requirement (
+        id integer PRIMARY KEY, career_path_id integer, certification_id integer,
+        is_mandatory boolean)""",
+    """CREATE TABLE examschedule (
+        id integer PRIMARY KEY, certification_id integer, exam_date date)""",
+    """CREATE TABLE user_certifications (
+        id integer PRIMARY KEY, user_id integer NOT NULL, certification_id integer NOT NULL)""",
+    """CREATE TABLE user_goals (
+        id integer PRIMARY KEY, user_id integer NOT NULL, certification_id integer NOT NULL,
+        status varchar)""",
+]
+
+FILL_SQL = {
+    "certification": """
+        INSERT INTO certification
+        SELECT g, 'cert-' || md5(g::text), 'C' || g, 'cat-' || (g % {categories}),
+               'sub-' || (g % 300), (ARRAY['기술사','기사','산업기사','기능사'])[g % 4 + 1],
+               g % 5, g % 10 <> 0
+        FROM generate_series(1, {rows}) g""",
+    "careerpath": """
+        INSERT INTO careerpath
+        SELECT g, 'career-' || md5(g::text), CASE WHEN g % 3 = 0 THEN 'startup' ELSE 'job' END,
+               'cat-' || (g % {categories}), g % 10 <> 0
+        FROM generate_series(1, {rows}) g""",
+    "requirement": """
+        INSERT INTO requirement
+        SELECT g, 1 + (g * 7919) % {careers}, 1 + (g * 104729) % {certifications}, g % 2 = 0
+        FROM generate_series(1, {rows}) g""",
+    "examschedule": """
+        INSERT INTO examschedule
+        SELECT g, 1 + (g * 7919) % {certifications}, date '2026-01-01' + (g % 365)
+        FROM generate_series(1, {rows}) g""",
+    "user_certifications": """
+        INSERT INTO user_certifications
+        SELECT g, 1 + g % {users}, 1 + (g / {users} * 7919 + g % {users}) % {certifications}
+        FROM generate_series(1, {rows}) g""",
+    "user_goals": """
+        INSERT INTO user_goals
+        SELECT g, 1 + g % {users}, 1 + (g / {users} * 104729 + g % {users}) % {certifications}, 'pending'
+        FROM generate_series(1, {rows}) g""",
+}
+
+# 마이그레이션 77034d362509와 같은 정의
+MIGRATION_DDL = [
+    "CREATE INDEX ON certification (category_main, coalesce(level_order, 0) DESC, name, id) "
+    "INCLUDE (code, category_sub, level, level_order) WHERE is_active = true",
+    "CREATE INDEX ON careerpath (name, id) WHERE is_active",
+    "CREATE INDEX ON requirement (career_path_id)",
+    "CREATE INDEX ON requirement (certification_id)",
+    "CREATE INDEX ON examschedule (certification_id)",
+    "CREATE UNIQUE INDEX ON user_certifications (user_id, certification_id)",
+    "CREATE UNIQUE INDEX ON user_goals (user_id, certification_id)",
+]
+
+# (이름, SQL) - 엔드포인트에서 실제로 실행되는 형태
+QUERIES = [
+    ("certifications by category", """
+        SELECT id, name, code, category_main, category_sub, level, level_order
+        FROM certification WHERE is_active = true AND category_main = 'cat-7'
+        ORDER BY coalesce(level_order, 0) DESC, name, id LIMIT 100"""),
+    ("active careers page", """
+        SELECT id, name, type FROM careerpath WHERE is_active
+        ORDER BY name, id LIMIT 100"""),
+    ("career requirements", """
+        SELECT * FROM requirement WHERE career_path_id = 4242"""),
+    ("careers requiring cert", """
+        SELECT * FROM requirement WHERE certification_id = 4242"""),
+    ("exam schedules of cert", """
+        SELECT * FROM examschedule WHERE certification_id = 4242 ORDER BY exam_date"""),
+    ("my certifications", """
+        SELECT * FROM user_certifications WHERE user_id = 4242"""),
+    ("goal duplicate check", """
+        SELECT 1 FROM user_goals WHERE user_id = 4242 AND certification_id = 17"""),
+]
+
+
+async def timings(conn):
+    """쿼리별 실행 시간 중앙값 (ms, EXPLAIN ANALYZE 기준)"""
+    result = {}
+    for name, sql in QUERIES:
+        samples = []
+        for _ in range(REPEAT):
+            plan = (await conn.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"))).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            samples.append(plan[0]["Execution Time"])
+        result[name] = statistics.median(samples)
+    return result
+
+
+async def main(scale: float) -> None:
+    engine = create_async_engine(settings.SQLALCHEMY_DATABASE_URI)
+    rows = {table: int(count * scale) for table, count in BASE_ROWS.items()}
+    params = {
+        "categories": CATEGORIES,
+        "users": int(USERS * scale),
+        "certifications": rows["certification"],
+        "careers": rows["careerpath"],
+    }
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.execute(text(f"SET search_path TO {SCHEMA}"))
+            for ddl in BASELINE_DDL:
+                await conn.execute(text(ddl))
+            for table, sql in FILL_SQL.items():
+                print(f"filling {table} ({rows[table]:,} rows)...")
+                await conn.execute(text(sql.format(rows=rows[table], **params)))
+            await conn.commit()
+            await conn.execute(text(f"ANALYZE {', '.join(FILL_SQL)}"))
+
+            before = await timings(conn)
+            for ddl in MIGRATION_DDL:
+                await conn.execute(text(ddl))
+            await conn.commit()
+            await conn.execute(text(f"ANALYZE {', '.join(FILL_SQL)}"))
+            after = await timings(conn)
+
+            print(f"\n{'query':<28} {'before(ms)':>11} {'after(ms)':>10} {'speedup':>8}")
+            for name, _ in QUERIES:
+                speedup = before[name] / after[name] if after[name] else float("inf")
+                print(f"{name:<28} {before[name]:>11.3f} {after[name]:>10.3f} {speedup:>7.1f}x")
+
+            await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+            await conn.commit()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0))
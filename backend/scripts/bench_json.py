@@ -0,0 +1,184 @@
+"""
+응답 JSON 인코딩 벤치마크 (기본 경로 vs app.core.serialization)
+
+기본 경로: response_model 검증(from_attributes) -> model_dump(mode="json") -> encode_json
+빠른 경로: json_encoder(response_model)
+
+합성 ORM 객체로 두 경로의 본문이 바이트 단위로 같은지 먼저 확인한 뒤 시간을 잰다.
+사용법: python scripts/bench_json.py [행 수 ...]
+"""
+import os
+import random
+import sys
+import time
+from datetime import date
+from types import SimpleNamespace
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.core.payload import encode_json  # noqa: E402
+from app.core.serialization import json_encoder, orjson  # noqa: E402
+from app.schemas.career import Career, CareerSimple  # noqa: E402
+from app.schemas.certification import (  # noqa: E402
+    Certification,
+    CertificationSimple,
+    GraphData,
+    GraphEdge,
+    GraphNode,
+)
+from app.schemas.user import UserCertification  # noqa: E402
+
+DEFAULT_SIZES = [100, 1_000, 10_000]
+REPEAT = 5
+
+LEVELS = ["기능사", "산업기사", "기사", "기술사", None]
+CATEGORIES = ["정보통신", "전기·전자", "건설", "기계", "안전관리"]
+
+
+def synthetic_certifications(size: int, rng: random.Random) -> List[SimpleNamespace]:
+    certs = []
+    for cert_id in range(1, size + 1):
+        certs.append(SimpleNamespace(
+            id=cert_id,
+            name=f"자격증 {cert_id} \"특수\" \\ 문자",
+            code=f"C{cert_id:05d}" if cert_id % 3 else None,
+            issuer="한국산업인력공단",
+            category_main=rng.choice(CATEGORIES),
+            category_sub=f"중분류 {cert_id % 40}",
+            level=rng.choice(LEVELS),
+            level_order=rng.randint(0, 4),
+            fee_written=rng.choice([None, 19400, 22600]),
+            fee_practical=rng.choice([None, 35000, 102900]),
+            pass_rate=f"{rng.random() * 100:.1f}%",
+            description="설명\n줄바꿈\t탭",
+            eligibility=None,
+            subjects="과목1, 과목2",
+            is_active=True,
+            prerequisites=[],
+            required_for=[],
+        ))
+    for cert in certs[size // 4:]:
+        cert.prerequisites = rng.sample(certs[: size // 4], k=min(2, size // 4))
+    return certs
+
+
+def synthetic_careers(size: int, certs, rng: random.Random) -> List[SimpleNamespace]:
+    careers = []
+    for career_id in range(1, size + 1):
+        requirements = [
+            SimpleNamespace(
+                id=career_id * 10 + i,
+                career_path_id=career_id,
+                certification_id=cert.id,
+                description=f"{cert.name} 필요",
+                is_mandatory=bool(i % 2),
+            )
+            for i, cert in enumerate(rng.sample(certs, k=min(3, len(certs))))
+        ]
+        careers.append(SimpleNamespace(
+            id=career_id,
+            name=f"직업 {career_id}",
+            type=rng.choice(["job", "startup"]),
+            description=None,
+            category=rng.choice(CATEGORIES),
+            salary_range="3,000~5,000만원",
+            growth_potential="높음",
+            requirements=requirements,
+        ))
+    return careers
+
+
+def synthetic_user_certifications(certs, rng: random.Random) -> List[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=i,
+            user_id=1,
+            certification_id=cert.id,
+            certification=cert,
+            acquired_date=date(2020 + i % 5, 1 + i % 12, 1 + i % 28),
+            score=rng.choice([None, 72, 85]),
+            certificate_number=None,
+        )
+        for i, cert in enumerate(certs, start=1)
+    ]
+
+
+def synthetic_graph(certs) -> GraphData:
+    nodes = [
+        GraphNode(
+            id=str(cert.id),
+            data={"label": cert.name, "level": cert.level or "기타", "category": cert.category_main},
+            position={"x": (cert.id % 50) * 220, "y": cert.level_order * 150},
+            style={"background": "#E3F2FD", "border": "2px solid #1976D2", "width": 180},
+        )
+        for cert in certs
+    ]
+    edges = [
+        GraphEdge(id=f"e{prereq.id}-{cert.id}", source=str(prereq.id), target=str(cert.id))
+        for cert in certs
+        for prereq in cert.prerequisites
+    ]
+    return GraphData(nodes=nodes, edges=edges)
+
+
+def default_path(response_model):
+    adapter = TypeAdapter(response_model)
+
+    def encode(content) -> bytes:
+        validated = adapter.validate_python(content, from_attributes=True)
+        return encode_json(adapter.dump_python(validated, mode="json"))
+
+    return encode
+
+
+def best_of(func, content) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        func(content)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(size: int) -> None:
+    rng = random.Random(42)
+    certs = synthetic_certifications(size, rng)
+    cases = [
+        ("List[CertificationSimple]", List[CertificationSimple], certs),
+        ("List[Certification]", List[Certification], certs),
+        ("List[CareerSimple]", List[CareerSimple], synthetic_careers(size, certs, rng)),
+        ("List[Career]", List[Career], synthetic_careers(size, certs, rng)),
+        ("List[UserCertification]", List[UserCertification], synthetic_user_certifications(certs, rng)),
+        ("GraphData", GraphData, synthetic_graph(certs)),
+    ]
+
+    print(f"rows={size:,}")
+    for name, response_model, content in cases:
+        default = default_path(response_model)
+        fast = json_encoder(response_model)
+        expected = default(content)
+        if fast(content) != expected:
+            raise SystemExit(f"  {name}: 본문이 기본 경로와 다릅니다")
+
+        default_time = best_of(default, content)
+        fast_time = best_of(fast, content)
+        print(
+            f"  {name:<26} {len(expected) / 1024:>9.1f} KiB"
+            f"  default {default_time * 1000:>8.2f} ms"
+            f"  fast {fast_time * 1000:>8.2f} ms"
+            f"  x{default_time / fast_time:.1f}"
+        )
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"orjson: {'사용' if orjson is not None else '없음 (표준 json)'}")
+    for size in sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+테크트리 레이아웃 엔진 벤치마크
+
+사용법: python scripts/bench_layout.py [노드 수 ...]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.layout import assign_layer, count_crossings, layered_layout  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 50_000]
+CLUSTER_SIZE = 40  # 중분류 하나에 속한 자격증 수
+
+
+def synthetic_graph(size: int, seed: int = 42):
+    """
+    중분류 단위로 모인 합성 테크트리 생성
+    (대부분의 선수 관계는 같은 중분류 안에서, 일부는 다른 중분류와 연결)
+    """
+    rng = random.Random(seed)
+    nodes = []
+    by_level = {}
+    by_cluster = {}
+    for node_id in range(size):
+        level_order = rng.choices([4, 3, 2, 1, 0], weights=[1, 3, 3, 3, 1])[0]
+        nodes.append((node_id, level_order))
+        by_level.setdefault(level_order, []).append(node_id)
+        by_cluster.setdefault((node_id // CLUSTER_SIZE, level_order), []).append(node_id)
+
+    edges = []
+    for node_id, level_order in nodes:
+        if level_order <= 1:
+            continue
+        cluster = node_id // CLUSTER_SIZE
+        for _ in range(rng.randint(1, 3)):
+            prereq_level = max(1, level_order - rng.choice([1, 1, 1, 2]))
+            local = by_cluster.get((cluster, prereq_level))
+            if local and rng.random() < 0.85:
+                edges.append((rng.choice(local), node_id))
+            elif by_level.get(prereq_level):
+                edges.append((rng.choice(by_level[prereq_level]), node_id))
+    # 입력 순서를 섞어 초기 배치가 최적이 아니도록 함
+    rng.shuffle(nodes)
+    return nodes, list(dict.fromkeys(edges))
+
+
+def crossings_of(nodes, edges, positions):
+    """최종 좌표 기준 인접 레이어 간 교차 수 (긴 엣지는 제외)"""
+    layers = {}
+    for node_id, level_order in nodes:
+        layers.setdefault(assign_layer(level_order), []).append(node_id)
+    for layer in layers.values():
+        layer.sort(key=lambda n: positions[n][0])
+    down = {}
+    for source, target in edges:
+        upper, lower = sorted((source, target), key=lambda n: positions[n][1])
+        if positions[lower][1] - positions[upper][1] == 150:
+            down.setdefault(upper, []).append(lower)
+    ordered = [layers[k] for k in sorted(layers)]
+    return sum(
+        count_crossings(ordered[i], ordered[i + 1], down)
+        for i in range(len(ordered) - 1)
+    )
+
+
+def naive_positions(nodes):
+    """기존 방식: 레벨 안에서 입력 순서대로 나열"""
+    counts = {}
+    positions = {}
+    for node_id, level_order in nodes:
+        layer = assign_layer(level_order)
+        x_index = counts.get(layer, 0)
+        counts[layer] = x_index + 1
+        positions[node_id] = (x_index * 220, layer * 150)
+    return positions
+
+
+def main(sizes):
+    print(f"{'nodes':>8} {'edges':>8} {'time(s)':>9} {'crossings before':>17} {'after':>12}")
+    for size in sizes:
+        nodes, edges = synthetic_graph(size)
+        start = time.perf_counter()
+        positions = layered_layout(nodes, edges)
+        elapsed = time.perf_counter() - start
+
+        # 결정적인지 확인
+        assert positions == layered_layout(nodes, edges)
+
+        before = crossings_of(nodes, edges, naive_positions(nodes))
+        after = crossings_of(nodes, edges, positions)
+        print(f"{size:>8} {len(edges):>8} {elapsed:>9.3f} {before:>17} {after:>12}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
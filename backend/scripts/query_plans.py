@@ -0,0 +1,280 @@
+"""
+주요 엔드포인트 쿼리 실행 계획 회귀 검사
+
+각 엔드포인트 함수를 시드된 로컬 DB에 대해 직접 호출하면서 실제로 실행된 SQL과 파라미터를 그대로 수집하고,
+EXPLAIN (FORMAT JSON)으로 실행 계획을 확인한다.
+
+- 순차 스캔 검사: enable_seqscan=off로 계획을 다시 세워도 감시 대상 테이블에 Seq Scan이 남으면
+  사용할 수 있는 인덱스가 없다는 뜻이므로 실패 (데이터가 적은 로컬 DB에서도 동작)
+- 비용 검사: 쿼리별 총 비용이 기준 계획의 COST_TOLERANCE배(기준이 없으면 MAX_COST)를 넘으면 실패
+  (기준 비용이 0에 가까운 빈 테이블은 COST_SLACK까지 허용)
+- 계획 구조 검사: scripts/plan_baselines/<케이스>.json 에 저장한 기준 계획과 구조(노드/인덱스)가
+  다르거나 쿼리 수가 바뀌면 차이를 출력하고 실패 (의도한 변경이면 --update로 기준 계획을 갱신해 함께 커밋)
+
+기준 계획은 빈 DB에 alembic upgrade head, app.db.seed, ANALYZE를 차례로 실행한 상태에서 만든다.
+tests/test_query_plans.py가 같은 검사를 pytest로 실행한다. (DB에 연결할 수 없으면 건너뜀)
+
+사용법:
+    python scripts/query_plans.py            # 검사 (실패 시 종료 코드 1)
+    python scripts/query_plans.py --update   # 기준 계획 갱신
+    python scripts/query_plans.py list_certifications admin_users   # 일부 케이스만
+"""
+import asyncio
+import difflib
+import inspect
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.future import select  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.db.base import Base  # noqa: E402, F401  (모든 모델 등록)
+from app.db.search import SearchMode  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plan_baselines")
+
+# 순차 스캔이 있으면 안 되는 테이블 (데이터가 계속 늘어나는 테이블)
+WATCHED_TABLES = frozenset({
+    "certification",
+    "careerpath",
+    "user",
+    "user_certifications",
+    "user_goals",
+    "requirement",
+    "examschedule",
+})
+
+COST_TOLERANCE = 1.5
+# 시드 직후 비어 있는 테이블(graph_layout 등)은 기준 비용이 0이라 앱이 행을 몇 개만 써도 배율 검사에 걸림
+COST_SLACK = 10.0
+MAX_COST = 10_000.0
+
+
+@dataclass
+class Case:
+    name: str
+    call: Callable[[AsyncSession, User], Awaitable[Any]]
+    # 전체를 읽는 것이 의도인 쿼리에서 순차 스캔을 허용할 테이블
+    allow_seq_scan: FrozenSet[str] = frozenset()
+    before: Optional[Callable[[], None]] = None
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""})
+
+
+def _uncached(endpoint: Callable) -> Callable:
+    """응답 캐시/single flight 데코레이터를 건너뛴 엔드포인트 (항상 SQL을 실행하도록)"""
+    return inspect.unwrap(endpoint)
+
+
+def _cases() -> List[Case]:
+    from app.api.v1.endpoints import admin, certifications, users
+    from app.services.graph import graph_store
+
+    return [
+        Case("list_certifications", lambda db, user: _uncached(certifications.list_certifications)(
+            response=Response(), skip=0, limit=100, cursor=None, category=None, level=None,
+            search=None, mode=SearchMode.fulltext, fields=None, db=db,
+        )),
+        Case("list_certifications_category", lambda db, user: _uncached(certifications.list_certifications)(
+            response=Response(), skip=0, limit=100, cursor=None, category="IT", level=None,
+            search=None, mode=SearchMode.fulltext, fields=None, db=db,
+        )),
+        Case("list_certifications_search", lambda db, user: _uncached(certifications.list_certifications)(
+            response=Response(), skip=0, limit=100, cursor=None, category=None, level=None,
+            search="정보처리", mode=SearchMode.fulltext, fields=None, db=db,
+        )),
+        Case(
+            "get_certification_graph",
+            lambda db, user: _uncached(certifications.get_certification_graph)(
+                request=_request(), category=None, db=db,
+            ),
+            # 스냅샷은 활성 자격증과 선수 관계 전체를 한 번에 읽는다
+            allow_seq_scan=frozenset({"certification", "certification_prerequisites", "graph_layout"}),
+            before=graph_store.invalidate,
+        ),
+        Case("get_categories", lambda db, user: _uncached(certifications.get_categories)(db=db)),
+        Case("get_my_goals", lambda db, user: users.get_my_goals(db=db, current_user=user)),
+        Case("admin_users", lambda db, user: admin.list_users(
+            page=1, limit=15, cursor=None, search=None, db=db, current_user=user,
+        )),
+        Case("admin_users_search", lambda db, user: admin.list_users(
+            page=1, limit=15, cursor=None, search="admin", db=db, current_user=user,
+        )),
+        Case("admin_certifications", lambda db, user: admin.list_certifications_admin(
+            page=1, limit=10, cursor=None, search=None, mode=SearchMode.fulltext,
+            db=db, current_user=user,
+        )),
+        Case("admin_careers", lambda db, user: admin.list_careers_admin(
+            page=1, limit=10, cursor=None, search=None, mode=SearchMode.fulltext,
+            db=db, current_user=user,
+        )),
+    ]
+
+
+def _walk(node: Dict[str, Any], depth: int = 0):
+    yield depth, node
+    for child in node.get("Plans", ()):
+        yield from _walk(child, depth + 1)
+
+
+def plan_outline(plan: Dict[str, Any]) -> List[str]:
+    """비교용 계획 구조 (비용/행 수 제외)"""
+    lines = []
+    for depth, node in _walk(plan):
+        line = node["Node Type"]
+        if "Index Name" in node:
+            line += f" using {node['Index Name']}"
+        if "Relation Name" in node:
+            line += f" on {node['Relation Name']}"
+        lines.append("  " * depth + line)
+    return lines
+
+
+def seq_scans(plan: Dict[str, Any]) -> List[str]:
+    return [
+        node["Relation Name"]
+        for _, node in _walk(plan)
+        if node["Node Type"] == "Seq Scan" and "Relation Name" in node
+    ]
+
+
+async def explain(conn, statement: str, parameters, enable_seqscan: bool) -> Dict[str, Any]:
+    await conn.exec_driver_sql(f"SET LOCAL enable_seqscan = {'on' if enable_seqscan else 'off'}")
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+async def capture(engine, case: Case, user: User) -> List[Tuple[str, Any]]:
+    """엔드포인트 실행 중 나간 SELECT 문과 파라미터 (실행 후 롤백)"""
+    captured: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append((statement, parameters))
+
+    if case.before:
+        case.before()
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await case.call(session, user)
+            await session.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+
+@dataclass
+class Report:
+    failures: List[str] = field(default_factory=list)
+    changes: List[str] = field(default_factory=list)
+
+
+async def check_case(engine, case: Case, user: User, update: bool, report: Report) -> None:
+    statements = await capture(engine, case, user)
+    results = []
+    async with engine.connect() as conn:
+        for index, (statement, parameters) in enumerate(statements):
+            async with conn.begin():
+                plan = await explain(conn, statement, parameters, enable_seqscan=True)
+            async with conn.begin():
+                forced = await explain(conn, statement, parameters, enable_seqscan=False)
+            results.append({
+                "sql": statement,
+                "cost": plan["Total Cost"],
+                "outline": plan_outline(plan),
+            })
+
+            label = f"{case.name}[{index}]"
+            for table in seq_scans(forced):
+                if table in WATCHED_TABLES and table not in case.allow_seq_scan:
+                    report.failures.append(f"{label}: no usable index, Seq Scan on {table}")
+
+    path = os.path.join(BASELINE_DIR, f"{case.name}.json")
+    baseline = None
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    for index, result in enumerate(results):
+        label = f"{case.name}[{index}]"
+        previous = baseline[index] if baseline and index < len(baseline) else None
+        budget = (
+            max(previous["cost"] * COST_TOLERANCE, previous["cost"] + COST_SLACK)
+            if previous else MAX_COST
+        )
+        if result["cost"] > budget:
+            report.failures.append(f"{label}: cost {result['cost']:.1f} exceeds budget {budget:.1f}")
+        if previous and previous["outline"] != result["outline"]:
+            diff = difflib.unified_diff(
+                previous["outline"], result["outline"], "baseline", "current", lineterm=""
+            )
+            report.changes.append(f"{label}: plan changed\n" + "\n".join(diff))
+            if not update:
+                report.failures.append(f"{label}: plan differs from baseline")
+    if baseline is None:
+        if not update:
+            report.failures.append(f"{case.name}: no baseline (run with --update)")
+    elif len(baseline) != len(results):
+        report.changes.append(
+            f"{case.name}: {len(baseline)} queries in baseline, {len(results)} now"
+        )
+        if not update:
+            report.failures.append(f"{case.name}: query count differs from baseline")
+
+    if update:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+
+async def main(args: List[str]) -> int:
+    update = "--update" in args
+    selected = [arg for arg in args if not arg.startswith("--")]
+    cases = [case for case in _cases() if not selected or case.name in selected]
+
+    engine = create_async_engine(settings.SQLALCHEMY_DATABASE_URI)
+    try:
+        async with AsyncSession(engine) as session:
+            result = await session.execute(
+                select(User).where(User.is_superuser == True).order_by(User.id).limit(1)
+            )
+            user = result.scalar_one_or_none()
+        if user is None:
+            print("seeded superuser not found (run app.db.seed first)")
+            return 2
+
+        report = Report()
+        for case in cases:
+            await check_case(engine, case, user, update, report)
+    finally:
+        await engine.dispose()
+
+    for change in report.changes:
+        print(change)
+    for failure in report.failures:
+        print(f"FAIL {failure}")
+    print(f"{len(cases)} cases, {len(report.failures)} failures, {len(report.changes)} plan changes")
+    if update:
+        print(f"baselines written to {BASELINE_DIR}")
+    return 1 if report.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,141 @@
+"""
+HTTP 캐시 미들웨어 (app.core.http_cache)
+
+api_router처럼 include_router로 중첩한 라우터에서도 Cache-Control/ETag/Last-Modified가 붙고,
+If-None-Match가 일치하면 엔드포인트를 실행하지 않고 304로 응답하는지 확인한다.
+변경 스탬프는 고정값으로 바꿔 DB 없이 실행한다.
+"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import http_cache
+from app.core.cache import current_validator
+from app.core.http_cache import HTTPCacheMiddleware, cache_control
+from app.db.stamps import Stamp
+
+CHANGED_AT = datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+calls = []
+
+
+def build_app() -> FastAPI:
+    items = APIRouter()
+
+    @items.get("/")
+    @cache_control(60, 30, tables=["certification"])
+    async def list_items():
+        calls.append(current_validator.get())
+        return [{"id": 1}]
+
+    @items.get("/{item_id}")
+    @cache_control(60, tables=["certification", "careerpath"])
+    async def get_item(item_id: int):
+        calls.append(current_validator.get())
+        return {"id": item_id}
+
+    @items.get("/plain/text")
+    async def plain():
+        return {}
+
+    users = APIRouter()
+
+    @users.get("/me")
+    async def me():
+        return {"id": 1}
+
+    api_router = APIRouter()
+    api_router.include_router(items, prefix="/items")
+    api_router.include_router(users, prefix="/users")
+
+    app = FastAPI()
+    app.include_router(api_router, prefix="/api/v1")
+    app.add_middleware(HTTPCacheMiddleware)
+    return app
+
+
+@pytest.fixture
+def client(monkeypatch):
+    stamps = {
+        "certification": Stamp(version=3, changed_at=CHANGED_AT),
+        "careerpath": Stamp(version=1, changed_at=None),
+    }
+
+    async def current_stamps():
+        return stamps
+
+    monkeypatch.setattr(http_cache, "current_stamps", current_stamps)
+    calls.clear()
+    with TestClient(build_app()) as client:
+        client.stamps = stamps
+        yield client
+
+
+def test_validators_on_nested_routes(client):
+    response = client.get("/api/v1/items/")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=60, stale-while-revalidate=30"
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    assert response.headers["last-modified"] == "Fri, 01 Mar 2024 12:00:00 GMT"
+    # 엔드포인트 안에서도 같은 검증자를 본다 (응답 캐시 항목과 비교용)
+    assert calls == [etag]
+
+    detail = client.get("/api/v1/items/12")
+    assert detail.headers["cache-control"] == "public, max-age=60"
+    assert detail.headers["etag"] != etag
+
+
+def test_if_none_match_returns_304_without_running_endpoint(client):
+    etag = client.get("/api/v1/items/").headers["etag"]
+
+    response = client.get("/api/v1/items/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"].startswith("public")
+    assert len(calls) == 1
+
+    # 강한 비교 형식/여러 태그도 약한 비교로 일치
+    strong = etag.removeprefix("W/")
+    assert client.get("/api/v1/items/", headers={"If-None-Match": f'"x", {strong}'}).status_code == 304
+
+
+def test_changed_stamp_invalidates_etag(client):
+    etag = client.get("/api/v1/items/").headers["etag"]
+    client.stamps["certification"] = Stamp(version=4, changed_at=CHANGED_AT)
+
+    response = client.get("/api/v1/items/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_if_modified_since(client):
+    headers = {"If-Modified-Since": "Fri, 01 Mar 2024 12:00:00 GMT"}
+    assert client.get("/api/v1/items/", headers=headers).status_code == 304
+    headers = {"If-Modified-Since": "Fri, 01 Mar 2024 11:59:59 GMT"}
+    assert client.get("/api/v1/items/", headers=headers).status_code == 200
+
+
+def test_routes_without_policy_and_private_routes(client):
+    plain = client.get("/api/v1/items/plain/text")
+    assert "cache-control" not in plain.headers
+    assert "etag" not in plain.headers
+
+    me = client.get("/api/v1/users/me")
+    assert me.headers["cache-control"] == "private, no-cache"
+    assert me.headers["vary"] == "Authorization"
+    assert "etag" not in me.headers
+
+
+def test_direct_call_outside_request_runs_endpoint():
+    """예열처럼 요청 밖에서 직접 호출하면 정책 계산 없이 실행"""
+    @cache_control(60, tables=["certification"])
+    async def endpoint():
+        return "ok"
+
+    assert endpoint.cache_policy.tables == ("certification",)
+    assert asyncio.run(endpoint()) == "ok"
@@ -0,0 +1,36 @@
+"""
+주요 엔드포인트 실행 계획 회귀 검사 (scripts/query_plans.py)
+
+시드된 PostgreSQL(alembic upgrade head -> app.db.seed -> ANALYZE)에 연결할 수 없으면 건너뛴다.
+기준 계획은 scripts/plan_baselines/에 있으며, 의도한 변경이면 스크립트의 --update로 갱신한다.
+"""
+import asyncio
+import importlib.util
+import os
+
+import pytest
+
+pytestmark = pytest.mark.postgres
+
+SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts", "query_plans.py"
+)
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("query_plans", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_plans_match_baselines(capsys):
+    query_plans = _load_script()
+    try:
+        code = asyncio.run(query_plans.main([]))
+    except OSError as exc:
+        pytest.skip(f"PostgreSQL에 연결할 수 없음: {exc}")
+    output = capsys.readouterr().out
+    if code == 2:
+        pytest.skip(output.strip())
+    assert code == 0, output
@@ -0,0 +1,167 @@
+"""
+비용 가중 로드맵 (app.services.roadmap)
+
+손으로 만든 작은 GraphSnapshot 위에서 다익스트라 탐색과 여러 목표 병합을 확인한다.
+
+    1(기대 2만) ─┐
+                 ├─(둘 중 하나)─> 3(4만) ─> 4(10만)
+    2(기대 3만) ─┘                      └─> 5(2만)
+    6 <-> 7 (순환, 출발점 없음) ─> 8
+"""
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import pytest
+
+from app.services.graph import CertNode, GraphSnapshot
+from app.services.roadmap import (
+    DEFAULT_PASS_RATE,
+    RoadmapIndex,
+    expected_attempts,
+    expected_cost,
+    get_roadmap_index,
+    parse_pass_rate,
+    plan_targets,
+)
+from app.services.topo import DynamicTopologicalOrder
+
+
+def node(
+    cert_id: int,
+    fee_written: Optional[int],
+    fee_practical: Optional[int],
+    pass_rate: Optional[str],
+) -> CertNode:
+    return CertNode(
+        id=cert_id,
+        name=f"자격증 {cert_id}",
+        code=None,
+        issuer=None,
+        category_main="정보통신",
+        category_sub=None,
+        level=None,
+        level_order=0,
+        fee_written=fee_written,
+        fee_practical=fee_practical,
+        pass_rate=pass_rate,
+    )
+
+
+def snapshot(version: int = 1) -> GraphSnapshot:
+    nodes = {
+        1: node(1, 10000, None, "50%"),  # 2회 x 1만
+        2: node(2, 15000, 15000, "100%"),  # 1회 x 3만
+        3: node(3, 10000, 10000, "50%"),  # 2회 x 2만
+        4: node(4, 25000, 25000, "알 수 없음"),  # 기본 합격률 50% -> 2회 x 5만
+        5: node(5, 10000, 0, "0%"),  # 0%는 정보 없음으로 취급 -> 2회 x 1만
+        6: node(6, 1000, None, None),
+        7: node(7, 1000, None, None),
+        8: node(8, 1000, None, None),
+    }
+    prerequisites: Dict[int, Tuple[int, ...]] = {
+        3: (1, 2),
+        4: (3,),
+        5: (3,),
+        6: (7,),
+        7: (6,),
+        8: (6,),
+    }
+    dependents: Dict[int, Tuple[int, ...]] = {}
+    for cert_id, prereqs in prerequisites.items():
+        for prereq_id in prereqs:
+            dependents[prereq_id] = dependents.get(prereq_id, ()) + (cert_id,)
+    return GraphSnapshot(
+        version=version,
+        built_at=datetime.utcnow(),
+        nodes=nodes,
+        prerequisites=prerequisites,
+        dependents=dependents,
+        categories={"정보통신": tuple(nodes)},
+        topo=DynamicTopologicalOrder(
+            nodes, ((p, c) for c, prereqs in prerequisites.items() for p in prereqs)
+        ),
+    )
+
+
+@pytest.fixture
+def index() -> RoadmapIndex:
+    return RoadmapIndex(snapshot())
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("45.2%", 0.452),
+    (" 7% ", 0.07),
+    ("100", 1.0),
+    ("0%", None),
+    ("0", None),
+    ("-3%", None),
+    (None, None),
+    ("", None),
+    ("   ", None),
+    ("abc", None),
+    ("45,2%", None),
+    ("%", None),
+])
+def test_parse_pass_rate(value, expected):
+    result = parse_pass_rate(value)
+    if expected is None:
+        assert result is None
+    else:
+        assert result == pytest.approx(expected)
+
+
+def test_expected_attempts_are_clamped():
+    assert expected_attempts(node(1, 0, 0, "120%")) == 1.0
+    assert expected_attempts(node(1, 0, 0, "1%")) == pytest.approx(20.0)  # MIN_PASS_RATE
+    assert expected_attempts(node(1, 0, 0, None)) == 1 / DEFAULT_PASS_RATE
+    assert expected_cost(node(1, None, None, "50%")) == 0.0
+
+
+def test_or_prerequisite_picks_cheapest(index):
+    # 1(2만)과 2(3만) 중 하나만 있으면 되므로 1을 거친다
+    assert index.cheapest_path(3, []) == (None, [1, 3], 60000.0)
+    assert index.cheapest_path(4, []) == (None, [1, 3, 4], 160000.0)
+
+
+def test_acquired_certification_is_the_start(index):
+    # 2를 이미 취득했으면 2의 비용은 0이고 경로에서 빠진다
+    assert index.cheapest_path(4, {2}) == (2, [3, 4], 140000.0)
+    assert index.cheapest_path(4, {3}) == (3, [4], 100000.0)
+    # 목표 자체를 취득한 경우
+    assert index.cheapest_path(3, {3}) == (3, [], 0.0)
+    # 목표와 무관하거나 없는 자격증은 무시
+    assert index.cheapest_path(3, {5, 8, 999}) == (None, [1, 3], 60000.0)
+
+
+def test_unreachable_target(index):
+    # 선수 관계를 거슬러 올라가도 출발점(선수 없음/취득)이 없음
+    assert index.cheapest_path(8, []) is None
+    assert plan_targets(index, [8], set(), require_all=True) is None
+    assert plan_targets(index, [8, 5], set(), require_all=True) is None
+    # 하나만 필요하면 도달 가능한 목표로
+    assert plan_targets(index, [8, 5], set(), require_all=False) == ([], [1, 3, 5], 80000.0)
+    # 순환 안의 자격증을 취득했으면 거기서 출발
+    assert index.cheapest_path(8, {7}) == (7, [6, 8], 4000.0)
+
+
+def test_require_all_counts_shared_steps_once(index):
+    starts, steps, total = plan_targets(index, [4, 5], set(), require_all=True)
+    assert starts == []
+    assert steps == [1, 3, 4, 5]
+    assert total == 20000 + 40000 + 100000 + 20000
+
+    starts, steps, total = plan_targets(index, [4, 5], {2}, require_all=True)
+    assert starts == [2]
+    assert steps == [3, 4, 5]
+    assert total == 40000 + 100000 + 20000
+
+
+def test_require_any_picks_cheapest_target(index):
+    assert plan_targets(index, [4, 5], set(), require_all=False) == ([], [1, 3, 5], 80000.0)
+    assert plan_targets(index, [4, 5], {2}, require_all=False) == ([2], [3, 5], 60000.0)
+
+
+def test_index_is_memoized_per_snapshot_version():
+    first = get_roadmap_index(snapshot(version=101))
+    assert get_roadmap_index(snapshot(version=101)) is first
+    assert get_roadmap_index(snapshot(version=102)) is not first
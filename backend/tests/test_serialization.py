@@ -0,0 +1,226 @@
+"""
+app.core.serialization 빠른 인코딩이 기본 경로와 같은 본문을 만드는지 검사
+
+기본 경로: response_model 검증(from_attributes) -> dump_python(mode="json") -> encode_json
+(FastAPI가 response_model로 응답을 만드는 방식, scripts/bench_json.py와 같음)
+fast_json/json_encoder를 쓰는 스키마마다 None 값과 float 경계값을 포함해 비교한다.
+"""
+import asyncio
+import json
+import math
+from datetime import date
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.core.payload import encode_json
+from app.core.serialization import fast_json, json_encoder
+from app.schemas.career import Career, CareerBatch, CareerSimple
+from app.schemas.certification import (
+    CategoryTree,
+    Certification,
+    CertificationBatch,
+    CertificationSimple,
+    CertificationTree,
+    GraphData,
+)
+from app.schemas.user import UserCertification
+
+
+def default_path(response_model, content) -> bytes:
+    adapter = TypeAdapter(response_model)
+    validated = adapter.validate_python(content, from_attributes=True)
+    return encode_json(adapter.dump_python(validated, mode="json"))
+
+
+def assert_same(response_model, content) -> None:
+    assert json_encoder(response_model)(content) == default_path(response_model, content)
+
+
+def certification(cert_id: int, **values) -> SimpleNamespace:
+    fields = dict(
+        id=cert_id,
+        name=f"자격증 {cert_id} \"특수\" \\ 문자\n",
+        code=f"C{cert_id:05d}",
+        issuer="한국산업인력공단",
+        category_main="정보통신",
+        category_sub="정보기술",
+        level="기사",
+        level_order=2,
+        fee_written=19400,
+        fee_practical=22600,
+        pass_rate="31.2%",
+        description="설명\t탭",
+        eligibility=None,
+        subjects="과목1, 과목2",
+        is_active=True,
+        prerequisites=[],
+        required_for=[],
+    )
+    fields.update(values)
+    return SimpleNamespace(**fields)
+
+
+def empty_certification(cert_id: int) -> SimpleNamespace:
+    """nullable 컬럼이 모두 NULL인 자격증"""
+    return certification(
+        cert_id, code=None, issuer=None, category_main=None, category_sub=None, level=None,
+        fee_written=None, fee_practical=None, pass_rate=None, description=None, subjects=None,
+    )
+
+
+def career(career_id: int, **values) -> SimpleNamespace:
+    fields = dict(
+        id=career_id,
+        name=f"직업 {career_id}",
+        type="job",
+        description=None,
+        category="IT",
+        salary_range=None,
+        growth_potential="높음",
+        requirements=[
+            SimpleNamespace(
+                id=career_id * 10, career_path_id=career_id, certification_id=1,
+                description=None, is_mandatory=True,
+            ),
+            SimpleNamespace(
+                id=career_id * 10 + 1, career_path_id=career_id, certification_id=None,
+                description="경력 3년", is_mandatory=False,
+            ),
+        ],
+    )
+    fields.update(values)
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture
+def certs():
+    first, second, third = certification(1), empty_certification(2), certification(3, level_order=0)
+    second.prerequisites = [first]
+    third.prerequisites = [first, second]
+    first.required_for = [second, third]
+    return [first, second, third]
+
+
+def test_certification_lists(certs):
+    assert_same(List[CertificationSimple], certs)
+    assert_same(List[CertificationSimple], [])
+    assert_same(List[Certification], certs)
+
+
+def test_certification_batch(certs):
+    assert_same(CertificationBatch, {"items": certs, "missing": [9, 10]})
+    assert_same(CertificationBatch, {"items": [], "missing": []})
+
+
+def test_batch_mixes_cached_items_and_rows(certs):
+    """배치 응답은 상세 캐시의 JSON 값(dict)과 새로 읽은 ORM 객체를 섞어 돌려준다"""
+    cached = json.loads(json_encoder(Certification)(certs[0]))
+    assert_same(CertificationBatch, {"items": [cached, *certs[1:]], "missing": []})
+
+
+def test_certification_tree(certs):
+    first, second, third = certs
+    tree = {
+        "root": third,
+        "ancestors": [
+            SimpleNamespace(**{**vars(first), "depth": 1}),
+            SimpleNamespace(**{**vars(second), "depth": 1}),
+        ],
+        "descendants": [],
+        "edges": [{"source": 1, "target": 3}, SimpleNamespace(source=2, target=3)],
+    }
+    assert_same(CertificationTree, tree)
+
+
+def test_career_lists():
+    careers = [career(1), career(2, type="startup", requirements=[], category=None)]
+    assert_same(List[CareerSimple], careers)
+    assert_same(List[Career], careers)
+    assert_same(CareerBatch, {"items": careers, "missing": [5]})
+
+
+def test_user_certifications(certs):
+    rows = [
+        SimpleNamespace(
+            id=1, user_id=7, certification_id=1, certification=certs[0],
+            acquired_date=date(2024, 2, 29), score=85, certificate_number="24-001",
+        ),
+        SimpleNamespace(
+            id=2, user_id=7, certification_id=2, certification=None,
+            acquired_date=None, score=None, certificate_number=None,
+        ),
+    ]
+    assert_same(List[UserCertification], rows)
+
+
+def test_graph_data():
+    graph = GraphData(
+        nodes=[
+            {"id": "1", "data": {"label": "정보처리기사", "level": "기사"}, "position": {"x": 0, "y": 150}},
+            {"id": "2", "data": {}, "position": {"x": -220, "y": 0}, "style": None},
+        ],
+        edges=[{"id": "e1-2", "source": "1", "target": "2", "animated": True}],
+    )
+    assert_same(GraphData, graph)
+    assert_same(GraphData, graph.model_dump())
+
+
+def test_category_tree():
+    tree = [{"main": "정보통신", "subs": [{"name": "정보기술", "count": 3}], "total": 3}]
+    assert_same(List[CategoryTree], tree)
+
+
+class Measurement(BaseModel):
+    value: float
+    optional: Optional[float] = None
+    values: List[float] = []
+
+
+@pytest.mark.parametrize("value", [
+    0.0, -0.0, 1, 0.1, 1e-4, 9.99e-5, 1e-5, -2.5e-7, 5e-324,
+    123.0, 9.99e15, 1e16, -1.5e300, 1.7976931348623157e308,
+])
+def test_float_values(value):
+    assert_same(Measurement, {"value": value, "optional": value, "values": [value, 1.5]})
+    assert_same(Measurement, {"value": value, "optional": None})
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_floats_fail_like_default_path(value):
+    with pytest.raises(ValueError):
+        default_path(Measurement, {"value": value})
+    with pytest.raises(ValueError):
+        json_encoder(Measurement)({"value": value})
+
+
+@pytest.mark.parametrize("response_model, content", [
+    (List[CertificationSimple], [certification(1, name=None)]),
+    (List[CertificationSimple], [certification(1, level_order=None)]),
+    (List[CertificationSimple], [{"id": 1}]),
+    (List[Certification], [certification(1, prerequisites=None)]),
+    (List[CareerSimple], [career(1, type=None)]),
+    (GraphData, {"nodes": [{"id": "1", "data": None, "position": {}}], "edges": []}),
+    (Measurement, {"value": None}),
+])
+def test_null_in_required_field_fails_like_default_path(response_model, content):
+    """null이 될 수 없는 필드의 None/누락은 기본 경로와 같이 검증 오류"""
+    with pytest.raises(ValidationError):
+        default_path(response_model, content)
+    with pytest.raises(ValidationError):
+        json_encoder(response_model)(content)
+
+
+def test_fast_json_copies_injected_headers(certs):
+    @fast_json(List[CertificationSimple])
+    async def endpoint(response: Response):
+        response.headers["X-Next-Cursor"] = "abc"
+        return certs
+
+    result = asyncio.run(endpoint(response=Response()))
+    assert result.body == default_path(List[CertificationSimple], certs)
+    assert result.headers["x-next-cursor"] == "abc"
+    assert result.headers["content-type"] == "application/json"
@@ -0,0 +1,124 @@
+"""
+동적 위상 정렬 (app.services.topo)
+"""
+import random
+
+import pytest
+
+from app.services.topo import CycleError, DynamicTopologicalOrder
+
+
+def assert_consistent(topo: DynamicTopologicalOrder) -> None:
+    """모든 엣지 u -> v에 대해 ord[u] < ord[v]이고, ord는 노드마다 서로 다름"""
+    assert sorted(topo.ord.values()) == list(range(len(topo.ord)))
+    for source, targets in topo.successors.items():
+        for target in targets:
+            if source not in topo.cyclic and target not in topo.cyclic:
+                assert topo.ord[source] < topo.ord[target], (source, target)
+
+
+def reachable(topo: DynamicTopologicalOrder, start: int, goal: int) -> bool:
+    stack, seen = [start], {start}
+    while stack:
+        node = stack.pop()
+        if node == goal:
+            return True
+        for successor in topo.successors[node] - seen:
+            seen.add(successor)
+            stack.append(successor)
+    return False
+
+
+def test_initial_order_is_kahn_with_smallest_id_first():
+    topo = DynamicTopologicalOrder([5, 1, 3, 2, 4], [(3, 1), (2, 1), (1, 4)])
+    assert topo.order() == [2, 3, 1, 4, 5]
+    assert topo.cyclic == set()
+    assert_consistent(topo)
+
+
+def test_forward_edge_keeps_order():
+    topo = DynamicTopologicalOrder([1, 2, 3], [(1, 2)])
+    before = dict(topo.ord)
+    topo.add_edge(1, 3)
+    assert topo.ord == before
+    assert 3 in topo.successors[1]
+    assert_consistent(topo)
+
+
+def test_back_edge_reorders_only_affected_nodes():
+    # 1 -> 2 -> 3, 4 -> 5 ; 5 -> 2 추가 시 4, 5가 2보다 앞으로
+    topo = DynamicTopologicalOrder([1, 2, 3, 4, 5], [(1, 2), (2, 3), (4, 5)])
+    assert topo.order() == [1, 2, 3, 4, 5]
+    topo.add_edge(5, 2)
+    order = topo.order()
+    assert order.index(5) < order.index(2)
+    assert order.index(4) < order.index(5)
+    assert order[0] == 1  # 영향 구간 밖의 노드는 그대로
+    assert_consistent(topo)
+
+
+def test_cycle_forming_edge_raises_and_leaves_order_unchanged():
+    topo = DynamicTopologicalOrder([1, 2, 3, 4], [(1, 2), (2, 3), (3, 4)])
+    ord_before = dict(topo.ord)
+    successors_before = {node: set(targets) for node, targets in topo.successors.items()}
+
+    with pytest.raises(CycleError) as excinfo:
+        topo.add_edge(4, 1)
+    assert (excinfo.value.source, excinfo.value.target) == (4, 1)
+    with pytest.raises(CycleError):
+        topo.add_edge(2, 2)
+
+    assert topo.ord == ord_before
+    assert topo.successors == successors_before
+    assert topo.creates_cycle(3, 2)
+    assert not topo.creates_cycle(1, 4)
+    assert_consistent(topo)
+
+
+def test_remove_edge_allows_previously_cyclic_edge():
+    topo = DynamicTopologicalOrder([1, 2, 3], [(1, 2), (2, 3)])
+    assert topo.creates_cycle(3, 1)
+    topo.remove_edge(2, 3)
+    assert 3 not in topo.successors[2]
+    assert 2 not in topo.predecessors[3]
+    topo.remove_edge(2, 3)  # 없는 엣지는 무시
+
+    topo.add_edge(3, 1)
+    assert topo.order().index(3) < topo.order().index(1)
+    assert_consistent(topo)
+
+
+def test_initial_order_with_existing_cycle():
+    # 2 -> 3 -> 4 -> 2 순환, 4 -> 5는 순환 뒤에 매달린 노드
+    topo = DynamicTopologicalOrder([1, 2, 3, 4, 5], [(1, 2), (2, 3), (3, 4), (4, 2), (4, 5)])
+    assert topo.cyclic == {2, 3, 4, 5}
+    assert topo.order() == [1, 2, 3, 4, 5]
+    assert sorted(topo.ord.values()) == [0, 1, 2, 3, 4]
+
+
+def test_add_node_and_unknown_edges_are_ignored():
+    topo = DynamicTopologicalOrder([1, 2], [(1, 2), (2, 99)])
+    assert 99 not in topo
+    topo.add_node(3)
+    topo.add_node(3)
+    assert topo.order() == [1, 2, 3]
+    topo.add_edge(3, 1)
+    assert topo.order() == [3, 1, 2]
+
+
+def test_random_edges_match_brute_force_cycle_check():
+    rng = random.Random(7)
+    nodes = list(range(30))
+    topo = DynamicTopologicalOrder(nodes, [])
+    for _ in range(300):
+        source, target = rng.sample(nodes, 2)
+        if rng.random() < 0.1 and topo.successors[source]:
+            topo.remove_edge(source, next(iter(topo.successors[source])))
+            continue
+        expected_cycle = reachable(topo, target, source)
+        if expected_cycle:
+            with pytest.raises(CycleError):
+                topo.add_edge(source, target)
+        else:
+            topo.add_edge(source, target)
+        assert_consistent(topo)